@@ -0,0 +1,54 @@
+"""add property filter and sync indexes
+
+Revision ID: 3c9d1e7a52f4
+Revises: a7b5b9be8f23
+Create Date: 2026-10-18 09:12:05.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d1e7a52f4'
+down_revision: Union[str, Sequence[str], None] = 'a7b5b9be8f23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Owner lookups (/properties/me) and the FK from users
+    op.create_index(op.f('ix_properties_posted_by'), 'properties', ['posted_by'], unique=False)
+    # Logstash: WHERE updated_at >= :sql_last_value ORDER BY updated_at
+    op.create_index(op.f('ix_properties_updated_at'), 'properties', ['updated_at'], unique=False)
+    # city / status / price filters
+    op.create_index('ix_properties_city_status_price', 'properties', ['city', 'status', 'price'], unique=False)
+    op.create_index(
+        'ix_properties_available_city_price',
+        'properties',
+        ['city', 'price'],
+        unique=False,
+        postgresql_where=sa.text("status = 'available'"),
+    )
+    op.create_index(
+        'ix_properties_available_price',
+        'properties',
+        ['price'],
+        unique=False,
+        postgresql_where=sa.text("status = 'available'"),
+    )
+    # The PK (property_id, amenity_id) cannot serve lookups by amenity
+    op.create_index('ix_property_amenities_amenity_id', 'property_amenities', ['amenity_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_property_amenities_amenity_id', table_name='property_amenities')
+    op.drop_index('ix_properties_available_price', table_name='properties', postgresql_where=sa.text("status = 'available'"))
+    op.drop_index('ix_properties_available_city_price', table_name='properties', postgresql_where=sa.text("status = 'available'"))
+    op.drop_index('ix_properties_city_status_price', table_name='properties')
+    op.drop_index(op.f('ix_properties_updated_at'), table_name='properties')
+    op.drop_index(op.f('ix_properties_posted_by'), table_name='properties')
@@ -0,0 +1,68 @@
+"""add property statistics tables
+
+Revision ID: 5e2a8c4d9b13
+Revises: b41f07c9e8d2
+Create Date: 2026-10-18 14:03:51.772410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2a8c4d9b13'
+down_revision: Union[str, Sequence[str], None] = 'b41f07c9e8d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('property_stats',
+    sa.Column('city', sa.String(length=100), nullable=False),
+    sa.Column('property_type', postgresql.ENUM('house', 'apartment', 'condo', 'townhouse', 'land', 'other', name='propertytype', create_type=False), nullable=False),
+    sa.Column('status', postgresql.ENUM('available', 'sold', 'rented', name='propertystatus', create_type=False), nullable=False),
+    sa.Column('listing_count', sa.Integer(), nullable=False),
+    sa.Column('price_sum', sa.Float(), nullable=False),
+    sa.Column('price_per_sqft_sum', sa.Float(), nullable=False),
+    sa.Column('area_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('city', 'property_type', 'status')
+    )
+    op.create_table('property_price_quantiles',
+    sa.Column('city', sa.String(length=100), nullable=False),
+    sa.Column('listing_count', sa.Integer(), nullable=False),
+    sa.Column('p25_price', sa.Float(), nullable=True),
+    sa.Column('median_price', sa.Float(), nullable=True),
+    sa.Column('p75_price', sa.Float(), nullable=True),
+    sa.Column('median_price_per_sqft', sa.Float(), nullable=True),
+    sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('city')
+    )
+    # Backfill the counters from existing listings; from here on the
+    # repository keeps them current. Quantiles fill on the first recompute.
+    op.execute("""
+        INSERT INTO property_stats (
+            city, property_type, status, listing_count, price_sum,
+            price_per_sqft_sum, area_count
+        )
+        SELECT
+            city,
+            property_type,
+            status,
+            count(*),
+            coalesce(sum(price), 0),
+            coalesce(sum(price / area_sqft) FILTER (WHERE area_sqft > 0), 0),
+            count(*) FILTER (WHERE area_sqft > 0)
+        FROM properties
+        GROUP BY city, property_type, status
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('property_price_quantiles')
+    op.drop_table('property_stats')
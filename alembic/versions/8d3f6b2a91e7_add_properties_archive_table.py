@@ -0,0 +1,64 @@
+"""add properties archive table
+
+Revision ID: 8d3f6b2a91e7
+Revises: 5e2a8c4d9b13
+Create Date: 2026-10-18 16:21:07.318954
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3f6b2a91e7'
+down_revision: Union[str, Sequence[str], None] = '5e2a8c4d9b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('properties_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('posted_by', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('address', sa.String(length=255), nullable=False),
+    sa.Column('city', sa.String(length=100), nullable=False),
+    sa.Column('state', sa.String(length=100), nullable=False),
+    sa.Column('zip_code', sa.String(length=20), nullable=False),
+    sa.Column('country', sa.String(length=100), nullable=False),
+    sa.Column('price', sa.Float(), nullable=False),
+    sa.Column('property_type', postgresql.ENUM('house', 'apartment', 'condo', 'townhouse', 'land', 'other', name='propertytype', create_type=False), nullable=False),
+    sa.Column('status', postgresql.ENUM('available', 'sold', 'rented', name='propertystatus', create_type=False), nullable=False),
+    sa.Column('bedrooms', sa.Integer(), nullable=True),
+    sa.Column('bathrooms', sa.Float(), nullable=True),
+    sa.Column('area_sqft', sa.Float(), nullable=True),
+    sa.Column('lot_size_sqft', sa.Float(), nullable=True),
+    sa.Column('parking_spaces', sa.Integer(), nullable=True),
+    sa.Column('heating_type', sa.String(length=50), nullable=True),
+    sa.Column('cooling_type', sa.String(length=50), nullable=True),
+    sa.Column('year_built', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('is_featured', sa.Boolean(), nullable=False),
+    sa.Column('image_urls', sa.JSON(), nullable=True),
+    sa.Column('amenities', postgresql.ARRAY(sa.String(length=100)), server_default='{}', nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['posted_by'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_properties_archive_posted_by'), 'properties_archive', ['posted_by'], unique=False)
+    # The archiver picks non-available rows; keep that lookup off a full scan
+    # once the hot tier is mostly available listings.
+    op.create_index('ix_properties_inactive_id', 'properties', ['id'], unique=False, postgresql_where=sa.text("status <> 'available'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_properties_inactive_id', table_name='properties', postgresql_where=sa.text("status <> 'available'"))
+    op.drop_index(op.f('ix_properties_archive_posted_by'), table_name='properties_archive')
+    op.drop_table('properties_archive')
@@ -0,0 +1,57 @@
+"""add property full-text search vector
+
+Revision ID: b41f07c9e8d2
+Revises: 3c9d1e7a52f4
+Create Date: 2026-10-18 11:40:27.503911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41f07c9e8d2'
+down_revision: Union[str, Sequence[str], None] = '3c9d1e7a52f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(address, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Stored generated column: rewrites the table once, then stays in sync
+    # with every INSERT/UPDATE without application code.
+    op.add_column(
+        'properties',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index('ix_properties_search_vector', 'properties', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_properties_city_trgm',
+        'properties',
+        ['city'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'city': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_properties_city_trgm', table_name='properties', postgresql_using='gin')
+    op.drop_index('ix_properties_search_vector', table_name='properties', postgresql_using='gin')
+    op.drop_column('properties', 'search_vector')
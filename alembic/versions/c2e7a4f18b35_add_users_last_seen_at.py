@@ -0,0 +1,28 @@
+"""add users last_seen_at
+
+Revision ID: c2e7a4f18b35
+Revises: 8d3f6b2a91e7
+Create Date: 2026-10-19 10:12:44.502381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2e7a4f18b35'
+down_revision: Union[str, Sequence[str], None] = '8d3f6b2a91e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('last_seen_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'last_seen_at')
@@ -1,3 +1,6 @@
+import asyncio
+import hashlib
+import logging
 import uuid
 
 from sqlalchemy.orm import Session
@@ -6,43 +9,80 @@ from app.domain.errors import (
     UserNotFoundError,
     WrongCredentials,
 )
-from app.infrastructure.data.redis_refresh_token_client import RedisTokenService
+from app.infrastructure.data.activity_buffer import activity_buffer
+from app.infrastructure.data.redis_refresh_token_client import (
+    RedisTokenService,
+    token_service,
+)
 from app.infrastructure.repositories.user_repo import UserRepository
-from app.infrastructure.security.bcrypt_hasher import verify_password
-from app.infrastructure.security.jwt import JWTHandler
+from app.infrastructure.security.bcrypt_hasher import (
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
+from app.infrastructure.security.jwt import get_jwt_handler
+from app.infrastructure.security.rate_limiter import (
+    login_email_limiter,
+    login_ip_limiter,
+)
+from app.infrastructure.security.revocation import revocation_list
+from app.infrastructure.tracing import traced_methods
 from app.presentation.schemas.user_schema import (
     Login_data,
     UserCredentials,
 )
 
+logger = logging.getLogger(__name__)
+
+# (session id, refresh token digest) -> rotation in progress in this worker
+_inflight_refreshes: dict[tuple[str, str], asyncio.Future] = {}
+
 
+@traced_methods("AuthUsecase")
 class AuthUsecase:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, tokens: RedisTokenService = token_service):
         self.userRepo = UserRepository(db)
-        self.redis_token_service = RedisTokenService()
-        self.jwt_handler = JWTHandler()
+        self.redis_token_service = tokens
+        self.jwt_handler = get_jwt_handler()
+
+    async def login(
+        self, user_cred=UserCredentials, client_ip: str | None = None
+    ) -> Login_data:
+        # Throttle before the user lookup and bcrypt, which are what a
+        # credential-stuffing burst would otherwise pay for
+        email_key = user_cred.email.strip().lower()
+        if client_ip:
+            await login_ip_limiter.hit(client_ip)
+        await login_email_limiter.hit(email_key)
 
-    async def login(self, user_cred=UserCredentials) -> Login_data:
         db_user = await self.userRepo.get_user_by_email(user_cred.email)
         if not db_user:
             raise UserNotFoundError
-        if not verify_password(user_cred.password, db_user.hashed_password):
+        if not await verify_password_async(user_cred.password, db_user.hashed_password):
             raise WrongCredentials
+        await login_email_limiter.reset(email_key)
+        # Written behind in batches rather than committed on the login path
+        activity_buffer.record_login(db_user.id)
+        if needs_rehash(db_user.hashed_password):
+            await self._upgrade_password_hash(db_user, user_cred.password)
+        session_id = str(uuid.uuid4())
+        role = db_user.role.value if db_user.role else "user"
         accesstoken = self.jwt_handler.generate_access_token(
             subject=str(db_user.id),
             extra_claims={
-                "role": str(db_user.role),
+                "role": role,
                 "user_type": str(db_user.user_type),
+                # Binds the access token to the session so logout revokes it
+                "sid": session_id,
             },
         )
         refreshtoken = self.jwt_handler.generate_refresh_token(
             subject=str(db_user.id),
             extra_claims={
-                "role": str(db_user.role),
+                "role": role,
                 "user_type": str(db_user.user_type),
             },
         )
-        session_id = str(uuid.uuid4())
         await self.redis_token_service.store(
             user_id=str(db_user.id), refresh_token=refreshtoken, session_id=session_id
         )
@@ -54,41 +94,91 @@ class AuthUsecase:
             user=db_user,
         )
 
-    async def logout(self, user_id: str, session_id: str) -> None:
+    async def _upgrade_password_hash(self, db_user, password: str) -> None:
+        """Re-hash with the configured cost; never fails the login."""
+        try:
+            new_hash = await hash_password_async(password)
+            await self.userRepo.replace_password_hash(
+                db_user.id, db_user.hashed_password, new_hash
+            )
+        except Exception:
+            logger.warning(
+                "Password rehash failed for user %s", db_user.id, exc_info=True
+            )
+
+    async def logout(
+        self,
+        user_id: str,
+        session_id: str,
+        access_jti: str | None = None,
+        access_exp: float | None = None,
+    ) -> None:
         await self.redis_token_service.revoke(user_id=user_id, session_id=session_id)
+        # Access tokens of the session, and the one used to log out even if
+        # it belongs to another session, stop working in every worker
+        await revocation_list.revoke_sessions([session_id])
+        if access_jti and access_exp:
+            await revocation_list.revoke_token(access_jti, access_exp)
         return
 
+    async def logout_all(self, user_id: str) -> int:
+        """Revoke every session of the user; returns how many there were."""
+        session_ids = await self.redis_token_service.revoke_all(user_id)
+        await revocation_list.revoke_sessions(session_ids)
+        return len(session_ids)
+
+    async def list_sessions(self, user_id: str) -> list[dict]:
+        return await self.redis_token_service.list_sessions(user_id)
+
     async def get_fresh_tokens(
         self, session_id: str, refresh_token: str
     ) -> tuple[str, str]:
+        """
+        Rotate the session's refresh token. Concurrent refreshes with the
+        same token share one rotation in this worker, and across workers
+        get the same pair back from Redis within the grace period.
+        """
+        key = (session_id, hashlib.sha256(refresh_token.encode()).hexdigest())
+        inflight = _inflight_refreshes.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._rotate(session_id, refresh_token))
+            _inflight_refreshes[key] = inflight
+            inflight.add_done_callback(lambda _: _inflight_refreshes.pop(key, None))
+        # Shield so one client disconnecting does not cancel the others' result
+        return await asyncio.shield(inflight)
+
+    async def _rotate(self, session_id: str, refresh_token: str) -> tuple[str, str]:
         payload = self.jwt_handler.decode_token(refresh_token)
-        user_id = payload.get("sub")
-        stored_refresh_token = await self.redis_token_service.get_refresh_token(
-            user_id=user_id, session_id=session_id
-        )
-        if stored_refresh_token != refresh_token:
+        if not payload or payload.get("type") != "refresh":
             raise WrongCredentials
+        user_id = payload.get("sub")
 
         new_access_token = self.jwt_handler.generate_access_token(
             subject=str(user_id),
             extra_claims={
-                "role": payload.get("roles", "user"),
+                "role": payload.get("role", "user"),
                 "user_type": payload.get("user_type", "tenant"),
+                "sid": session_id,
             },
         )
         new_refresh_token = self.jwt_handler.generate_refresh_token(
             subject=str(user_id),
             extra_claims={
-                "role": payload.get("roles", "user"),
+                "role": payload.get("role", "user"),
                 "user_type": payload.get("user_type", "tenant"),
             },
         )
 
-        # Update refresh token in Redis
-        await self.redis_token_service.store(
+        # Compare-and-swap in Redis: a stale refresh token or a revoked
+        # session is rejected; one rotated moments ago yields its new pair
+        tokens = await self.redis_token_service.rotate(
             user_id=str(user_id),
-            refresh_token=new_refresh_token,
             session_id=session_id,
+            expected_token=refresh_token,
+            new_access_token=new_access_token,
+            new_refresh_token=new_refresh_token,
         )
+        if tokens is None:
+            raise WrongCredentials
 
-        return (new_access_token, new_refresh_token)
+        return tokens
@@ -1,18 +1,39 @@
-from elasticsearch import AsyncElasticsearch
+import logging
 
+from elasticsearch import ApiError, AsyncElasticsearch, TransportError
+from sqlalchemy.orm import Session
+
+from app.config import SearchConfig
+from app.infrastructure.search.postgres_property_search_service import (
+    PostgresPropertySearchService,
+)
 from app.infrastructure.search.property_search_service import PropertySearchService
+from app.infrastructure.tracing import traced_methods
 from app.presentation.schemas.property_schema import (
     PropertySearchParams,
     PropertySearchResult,
 )
 
+logger = logging.getLogger(__name__)
 
+
+@traced_methods("PropertySearchUsecase")
 class PropertySearchUsecase:
-    """Coordinates property search via Elasticsearch."""
+    """Coordinates property search via Elasticsearch, with a Postgres fallback."""
 
-    def __init__(self, es_client: AsyncElasticsearch):
+    def __init__(self, es_client: AsyncElasticsearch, db: Session | None = None):
         self.service = PropertySearchService(es_client)
+        self.fallback = PostgresPropertySearchService(db) if db is not None else None
 
     async def search(self, params: PropertySearchParams) -> PropertySearchResult:
-        return await self.service.search(params)
-
+        if SearchConfig.BACKEND == "postgres" and self.fallback is not None:
+            return await self.fallback.search(params)
+        try:
+            return await self.service.search(params)
+        except (ApiError, TransportError):
+            if self.fallback is None or not SearchConfig.POSTGRES_FALLBACK:
+                raise
+            logger.warning(
+                "Elasticsearch search failed, serving from Postgres", exc_info=True
+            )
+            return await self.fallback.search(params)
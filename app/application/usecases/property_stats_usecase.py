@@ -0,0 +1,213 @@
+import logging
+import math
+
+import numpy as np
+from redis.exceptions import RedisError
+from sqlalchemy.orm import Session
+
+from app.config import StatsConfig
+from app.infrastructure.data.database import async_session
+from app.infrastructure.data.models.property_stats_model import ALL_CITIES
+from app.infrastructure.data.redis_registry import redis_cache
+from app.infrastructure.repositories.property_stats_repo import PropertyStatsRepository
+from app.infrastructure.tracing import traced_methods
+from app.presentation.schemas.property_schema import (
+    CityPriceStats,
+    PropertyStatsResponse,
+)
+
+STATS_CACHE_KEY = "property_stats:v1"
+
+logger = logging.getLogger(__name__)
+
+
+def _grouped_quantile(
+    sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray, q: float
+) -> np.ndarray:
+    """Linear-interpolated quantile of each contiguous, pre-sorted group."""
+    pos = starts + (counts - 1) * q
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.ceil(pos).astype(np.int64)
+    frac = pos - lo
+    return sorted_values[lo] * (1 - frac) + sorted_values[hi] * frac
+
+
+def _group_bounds(codes: np.ndarray, groups: int) -> tuple[np.ndarray, np.ndarray]:
+    counts = np.bincount(codes, minlength=groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return starts, counts
+
+
+def _or_none(value) -> float | None:
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def compute_city_quantiles(
+    cities: np.ndarray, prices: np.ndarray, areas: np.ndarray
+) -> list[dict]:
+    """
+    Price quartiles and median price per sqft per city, plus an all-cities row.
+
+    One lexsort by (city, value) puts every city's values in a contiguous,
+    sorted run, so all quantiles come out of array indexing with no
+    per-city Python loop.
+    """
+    if cities.size == 0:
+        return []
+
+    names, codes = np.unique(cities, return_inverse=True)
+    groups = len(names)
+
+    order = np.lexsort((prices, codes))
+    sorted_prices = prices[order]
+    starts, counts = _group_bounds(codes[order], groups)
+    p25, p50, p75 = (
+        _grouped_quantile(sorted_prices, starts, counts, q) for q in (0.25, 0.5, 0.75)
+    )
+
+    with_area = areas > 0  # NaN (no area) compares False
+    ppsf = prices[with_area] / areas[with_area]
+    ppsf_codes = codes[with_area]
+    ppsf_order = np.lexsort((ppsf, ppsf_codes))
+    ppsf_starts, ppsf_counts = _group_bounds(ppsf_codes[ppsf_order], groups)
+    ppsf_median = np.full(groups, np.nan)
+    present = ppsf_counts > 0
+    ppsf_median[present] = _grouped_quantile(
+        ppsf[ppsf_order], ppsf_starts[present], ppsf_counts[present], 0.5
+    )
+
+    rows = [
+        {
+            "city": str(names[i]),
+            "listing_count": int(counts[i]),
+            "p25_price": _or_none(p25[i]),
+            "median_price": _or_none(p50[i]),
+            "p75_price": _or_none(p75[i]),
+            "median_price_per_sqft": _or_none(ppsf_median[i]),
+        }
+        for i in range(groups)
+    ]
+    overall_p25, overall_p50, overall_p75 = np.quantile(prices, [0.25, 0.5, 0.75])
+    rows.append(
+        {
+            "city": ALL_CITIES,
+            "listing_count": int(prices.size),
+            "p25_price": _or_none(overall_p25),
+            "median_price": _or_none(overall_p50),
+            "p75_price": _or_none(overall_p75),
+            "median_price_per_sqft": _or_none(np.median(ppsf)) if ppsf.size else None,
+        }
+    )
+    return rows
+
+
+@traced_methods("PropertyStatsUsecase")
+class PropertyStatsUsecase:
+    def __init__(self, db: Session):
+        self.repo = PropertyStatsRepository(db)
+
+    async def get_stats(self) -> PropertyStatsResponse:
+        try:
+            cached = await redis_cache.get(STATS_CACHE_KEY)
+        except RedisError:
+            logger.warning("Stats cache read failed", exc_info=True)
+            cached = None
+        if cached:
+            return PropertyStatsResponse.model_validate_json(cached)
+
+        stats = await self._build_stats()
+        try:
+            await redis_cache.setex(
+                STATS_CACHE_KEY, StatsConfig.CACHE_TTL_SECONDS, stats.model_dump_json()
+            )
+        except RedisError:
+            logger.warning("Stats cache write failed", exc_info=True)
+        return stats
+
+    async def _build_stats(self) -> PropertyStatsResponse:
+        counters = await self.repo.get_counters()
+        quantiles = {q.city: q for q in await self.repo.get_quantiles()}
+
+        by_city: dict[str, int] = {}
+        by_type: dict[str, int] = {}
+        by_status: dict[str, int] = {}
+        # city -> [price_sum, price_per_sqft_sum, area_count]
+        sums: dict[str, list[float]] = {}
+        for row in counters:
+            by_city[row.city] = by_city.get(row.city, 0) + row.listing_count
+            by_type[row.property_type.value] = (
+                by_type.get(row.property_type.value, 0) + row.listing_count
+            )
+            by_status[row.status.value] = (
+                by_status.get(row.status.value, 0) + row.listing_count
+            )
+            city_sums = sums.setdefault(row.city, [0.0, 0.0, 0])
+            city_sums[0] += row.price_sum
+            city_sums[1] += row.price_per_sqft_sum
+            city_sums[2] += row.area_count
+
+        cities = []
+        for city in sorted(by_city, key=by_city.get, reverse=True):
+            price_sum, ppsf_sum, area_count = sums[city]
+            q = quantiles.get(city)
+            cities.append(
+                CityPriceStats(
+                    city=city,
+                    listing_count=by_city[city],
+                    avg_price=price_sum / by_city[city] if by_city[city] else None,
+                    avg_price_per_sqft=ppsf_sum / area_count if area_count else None,
+                    p25_price=q.p25_price if q else None,
+                    median_price=q.median_price if q else None,
+                    p75_price=q.p75_price if q else None,
+                    median_price_per_sqft=q.median_price_per_sqft if q else None,
+                )
+            )
+
+        total_ppsf = sum(s[1] for s in sums.values())
+        total_area_count = sum(s[2] for s in sums.values())
+        overall = quantiles.get(ALL_CITIES)
+        return PropertyStatsResponse(
+            total=sum(by_city.values()),
+            by_city=by_city,
+            by_type=by_type,
+            by_status=by_status,
+            avg_price_per_sqft=(
+                total_ppsf / total_area_count if total_area_count else None
+            ),
+            median_price_per_sqft=overall.median_price_per_sqft if overall else None,
+            cities=cities,
+            quantiles_computed_at=overall.computed_at if overall else None,
+        )
+
+    async def recompute_quantiles(self) -> int:
+        """Rebuild property_price_quantiles from a batched column scan."""
+        if not await self.repo.try_lock_quantiles():
+            # Another worker is already on it
+            await self.repo.db.rollback()
+            return 0
+
+        cities, prices, areas = [], [], []
+        async for batch in self.repo.scan_price_columns(StatsConfig.SCAN_BATCH_SIZE):
+            batch_cities, batch_prices, batch_areas = zip(*batch)
+            cities.append(np.array(batch_cities, dtype=object))
+            prices.append(np.array(batch_prices, dtype=np.float64))
+            # None (no area) becomes NaN
+            areas.append(np.array(batch_areas, dtype=np.float64))
+
+        if cities:
+            rows = compute_city_quantiles(
+                np.concatenate(cities), np.concatenate(prices), np.concatenate(areas)
+            )
+        else:
+            rows = []
+        await self.repo.replace_quantiles(rows)
+        await self.repo.db.commit()
+        return len(rows)
+
+
+async def refresh_property_quantiles() -> None:
+    """Periodic job entry point; runs with its own session."""
+    async with async_session() as db:
+        count = await PropertyStatsUsecase(db).recompute_quantiles()
+    logger.info("Recomputed price quantiles for %d cities", count)
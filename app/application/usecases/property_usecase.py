@@ -1,15 +1,26 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Sequence
+
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
-from app.infrastructure.data.models.property_model import Property
+from app.config import ArchiveConfig
+from app.infrastructure.data.database import async_session
+from app.infrastructure.data.property_cache import property_cache
 from app.infrastructure.repositories.property_repo import PropertyRepository
-from app.presentation.schemas.property_schema import PropertyBase
+from app.infrastructure.tracing import traced_methods
+from app.presentation.schemas.property_schema import PropertyBase, PropertyResponse
+
+logger = logging.getLogger(__name__)
 
 
+@traced_methods("PropertyUsecase")
 class PropertyUsecase:
     def __init__(self, db: Session):
         self.repo = PropertyRepository(db)
 
-    async def add_property(self, property: PropertyBase) -> Property:
+    async def add_property(self, property: PropertyBase) -> Row:
         property.amenities = (
             [amenity.lower() for amenity in property.amenities]
             if len(property.amenities) != 0
@@ -21,16 +32,60 @@ class PropertyUsecase:
         except Exception as e:
             raise e
 
-    async def get_properties_by_user(self, user_id: int) -> list[Property]:
+    async def get_properties_by_user(
+        self, user_id: int, include_archived: bool = False
+    ) -> Sequence[Row]:
         try:
-            res = await self.repo.get_properties_by_user(user_id)
+            res = await self.repo.get_property_rows_by_user(user_id, include_archived)
             return res
         except Exception as e:
             raise e
 
-    async def get_all_properties(self) -> list[Property]:
+    async def get_property_json(self, property_id: int) -> str | None:
+        """PropertyResponse JSON for one listing, served read-through cached."""
+
+        async def load() -> str | None:
+            # The fill is shared by concurrent requests and may outlive this
+            # one, so it reads on its own session, not the request's
+            async with async_session() as db:
+                row = await PropertyRepository(db).get_property_row(property_id)
+            if row is None:
+                return None
+            return PropertyResponse.model_validate(row).model_dump_json()
+
+        return await property_cache.get(property_id, load)
+
+    async def get_properties_fingerprint(
+        self, user_id: int, include_archived: bool = False
+    ) -> tuple:
+        res = await self.repo.get_owner_fingerprint(user_id, include_archived)
+        return tuple(res)
+
+    async def get_all_properties(self) -> Sequence[Row]:
         try:
-            res = await self.repo.get_all_properties()
+            res = await self.repo.get_all_property_rows()
             return res
         except Exception as e:
             raise e
+
+    async def archive_inactive(self) -> int:
+        """Move sold/rented listings past the grace period to the archive."""
+        older_than = datetime.now(timezone.utc) - timedelta(
+            days=ArchiveConfig.MIN_AGE_DAYS
+        )
+        total = 0
+        while True:
+            moved = await self.repo.archive_inactive(
+                older_than, ArchiveConfig.BATCH_SIZE
+            )
+            total += len(moved)
+            if len(moved) < ArchiveConfig.BATCH_SIZE:
+                return total
+
+
+async def archive_inactive_properties() -> None:
+    """Periodic job entry point; runs with its own session."""
+    async with async_session() as db:
+        count = await PropertyUsecase(db).archive_inactive()
+    if count:
+        logger.info("Archived %d sold/rented listings", count)
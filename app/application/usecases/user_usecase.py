@@ -1,36 +1,45 @@
-from typing import List, Optional
+import time
+from typing import List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
-from app.domain.errors import (
-    EmailAlreadyExistsError,
-    UsernameAlreadyExistsError,
-    UserNotFoundError,
-)
+from app.config import ActivityConfig, UserListConfig
+from app.domain.errors import UserNotFoundError
+from app.infrastructure.data.activity_buffer import activity_buffer
+from app.infrastructure.data.database import async_session
 from app.infrastructure.data.models.user_model import User
+from app.infrastructure.data.invalidation_bus import (
+    invalidation_bus,
+    session_tag,
+    user_properties_tag,
+    user_tag,
+)
+from app.infrastructure.data.property_cache import property_cache
+from app.infrastructure.data.redis_refresh_token_client import token_service
+from app.infrastructure.repositories.property_repo import PropertyRepository
+from app.infrastructure.repositories.property_stats_repo import PropertyStatsRepository
 from app.infrastructure.repositories.user_repo import UserRepository
-from app.infrastructure.security.bcrypt_hasher import hash_password
-from app.infrastructure.security.jwt import JWTHandler
+from app.infrastructure.security.bcrypt_hasher import hash_password_async
+from app.infrastructure.security.jwt import get_jwt_handler
+from app.infrastructure.security.revocation import revocation_list
+from app.infrastructure.tracing import traced_methods
 from app.presentation.schemas.user_schema import (
+    TotalMode,
     UserCreate,
     UserUpdate,
 )
 
 
+@traced_methods("UserUsecase")
 class UserUsecase:
     def __init__(self, db: Session):
         self.repo = UserRepository(db)
-        self.jwt_handler = JWTHandler()
+        self.jwt_handler = get_jwt_handler()
 
-    # Create
+    # Create; the unique indexes reject duplicate emails/usernames, which the
+    # repository raises as EmailAlreadyExistsError/UsernameAlreadyExistsError
     async def create_user(self, user_create: UserCreate) -> User:
-        if await self.repo.get_user_by_email(user_create.email):
-            raise EmailAlreadyExistsError
-
-        if await self.repo.get_user_by_username(user_create.username):
-            raise UsernameAlreadyExistsError
-
-        hashed_password = hash_password(user_create.password)
+        hashed_password = await hash_password_async(user_create.password)
         try:
             return await self.repo.create_user(user_create, hashed_password)
         except Exception as e:
@@ -44,28 +53,47 @@ class UserUsecase:
     async def list_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         return await self.repo.list_users(skip, limit)
 
+    # List a keyset page; returns the users and the cursor of the next page
+    async def list_users_page(
+        self, after: Optional[int] = None, limit: int = 100
+    ) -> Tuple[List[User], Optional[int]]:
+        # One extra row tells whether another page exists
+        users = await self.repo.list_users_after(after, limit + 1)
+        if len(users) > limit:
+            users = users[:limit]
+            return users, users[-1].id
+        return users, None
+
+    # Total user count; returns (total, is_estimate)
+    async def count_users(self, mode: TotalMode = "auto") -> Tuple[int, bool]:
+        if mode == "exact":
+            return await self.repo.count_users(), False
+
+        estimate = await self.repo.estimate_user_count()
+        if estimate is None:
+            return await self.repo.count_users(), False
+        if mode == "auto" and estimate < UserListConfig.EXACT_COUNT_THRESHOLD:
+            return await self.repo.count_users(), False
+        return estimate, True
+
     # Update
     async def update_user_by_id(self, id: int, user_update: UserUpdate) -> User:
-        db_user = await self.get_user(id)
+        values = user_update.model_dump(exclude_unset=True)
+        if values.get("password"):
+            values["hashed_password"] = await hash_password_async(values["password"])
+        values.pop("password", None)
+
+        db_user = await self.repo.update_user(id, values)
         if not db_user:
             raise UserNotFoundError
-
-        if user_update.email and user_update.email != db_user.email:
-            if await self.repo.get_user_by_email(user_update.email):
-                raise EmailAlreadyExistsError
-
-        if user_update.username and user_update.username != db_user.username:
-            if await self.repo.get_user_by_username(user_update.username):
-                raise UsernameAlreadyExistsError
-
-        if user_update.password:
-            user_update.password = hash_password(user_update.password)
-
-        for field, value in user_update.model_dump(exclude_unset=True).items():
-            setattr(db_user, field, value)
-
-        await self.repo.db.commit()
-        await self.repo.db.refresh(db_user)
+        tags = [user_tag(id)]
+        if "role" in values:
+            # The role travels in the tokens and refreshes copy it forward,
+            # so end every session; the user logs in again with the new role
+            session_ids = await token_service.revoke_all(str(id))
+            await revocation_list.revoke_sessions(session_ids)
+            tags += [session_tag(sid) for sid in session_ids]
+        await invalidation_bus.publish(tags)
         return db_user
 
     # Delete
@@ -73,6 +101,45 @@ class UserUsecase:
         db_user = await self.repo.get_user_by_id(user_id)
         if not db_user:
             raise UserNotFoundError
+        # Listings go with the user; evict their cached detail pages after
+        property_ids = await PropertyRepository(self.repo.db).get_property_ids_by_user(
+            user_id
+        )
+        # Same transaction: the counters drop exactly when the listings do
+        await PropertyStatsRepository(self.repo.db).remove_owner(user_id)
         await self.repo.delete_user(db_user)
         await self.repo.db.commit()
+        session_ids = await token_service.revoke_all(str(user_id))
+        await revocation_list.revoke_sessions(session_ids)
+        await property_cache.invalidate(
+            property_ids,
+            [
+                user_tag(user_id),
+                user_properties_tag(user_id),
+                *(session_tag(sid) for sid in session_ids),
+            ],
+        )
+        return
+
+
+async def flush_user_activity() -> None:
+    """Periodic job entry point: write buffered logins and activity."""
+    rows, lag = activity_buffer.drain()
+    if not rows:
         return
+    # Workers share user ids; locking rows in one global order means two
+    # concurrent flushes wait on each other instead of deadlocking
+    rows.sort(key=lambda row: row[0])
+    total = len(rows)
+    start = time.perf_counter()
+    try:
+        async with async_session() as db:
+            repo = UserRepository(db)
+            while rows:
+                await repo.record_activity(rows[: ActivityConfig.BATCH_SIZE])
+                # Committed batches are not put back if a later one fails
+                del rows[: ActivityConfig.BATCH_SIZE]
+    except BaseException:
+        activity_buffer.restore(rows, lag)
+        raise
+    activity_buffer.flushed(total, time.perf_counter() - start, lag)
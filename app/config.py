@@ -35,6 +35,74 @@ class JWTConfig:
     ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_EXPIRE_MINUTES", 15))
     REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("JWT_REFRESH_EXPIRE_DAYS", 7))
+    # A refresh token that was just rotated still yields the pair it was
+    # rotated to for this long, so concurrent refreshes from several tabs
+    # agree instead of all but one failing. 0 disables.
+    REFRESH_GRACE_SECONDS = int(os.getenv("JWT_REFRESH_GRACE_SECONDS", 10))
+
+
+class TokenCacheConfig:
+    """In-process cache of verified access tokens."""
+
+    MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", 50_000))
+    # Entries live until the token's exp, capped here. Revocations evict
+    # through the cache bus; the cap bounds the lag if a message is lost.
+    MAX_TTL_SECONDS = float(os.getenv("TOKEN_CACHE_MAX_TTL_SECONDS", 300))
+
+
+class RevocationConfig:
+    """Revoked access tokens and the per-worker Bloom filter mirroring them."""
+
+    # Sorted set of revoked entry -> expiry, and the stream workers tail
+    KEY = os.getenv("REVOCATION_KEY", "revoked:access")
+    STREAM = os.getenv("REVOCATION_STREAM", "revoked:access:log")
+    STREAM_MAXLEN = int(os.getenv("REVOCATION_STREAM_MAXLEN", 100_000))
+    # ~180 KB per worker at the defaults
+    BLOOM_CAPACITY = int(os.getenv("REVOCATION_BLOOM_CAPACITY", 100_000))
+    BLOOM_ERROR_RATE = float(os.getenv("REVOCATION_BLOOM_ERROR_RATE", 0.001))
+    # Bloom filters cannot forget; rebuild so expired revocations age out
+    REBUILD_SECONDS = int(os.getenv("REVOCATION_REBUILD_SECONDS", 900))
+    SYNC_BLOCK_MS = int(os.getenv("REVOCATION_SYNC_BLOCK_MS", 1000))
+    RECONNECT_MIN_SECONDS = float(os.getenv("REVOCATION_RECONNECT_MIN_SECONDS", 0.5))
+    RECONNECT_MAX_SECONDS = float(os.getenv("REVOCATION_RECONNECT_MAX_SECONDS", 10))
+
+
+class TracingConfig:
+    """Per-request tracing spans and where finished traces go."""
+
+    ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+    # Fraction of requests traced
+    SAMPLE_RATE = float(os.getenv("TRACING_SAMPLE_RATE", 1.0))
+    # Recent traces kept in memory for GET /api/admin/traces
+    RING_BUFFER_SIZE = int(os.getenv("TRACING_RING_BUFFER_SIZE", 500))
+    # Also append every trace to this JSON-lines file; unset to disable
+    JSONL_PATH = os.getenv("TRACING_JSONL_PATH")
+    # Spans kept per trace; a bulk job issuing thousands of queries is cut off
+    MAX_SPANS = int(os.getenv("TRACING_MAX_SPANS", 500))
+
+
+class ProfilingConfig:
+    """On-demand sampling profiler for live requests."""
+
+    # Off removes the middleware entirely
+    ENABLED = os.getenv("PROFILING_ENABLED", "true").lower() == "true"
+    # Fraction of requests profiled without being asked; admins can always
+    # ask with an X-Profile header
+    SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", 0.0))
+    INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", 5))
+    # Sampling stops after this long, e.g. for streamed responses
+    MAX_SECONDS = float(os.getenv("PROFILING_MAX_SECONDS", 30))
+    # Profiles kept in memory for GET /api/admin/profiles
+    STORE_SIZE = int(os.getenv("PROFILING_STORE_SIZE", 100))
+
+
+class QueryCountConfig:
+    """Per-request SQL statement counting."""
+
+    # Report X-SQL-Queries and X-SQL-Time-Ms on every response; debug only
+    DEBUG_HEADERS = os.getenv("SQL_DEBUG_HEADERS", "false").lower() == "true"
+    # One statement run this many times in a request is logged as a likely N+1
+    N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", 5))
 
 
 class RedisConfig:
@@ -44,6 +112,15 @@ class RedisConfig:
     REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
     REDIS_DB_TOKENS = int(os.getenv("REDIS_DB_REFRESH_TOKENS", 0))
     REDIS_DB_CACHE = int(os.getenv("REDIS_DB_LRU_CACHE", 1))
+    # Per pool (one per database). The invalidation bus holds one cache
+    # connection for its subscription.
+    MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+    # Seconds a command waits for a free connection before failing
+    POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", 2))
+    # Connections idle longer than this are PINGed before reuse
+    HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30))
+    SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 5))
+    SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", 2))
 
     @classmethod
     def get_tokens_url(cls) -> str:
@@ -70,3 +147,118 @@ class ElasticsearchConfig:
     @classmethod
     def get_url(cls) -> str:
         return f"{cls.SCHEME}://{cls.HOST}:{cls.PORT}"
+
+
+class SearchConfig:
+    """Search backend selection."""
+
+    # "elasticsearch" (default) or "postgres" to bypass ES entirely,
+    # e.g. while the Logstash indexer is catching up.
+    BACKEND = os.getenv("SEARCH_BACKEND", "elasticsearch").lower()
+    # Serve from Postgres full-text search when Elasticsearch errors out
+    POSTGRES_FALLBACK = os.getenv("SEARCH_POSTGRES_FALLBACK", "true").lower() == "true"
+
+
+class StatsConfig:
+    """Listing statistics configuration."""
+
+    # How long /properties/stats responses are cached in Redis
+    CACHE_TTL_SECONDS = int(os.getenv("STATS_CACHE_TTL_SECONDS", 60))
+    # Interval of the NumPy quantile recompute
+    QUANTILE_REFRESH_SECONDS = int(os.getenv("STATS_QUANTILE_REFRESH_SECONDS", 300))
+    SCAN_BATCH_SIZE = int(os.getenv("STATS_SCAN_BATCH_SIZE", 50_000))
+
+
+class ArchiveConfig:
+    """Hot/cold tiering of sold and rented listings."""
+
+    INTERVAL_SECONDS = int(os.getenv("ARCHIVE_INTERVAL_SECONDS", 600))
+    BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", 1000))
+    # Leave recently sold/rented listings in the hot tier for a while
+    MIN_AGE_DAYS = int(os.getenv("ARCHIVE_MIN_AGE_DAYS", 7))
+
+
+class ActivityConfig:
+    """Write-behind of users.last_login and users.last_seen_at."""
+
+    # Activity is buffered in each worker's memory and flushed this often. A
+    # crash loses at most this much activity (more only if flushes were
+    # already failing); a clean shutdown flushes what is left.
+    FLUSH_INTERVAL_SECONDS = float(os.getenv("ACTIVITY_FLUSH_INTERVAL_SECONDS", 10))
+    # Users per UPDATE ... FROM (VALUES ...) statement
+    BATCH_SIZE = int(os.getenv("ACTIVITY_BATCH_SIZE", 1000))
+    # Distinct users held per worker; activity of further users is dropped
+    # (and counted) until the next successful flush.
+    MAX_PENDING = int(os.getenv("ACTIVITY_MAX_PENDING", 100_000))
+
+
+class UserListConfig:
+    """User listing configuration."""
+
+    # Below this many rows (by the planner estimate) an exact count is cheap
+    EXACT_COUNT_THRESHOLD = int(os.getenv("USERS_EXACT_COUNT_THRESHOLD", 100_000))
+
+
+class HttpCacheConfig:
+    """Cache-Control lifetimes for public read endpoints."""
+
+    SEARCH_MAX_AGE_SECONDS = int(os.getenv("HTTP_SEARCH_MAX_AGE_SECONDS", 15))
+    DETAIL_MAX_AGE_SECONDS = int(os.getenv("HTTP_DETAIL_MAX_AGE_SECONDS", 30))
+    STATS_MAX_AGE_SECONDS = int(os.getenv("HTTP_STATS_MAX_AGE_SECONDS", 60))
+
+
+class PropertyCacheConfig:
+    """Read-through cache for property detail pages."""
+
+    # In-process LRU; its TTL bounds staleness of entries other workers evicted
+    LOCAL_MAX_SIZE = int(os.getenv("PROPERTY_CACHE_LOCAL_MAX_SIZE", 10_000))
+    LOCAL_TTL_SECONDS = float(os.getenv("PROPERTY_CACHE_LOCAL_TTL_SECONDS", 30))
+    REDIS_TTL_SECONDS = int(os.getenv("PROPERTY_CACHE_REDIS_TTL_SECONDS", 600))
+    # Stampede lock: how long one filler may hold it, and how long others wait
+    LOCK_TIMEOUT_MS = int(os.getenv("PROPERTY_CACHE_LOCK_TIMEOUT_MS", 3000))
+    LOCK_WAIT_SECONDS = float(os.getenv("PROPERTY_CACHE_LOCK_WAIT_SECONDS", 0.5))
+
+
+class CacheBusConfig:
+    """Cross-worker invalidation of in-process caches over Redis pub/sub."""
+
+    CHANNEL = os.getenv("CACHE_BUS_CHANNEL", "cache:invalidate")
+    RECONNECT_MIN_SECONDS = float(os.getenv("CACHE_BUS_RECONNECT_MIN_SECONDS", 0.5))
+    RECONNECT_MAX_SECONDS = float(os.getenv("CACHE_BUS_RECONNECT_MAX_SECONDS", 10))
+    PING_INTERVAL_SECONDS = float(os.getenv("CACHE_BUS_PING_INTERVAL_SECONDS", 15))
+
+
+class PasswordHashConfig:
+    """bcrypt hashing configuration."""
+
+    # Work factor (log2 rounds) for new hashes; tune with benchmarks.bcrypt_cost.
+    # Stored hashes with a different cost are upgraded on the next login.
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+
+    # bcrypt releases the GIL, so one thread per core runs hashes in parallel
+    WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 2))
+    # Hashes allowed to wait for a thread before requests get 503
+    MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 64))
+
+
+class RateLimitConfig:
+    """Sliding-window throttling of login and expensive routes."""
+
+    # Login attempts per client IP, whatever the account
+    LOGIN_IP_LIMIT = int(os.getenv("LOGIN_IP_LIMIT", 20))
+    LOGIN_IP_WINDOW_SECONDS = int(os.getenv("LOGIN_IP_WINDOW_SECONDS", 60))
+    # Login attempts per email; a successful login clears the window
+    LOGIN_EMAIL_LIMIT = int(os.getenv("LOGIN_EMAIL_LIMIT", 5))
+    LOGIN_EMAIL_WINDOW_SECONDS = int(os.getenv("LOGIN_EMAIL_WINDOW_SECONDS", 300))
+    # Each exhausted login window locks the key out for twice as long as the
+    # previous one, up to the max. Strikes are forgotten after STRIKE_TTL.
+    LOCKOUT_BASE_SECONDS = int(os.getenv("LOGIN_LOCKOUT_BASE_SECONDS", 30))
+    LOCKOUT_MAX_SECONDS = int(os.getenv("LOGIN_LOCKOUT_MAX_SECONDS", 900))
+    STRIKE_TTL_SECONDS = int(os.getenv("LOGIN_STRIKE_TTL_SECONDS", 3600))
+
+    SEARCH_LIMIT = int(os.getenv("SEARCH_RATE_LIMIT", 60))
+    SEARCH_WINDOW_SECONDS = int(os.getenv("SEARCH_RATE_WINDOW_SECONDS", 60))
+
+    # Only behind a proxy that overwrites X-Forwarded-For; otherwise clients
+    # can pick their own rate-limit key.
+    TRUST_FORWARDED_FOR = os.getenv("TRUST_FORWARDED_FOR", "false").lower() == "true"
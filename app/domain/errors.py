@@ -20,3 +20,17 @@ class WrongCredentials(Exception):
     """Raised when login credentials are incorrect."""
 
     pass
+
+
+class ExecutorOverloadedError(Exception):
+    """Raised when a bounded worker pool's queue is full."""
+
+    pass
+
+
+class RateLimitExceededError(Exception):
+    """Raised when a caller is throttled; ``retry_after`` is in seconds."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
@@ -0,0 +1,49 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Runs an async job every ``interval`` seconds for the app's lifetime."""
+
+    def __init__(
+        self,
+        name: str,
+        job: Callable[[], Awaitable[None]],
+        interval: float,
+        run_on_start: bool = False,
+    ):
+        self.name = name
+        self.job = job
+        self.interval = interval
+        self.run_on_start = run_on_start
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        if not self.run_on_start:
+            await asyncio.sleep(self.interval)
+        while True:
+            try:
+                await self.job()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Keep the loop alive; the next tick retries
+                logger.exception("Periodic task %s failed", self.name)
+            await asyncio.sleep(self.interval)
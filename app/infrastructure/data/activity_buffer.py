@@ -0,0 +1,120 @@
+import time
+from datetime import datetime, timezone
+
+from app.config import ActivityConfig
+from app.infrastructure.metrics import metrics
+
+# (user id, last_login, last_seen_at)
+ActivityRow = tuple[int, datetime | None, datetime | None]
+
+
+def _later(a: datetime | None, b: datetime | None) -> datetime | None:
+    if a is None or b is None:
+        return a or b
+    return max(a, b)
+
+
+class ActivityBuffer:
+    """
+    Per-worker write-behind buffer of user login and activity timestamps.
+
+    Recording is a dict update with no I/O; repeated activity of one user
+    collapses to the latest timestamps. A periodic job ``drain()``s the
+    buffer into one batched UPDATE and ``restore()``s the rows if that
+    fails, so a crash loses at most the activity since the last successful
+    flush, and memory is bounded by ``max_pending`` users.
+    """
+
+    def __init__(self, max_pending: int):
+        self.max_pending = max_pending
+        # user id -> [last_login, last_seen_at]
+        self._pending: dict[int, list[datetime | None]] = {}
+        # monotonic time of the oldest activity not yet flushed
+        self._oldest: float | None = None
+        self.dropped = 0
+        self.flushes = 0
+        self.flushed_rows = 0
+        self.last_flush_seconds = 0.0
+        self.last_flush_lag = 0.0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record_login(self, user_id: int, at: datetime | None = None) -> None:
+        at = at or datetime.now(timezone.utc)
+        self._record(user_id, at, at)
+
+    def record_seen(self, user_id: int, at: datetime | None = None) -> None:
+        self._record(user_id, None, at or datetime.now(timezone.utc))
+
+    def _record(
+        self, user_id: int, login: datetime | None, seen: datetime | None
+    ) -> None:
+        entry = self._pending.get(user_id)
+        if entry is None:
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return
+            self._pending[user_id] = [login, seen]
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            return
+        entry[0] = _later(entry[0], login)
+        entry[1] = _later(entry[1], seen)
+
+    def drain(self) -> tuple[list[ActivityRow], float]:
+        """Take every pending row; returns them with their lag in seconds."""
+        rows = [(user_id, *entry) for user_id, entry in self._pending.items()]
+        lag = 0.0 if self._oldest is None else time.monotonic() - self._oldest
+        self._pending = {}
+        self._oldest = None
+        return rows, lag
+
+    def restore(self, rows: list[ActivityRow], lag: float) -> None:
+        """Put back rows whose flush failed, merged with newer activity."""
+        for user_id, login, seen in rows:
+            self._record(user_id, login, seen)
+        if rows:
+            self._oldest = time.monotonic() - lag
+
+    def flushed(self, rows: int, seconds: float, lag: float) -> None:
+        self.flushes += 1
+        self.flushed_rows += rows
+        self.last_flush_seconds = seconds
+        self.last_flush_lag = lag
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            # Age of the oldest activity still only in memory
+            "lag_seconds": (
+                0.0 if self._oldest is None else time.monotonic() - self._oldest
+            ),
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "flushed_rows": self.flushed_rows,
+            "last_flush_seconds": self.last_flush_seconds,
+            "last_flush_lag_seconds": self.last_flush_lag,
+        }
+
+
+activity_buffer = ActivityBuffer(ActivityConfig.MAX_PENDING)
+metrics.callback(
+    "user_activity_pending",
+    "Users with activity buffered but not yet written.",
+    [],
+    lambda: [((), len(activity_buffer))],
+)
+metrics.callback(
+    "user_activity_flush_lag_seconds",
+    "Age of the oldest buffered activity not yet written.",
+    [],
+    lambda: [((), activity_buffer.stats()["lag_seconds"])],
+)
+metrics.callback(
+    "user_activity_dropped",
+    "Activity records dropped because the buffer was full.",
+    [],
+    lambda: [((), activity_buffer.dropped)],
+    "counter",
+)
@@ -0,0 +1,40 @@
+class AmenityIdCache:
+    """
+    Process-local amenity name -> id map.
+
+    Amenities are only ever inserted, so a cached id stays valid until its
+    row is deleted. Every invalidation bumps ``version``; a fill that started
+    under an older version is dropped so a slow lookup cannot put back ids
+    that were invalidated while it was in flight.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self.version = 0
+        self._ids: dict[str, int] = {}
+
+    def lookup(self, names: list[str]) -> tuple[dict[str, int], list[str]]:
+        """Split names into (cached name -> id, names not cached)."""
+        found: dict[str, int] = {}
+        missing: list[str] = []
+        for name in names:
+            amenity_id = self._ids.get(name)
+            if amenity_id is None:
+                missing.append(name)
+            else:
+                found[name] = amenity_id
+        return found, missing
+
+    def update(self, ids: dict[str, int], version: int) -> None:
+        if version != self.version:
+            return
+        if len(self._ids) + len(ids) > self.max_size:
+            self._ids.clear()
+        self._ids.update(ids)
+
+    def invalidate(self) -> None:
+        self._ids.clear()
+        self.version += 1
+
+
+amenity_id_cache = AmenityIdCache()
@@ -1,7 +1,13 @@
+import time
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from app.config import DatabaseConfig
+from app.infrastructure.data.query_counter import query_finished, query_started
+from app.infrastructure.metrics import metrics
+from app.infrastructure.tracing import tracer
 
 Base=declarative_base()
 DATABASE_URL = DatabaseConfig.get_url()
@@ -9,6 +15,51 @@ engine = create_async_engine(DATABASE_URL, echo=True)
 async_session = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False)
 
+db_query_seconds = metrics.histogram(
+    "db_query_duration_seconds",
+    "SQL statement latency by statement type.",
+    ["operation"],
+)
+db_query_errors = metrics.counter(
+    "db_query_errors_total", "SQL statements that raised.", ["operation"]
+)
+SQL_OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+
+def _operation(statement: str) -> str:
+    """Leading keyword of the statement; keeps the label set fixed."""
+    head = statement.lstrip()[:6].upper()
+    return next((op for op in SQL_OPERATIONS if head.startswith(op)), "OTHER")
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    query_started(statement)
+    context._query_start = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _observe_query(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - context._query_start
+    operation = _operation(statement)
+    db_query_seconds.observe(duration, operation)
+    query_finished(statement, duration)
+    # The session runs the driver in a greenlet of the caller's task, so the
+    # request's trace context is visible here
+    tracer.record_span(
+        f"sql {operation}",
+        time.time() - duration,
+        duration,
+        statement=statement[:200],
+        executemany=executemany,
+    )
+
+
+@event.listens_for(engine.sync_engine, "handle_error")
+def _count_query_error(exception_context):
+    statement = exception_context.statement
+    db_query_errors.inc(_operation(statement) if statement else "OTHER")
+
 
 async def get_db():
     async with async_session() as session:
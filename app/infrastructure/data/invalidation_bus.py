@@ -0,0 +1,158 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Iterable
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import CacheBusConfig
+from app.infrastructure.data.local_lru_cache import LocalLRUCache
+from app.infrastructure.data.redis_registry import redis_cache
+
+logger = logging.getLogger(__name__)
+
+
+def property_tag(property_id: int) -> str:
+    return f"property:{property_id}"
+
+
+def user_tag(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def user_properties_tag(user_id: int) -> str:
+    return f"user:{user_id}:properties"
+
+
+def session_tag(session_id: str) -> str:
+    return f"session:{session_id}"
+
+
+def access_token_tag(jti: str) -> str:
+    return f"access_token:{jti}"
+
+
+class InvalidationBus:
+    """
+    Cross-worker eviction of tagged entries in process-local caches.
+
+    Writers publish tags (``property:42``, ``user:7:properties``) after
+    commit; the publishing worker evicts immediately and every other worker
+    evicts when the message arrives over Redis pub/sub. Pub/sub has no
+    replay, so whenever the subscription (re)connects after a gap, every
+    registered cache is flushed: anything may have been missed.
+    """
+
+    def __init__(self, redis: Redis, channel: str):
+        self.redis = redis
+        self.channel = channel
+        # Identifies this worker's own messages, already applied on publish
+        self.origin = uuid.uuid4().hex
+        self.caches: list[LocalLRUCache] = []
+        self.connected = False
+        self.flushes = 0
+        self._task: asyncio.Task | None = None
+
+    def register(self, cache: LocalLRUCache) -> LocalLRUCache:
+        self.caches.append(cache)
+        return cache
+
+    def evict(self, tags: Iterable[str]) -> None:
+        tags = list(tags)
+        for cache in self.caches:
+            cache.invalidate_tags(tags)
+
+    def flush(self) -> None:
+        self.flushes += 1
+        for cache in self.caches:
+            cache.clear()
+
+    async def publish(self, tags: Iterable[str]) -> None:
+        """Evict locally, then tell the other workers. Call after commit."""
+        tags = sorted(set(tags))
+        if not tags:
+            return
+        self.evict(tags)
+        message = json.dumps({"origin": self.origin, "tags": tags})
+        try:
+            await self.redis.publish(self.channel, message)
+        except RedisError:
+            # Other workers keep stale entries until their local TTL expires
+            logger.warning("Cache invalidation publish failed", exc_info=True)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="invalidation-bus")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.connected = False
+
+    def _apply(self, data) -> None:
+        try:
+            message = json.loads(data)
+        except ValueError:
+            logger.warning("Ignoring malformed invalidation message %r", data)
+            return
+        if message.get("origin") != self.origin:
+            self.evict(message.get("tags", ()))
+
+    async def _run(self) -> None:
+        backoff = CacheBusConfig.RECONNECT_MIN_SECONDS
+        first = True
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                if not first:
+                    # Messages published while we were away are gone
+                    self.flush()
+                    logger.info("Invalidation bus reconnected; local caches flushed")
+                first = False
+                self.connected = True
+                backoff = CacheBusConfig.RECONNECT_MIN_SECONDS
+                await self._listen(pubsub)
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError):
+                logger.warning(
+                    "Invalidation bus disconnected; retrying in %.1fs",
+                    backoff,
+                    exc_info=True,
+                )
+            finally:
+                self.connected = False
+                try:
+                    await pubsub.aclose()
+                except (RedisError, OSError):
+                    pass
+            first = False
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, CacheBusConfig.RECONNECT_MAX_SECONDS)
+
+    async def _listen(self, pubsub) -> None:
+        idle = 0.0
+        while True:
+            message = await pubsub.get_message(timeout=1.0)
+            if message is None:
+                idle += 1.0
+                # A silently dropped connection only shows up on a write
+                if idle >= CacheBusConfig.PING_INTERVAL_SECONDS:
+                    await pubsub.ping()
+                    idle = 0.0
+                continue
+            idle = 0.0
+            if message["type"] == "message":
+                self._apply(message["data"])
+
+
+invalidation_bus = InvalidationBus(redis_cache, CacheBusConfig.CHANNEL)
@@ -0,0 +1,90 @@
+import time
+from collections import OrderedDict
+from typing import Any, Iterable
+
+
+class LocalLRUCache:
+    """
+    Bounded process-local LRU with a per-entry TTL and tag eviction.
+
+    Entries carry tags (e.g. ``property:42``) so writes can evict everything
+    derived from a row without knowing the keys. Like AmenityIdCache, every
+    invalidation bumps ``version`` and a fill that started under an older
+    version is dropped, so a slow load cannot put back data invalidated
+    while it was in flight.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: float = 30.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        # key -> (expires_at, value, tags)
+        self._entries: OrderedDict[str, tuple[float, Any, tuple[str, ...]]] = (
+            OrderedDict()
+        )
+        self._tags: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        tags: Iterable[str] = (),
+        version: int | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Store ``value``; ``ttl`` overrides the cache-wide TTL for this entry."""
+        if version is not None and version != self.version:
+            return
+        tags = tuple(tags)
+        self._remove(key)
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Evict every entry carrying any of ``tags``; returns the count."""
+        self.version += 1
+        evicted = 0
+        for tag in tags:
+            for key in self._tags.pop(tag, ()):
+                if key in self._entries:
+                    self._remove(key)
+                    evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        self.version += 1
+        self._entries.clear()
+        self._tags.clear()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
@@ -1,4 +1,19 @@
-from app.infrastructure.data.models.property_model import Amenity, Property
+from app.infrastructure.data.models.property_model import (
+    Amenity,
+    Property,
+    PropertyArchive,
+)
+from app.infrastructure.data.models.property_stats_model import (
+    PropertyPriceQuantiles,
+    PropertyStats,
+)
 from app.infrastructure.data.models.user_model import User
 
-__all__ = ["User", "Property", "Amenity"]
+__all__ = [
+    "User",
+    "Property",
+    "PropertyArchive",
+    "Amenity",
+    "PropertyStats",
+    "PropertyPriceQuantiles",
+]
@@ -6,15 +6,19 @@ from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
     Text,
+    text,
 )
 from sqlalchemy import Enum as SqlEnum
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -30,6 +34,15 @@ property_amenities = Table(
     Column(
         "amenity_id", ForeignKey("amenities.id", ondelete="CASCADE"), primary_key=True
     ),
+    Index("ix_property_amenities_amenity_id", "amenity_id"),
+)
+
+
+# Weighted document for the Postgres full-text search fallback
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(address, '')), 'C')"
 )
 
 
@@ -50,12 +63,42 @@ class PropertyStatus(enum.Enum):
 
 class Property(Base):
     __tablename__ = "properties"
+    __table_args__ = (
+        Index("ix_properties_city_status_price", "city", "status", "price"),
+        # Most reads only look at listings that are still on the market
+        Index(
+            "ix_properties_available_city_price",
+            "city",
+            "price",
+            postgresql_where=text("status = 'available'"),
+        ),
+        Index(
+            "ix_properties_available_price",
+            "price",
+            postgresql_where=text("status = 'available'"),
+        ),
+        Index("ix_properties_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_properties_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+        # Candidates for the archiver
+        Index(
+            "ix_properties_inactive_id",
+            "id",
+            postgresql_where=text("status <> 'available'"),
+        ),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True)
 
     # Foreign key to User
-    posted_by: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    posted_by: Mapped[int] = mapped_column(
+        ForeignKey("users.id"), nullable=False, index=True
+    )
     user: Mapped["User"] = relationship(back_populates="properties")  # noqa: F821
 
     # Property details
@@ -111,7 +154,7 @@ class Property(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), onupdate=func.now(), nullable=True
+        DateTime(timezone=True), onupdate=func.now(), nullable=True, index=True
     )
 
     # Misc
@@ -120,6 +163,11 @@ class Property(Base):
         JSON, nullable=True
     )  # Comma-separated URLs
 
+    # Full-text search (generated by Postgres, never loaded by default)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True), deferred=True
+    )
+
 
 # --- Amenity Model ---
 class Amenity(Base):
@@ -132,3 +180,70 @@ class Amenity(Base):
     properties: Mapped[List["Property"]] = relationship(  # noqa: F821
         secondary="property_amenities", back_populates="amenities"
     )
+
+
+# --- Archive (cold tier) ---
+class PropertyArchive(Base):
+    """
+    Sold and rented listings moved out of ``properties`` by the archiver.
+
+    Keeps the hot table and its indexes down to listings that are still on
+    the market. Rows are read-only, so amenity names are stored inline.
+    """
+
+    __tablename__ = "properties_archive"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    posted_by: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    title: Mapped[str] = mapped_column(String(100), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    address: Mapped[str] = mapped_column(String(255), nullable=False)
+    city: Mapped[str] = mapped_column(String(100), nullable=False)
+    state: Mapped[str] = mapped_column(String(100), nullable=False)
+    zip_code: Mapped[str] = mapped_column(String(20), nullable=False)
+    country: Mapped[str] = mapped_column(String(100), nullable=False)
+    price: Mapped[float] = mapped_column(Float, nullable=False)
+    property_type: Mapped[PropertyType] = mapped_column(
+        SqlEnum(
+            PropertyType,
+            name="propertytype",
+            values_callable=lambda x: [m.value for m in x],
+            create_type=False,
+        ),
+        nullable=False,
+    )
+    status: Mapped[PropertyStatus] = mapped_column(
+        SqlEnum(
+            PropertyStatus,
+            name="propertystatus",
+            values_callable=lambda x: [m.value for m in x],
+            create_type=False,
+        ),
+        nullable=False,
+    )
+    bedrooms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    bathrooms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    area_sqft: Mapped[float | None] = mapped_column(Float, nullable=True)
+    lot_size_sqft: Mapped[float | None] = mapped_column(Float, nullable=True)
+    parking_spaces: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    heating_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    cooling_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    year_built: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    is_featured: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    image_urls: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+
+    amenities: Mapped[list[str]] = mapped_column(
+        ARRAY(String(100)), server_default="{}", nullable=False
+    )
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,67 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Integer, String
+from sqlalchemy import Enum as SqlEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.infrastructure.data.database import Base
+from app.infrastructure.data.models.property_model import PropertyStatus, PropertyType
+
+# City key of the all-cities row in property_price_quantiles
+ALL_CITIES = "*"
+
+
+class PropertyStats(Base):
+    """Listing counters per (city, type, status), kept current on every write."""
+
+    __tablename__ = "property_stats"
+
+    city: Mapped[str] = mapped_column(String(100), primary_key=True)
+    property_type: Mapped[PropertyType] = mapped_column(
+        SqlEnum(
+            PropertyType,
+            name="propertytype",
+            values_callable=lambda x: [m.value for m in x],
+            create_type=False,
+        ),
+        primary_key=True,
+    )
+    status: Mapped[PropertyStatus] = mapped_column(
+        SqlEnum(
+            PropertyStatus,
+            name="propertystatus",
+            values_callable=lambda x: [m.value for m in x],
+            create_type=False,
+        ),
+        primary_key=True,
+    )
+
+    listing_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    price_sum: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    # Only listings with a positive area_sqft contribute to price per sqft
+    price_per_sqft_sum: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    area_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+
+class PropertyPriceQuantiles(Base):
+    """Price quantiles per city, recomputed periodically from a column scan."""
+
+    __tablename__ = "property_price_quantiles"
+
+    city: Mapped[str] = mapped_column(String(100), primary_key=True)
+    listing_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    p25_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    median_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    p75_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    median_price_per_sqft: Mapped[float | None] = mapped_column(Float, nullable=True)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
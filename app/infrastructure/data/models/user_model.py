@@ -70,6 +70,10 @@ class User(Base):
     last_login: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Last authenticated request; written behind, so up to a flush interval old
+    last_seen_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     # Relationship to properties
     properties: Mapped[List["Property"]] = relationship(  # noqa: F821
@@ -0,0 +1,198 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable, Iterable
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import PropertyCacheConfig
+from app.infrastructure.data.invalidation_bus import (
+    InvalidationBus,
+    invalidation_bus,
+    property_tag,
+    user_properties_tag,
+)
+from app.infrastructure.data.local_lru_cache import LocalLRUCache
+from app.infrastructure.data.redis_registry import redis_cache
+
+logger = logging.getLogger(__name__)
+
+# Store the value only if this filler still holds the lock. Invalidation
+# deletes the lock too, so a fill that raced a write is not written back.
+SET_IF_LOCKED = """
+if redis.call('get', KEYS[2]) == ARGV[1] then
+    redis.call('set', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    redis.call('del', KEYS[2])
+    return 1
+end
+return 0
+"""
+
+RELEASE_LOCK = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+POLL_INTERVAL_SECONDS = 0.05
+
+
+class PropertyCache:
+    """
+    Read-through cache of property detail JSON: local LRU, then Redis, then
+    the loader (Postgres).
+
+    Stampede protection on a miss:
+      * in-process, concurrent requests for one id share a single load;
+      * across workers, one filler takes a short Redis lock (SET NX PX) and
+        the others poll Redis for its result, falling back to their own
+        database read if it does not show up within LOCK_WAIT_SECONDS.
+    Redis errors degrade to a plain database read.
+    """
+
+    def __init__(self, redis: Redis, local: LocalLRUCache, bus: InvalidationBus):
+        self.redis = redis
+        self.local = bus.register(local)
+        self.bus = bus
+        self._set_if_locked = redis.register_script(SET_IF_LOCKED)
+        self._release_lock = redis.register_script(RELEASE_LOCK)
+        self._inflight: dict[int, asyncio.Future] = {}
+
+    @staticmethod
+    def _key(property_id: int) -> str:
+        return f"property:v1:{property_id}"
+
+    @staticmethod
+    def _lock_key(property_id: int) -> str:
+        return f"lock:property:v1:{property_id}"
+
+    async def get(
+        self, property_id: int, load: Callable[[], Awaitable[str | None]]
+    ) -> str | None:
+        """
+        Cached detail JSON for ``property_id``; None if it does not exist.
+
+        ``load`` runs in a task shared by every concurrent caller and may
+        outlive the one that started it, so it must not use request-scoped
+        resources such as the request's database session.
+        """
+        payload = self.local.get(self._key(property_id))
+        if payload is not None:
+            return payload
+
+        inflight = self._inflight.get(property_id)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fill(property_id, load))
+            self._inflight[property_id] = inflight
+            inflight.add_done_callback(
+                lambda _: self._inflight.pop(property_id, None)
+            )
+        # Shield so one waiter being cancelled does not cancel the shared load
+        return await asyncio.shield(inflight)
+
+    async def invalidate(
+        self, property_ids: Iterable[int], tags: Iterable[str] = ()
+    ) -> None:
+        """
+        Drop the listings from Redis and, through the bus, from every
+        worker's local cache, along with any extra ``tags``.
+        Call after the write commits.
+        """
+        property_ids = list(property_ids)
+        await self.bus.publish([*(property_tag(i) for i in property_ids), *tags])
+        if not property_ids:
+            return
+        keys = [self._key(i) for i in property_ids]
+        keys += [self._lock_key(i) for i in property_ids]
+        try:
+            await self.redis.delete(*keys)
+        except RedisError:
+            logger.warning("Property cache invalidation failed", exc_info=True)
+
+    async def _fill(
+        self, property_id: int, load: Callable[[], Awaitable[str | None]]
+    ) -> str | None:
+        version = self.local.version
+        payload = await self._read_through(property_id, load)
+        if payload is not None:
+            # Also tag by owner so user-level events evict the entry
+            owner = json.loads(payload)["posted_by"]
+            self.local.set(
+                self._key(property_id),
+                payload,
+                tags=(property_tag(property_id), user_properties_tag(owner)),
+                version=version,
+            )
+        return payload
+
+    async def _read_through(
+        self, property_id: int, load: Callable[[], Awaitable[str | None]]
+    ) -> str | None:
+        key = self._key(property_id)
+        lock_key = self._lock_key(property_id)
+        token = uuid.uuid4().hex
+        try:
+            payload = await self.redis.get(key)
+            if payload is not None:
+                return payload
+            locked = await self.redis.set(
+                lock_key, token, nx=True, px=PropertyCacheConfig.LOCK_TIMEOUT_MS
+            )
+        except RedisError:
+            logger.warning("Property cache read failed", exc_info=True)
+            return await load()
+
+        if not locked:
+            payload = await self._wait_for_fill(key)
+            # Fill did not land in time; read directly but leave Redis to
+            # the lock holder.
+            return payload if payload is not None else await load()
+
+        try:
+            payload = await load()
+        except Exception:
+            await self._release(lock_key, token)
+            raise
+        if payload is None:
+            await self._release(lock_key, token)
+            return None
+        try:
+            await self._set_if_locked(
+                keys=[key, lock_key],
+                args=[token, payload, PropertyCacheConfig.REDIS_TTL_SECONDS],
+            )
+        except RedisError:
+            logger.warning("Property cache write failed", exc_info=True)
+        return payload
+
+    async def _wait_for_fill(self, key: str) -> str | None:
+        deadline = time.monotonic() + PropertyCacheConfig.LOCK_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+            try:
+                payload = await self.redis.get(key)
+            except RedisError:
+                return None
+            if payload is not None:
+                return payload
+        return None
+
+    async def _release(self, lock_key: str, token: str) -> None:
+        try:
+            await self._release_lock(keys=[lock_key], args=[token])
+        except RedisError:
+            logger.warning("Property cache lock release failed", exc_info=True)
+
+
+property_cache = PropertyCache(
+    redis_cache,
+    LocalLRUCache(
+        max_size=PropertyCacheConfig.LOCAL_MAX_SIZE,
+        ttl=PropertyCacheConfig.LOCAL_TTL_SECONDS,
+    ),
+    invalidation_bus,
+)
@@ -0,0 +1,96 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+# Transaction control, not queries: nested transactions (and test harnesses
+# that run each session in a savepoint) would otherwise skew every count
+SAVEPOINT_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class QueryStats:
+    """SQL statements run within one ``count_queries()`` block."""
+
+    __slots__ = ("parent", "count", "seconds", "statements")
+
+    def __init__(self, parent: "QueryStats | None" = None):
+        self.parent = parent
+        self.count = 0
+        self.seconds = 0.0
+        # Statement text (parameters are bound separately) -> executions
+        self.statements: Counter[str] = Counter()
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements run at least ``threshold`` times: the N+1 signature."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+class QueryBudgetExceeded(AssertionError):
+    def __init__(self, stats: QueryStats, budget: int):
+        self.stats = stats
+        self.budget = budget
+        listing = "\n".join(
+            f"  {count}x {statement}"
+            for statement, count in stats.statements.most_common()
+        )
+        super().__init__(
+            f"{stats.count} SQL statements, budget {budget}:\n{listing}"
+        )
+
+
+_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """
+    Count the statements the current task runs until the block exits.
+
+    Blocks nest; a statement counts towards every enclosing block, so a
+    budget wrapped around a request still sees what the request's own
+    counter saw.
+    """
+    stats = QueryStats(_stats.get())
+    token = _stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _stats.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """
+    Fail with QueryBudgetExceeded if the block runs more than
+    ``max_queries`` statements, e.g. in a test::
+
+        with query_budget(2):
+            await client.get("/api/properties/me")
+    """
+    with count_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(stats, max_queries)
+
+
+def query_started(statement: str) -> None:
+    stats = _stats.get()
+    if stats is not None and statement.startswith(SAVEPOINT_STATEMENTS):
+        return
+    while stats is not None:
+        stats.count += 1
+        stats.statements[statement] += 1
+        stats = stats.parent
+
+
+def query_finished(statement: str, seconds: float) -> None:
+    stats = _stats.get()
+    if stats is not None and statement.startswith(SAVEPOINT_STATEMENTS):
+        return
+    while stats is not None:
+        stats.seconds += seconds
+        stats = stats.parent
@@ -1,32 +1,210 @@
+import hashlib
+import json
+import time
+
 from redis.asyncio import Redis
 
-from app.config import JWTConfig, RedisConfig
+from app.config import JWTConfig
+from app.infrastructure.data.redis_registry import redis_command_seconds, redis_tokens
+from app.infrastructure.metrics import timed
+
+REFRESH_TOKEN_TTL = 60 * 60 * 24 * JWTConfig.REFRESH_TOKEN_EXPIRE_DAYS
+
+# Replace the session's refresh token only if it still holds the one the
+# client presented, and touch the user's session index in the same step.
+# The new pair is kept for a grace period under the old token's digest, so
+# a concurrent refresh with the same old token gets that pair back.
+# KEYS: session key, session index, grace key
+# ARGV: expected, new refresh, ttl, sid, now, expected digest, new access,
+#       grace ms
+# Returns {1} rotated, {2, access, refresh} from grace, {0} rejected
+ROTATE = """
+if redis.call('get', KEYS[1]) ~= ARGV[1] then
+    local grace = redis.call('get', KEYS[3])
+    if grace then
+        local entry = cjson.decode(grace)
+        if entry['previous'] == ARGV[6] then
+            return {2, entry['access_token'], entry['refresh_token']}
+        end
+    end
+    return {0}
+end
+local now = tonumber(ARGV[5])
+local created = now
+local meta = redis.call('hget', KEYS[2], ARGV[4])
+if meta then
+    created = cjson.decode(meta)['created_at'] or now
+end
+redis.call('set', KEYS[1], ARGV[2], 'EX', ARGV[3])
+redis.call('hset', KEYS[2], ARGV[4],
+    cjson.encode({created_at = created, refreshed_at = now}))
+redis.call('expire', KEYS[2], ARGV[3])
+if tonumber(ARGV[8]) > 0 then
+    redis.call('set', KEYS[3], cjson.encode({previous = ARGV[6],
+        access_token = ARGV[7], refresh_token = ARGV[2]}), 'PX', ARGV[8])
+end
+return {1}
+"""
+
+# Delete every indexed session key and the index itself; returns the ids.
+# KEYS: session index; ARGV: session key prefix ("<user_id>:")
+REVOKE_ALL = """
+local sids = redis.call('hkeys', KEYS[1])
+for _, sid in ipairs(sids) do
+    redis.call('del', ARGV[1] .. sid, ARGV[1] .. sid .. ':grace')
+end
+redis.call('del', KEYS[1])
+return sids
+"""
 
 
 class RedisTokenService:
-    def __init__(self, redis_url: str | None = None):
-        self.redis: Redis = Redis.from_url(
-            redis_url or RedisConfig.get_tokens_url(), decode_responses=True
-        )
+    """
+    Refresh tokens per session, plus a per-user session index.
+
+    ``<user_id>:<session_id>`` holds the session's current refresh token
+    with the refresh TTL. ``sessions:<user_id>`` is a hash of session id ->
+    JSON metadata, written atomically with every session key, so listing
+    and revoking a user's sessions never needs SCAN.
+    """
+
+    def __init__(self, redis: Redis = redis_tokens):
+        self.redis = redis
+        self._rotate = self.redis.register_script(ROTATE)
+        self._revoke_all = self.redis.register_script(REVOKE_ALL)
 
+    @staticmethod
+    def _key(user_id: str, session_id: str) -> str:
+        return f"{user_id}:{session_id}"
+
+    @staticmethod
+    def _grace_key(user_id: str, session_id: str) -> str:
+        return f"{user_id}:{session_id}:grace"
+
+    @staticmethod
+    def _index_key(user_id: str) -> str:
+        return f"sessions:{user_id}"
+
+    @timed(redis_command_seconds, "tokens", "store")
     async def store(
         self,
         user_id: str,
         refresh_token: str,
-        ttl: int = 60 * 60 * 24 * JWTConfig.REFRESH_TOKEN_EXPIRE_DAYS,
+        ttl: int = REFRESH_TOKEN_TTL,
         session_id: str | None = None,
     ) -> str:
-        key = f"{user_id}:{session_id}"
-        await self.redis.setex(key, ttl, refresh_token)
+        now = int(time.time())
+        meta = json.dumps({"created_at": now, "refreshed_at": now})
+        index_key = self._index_key(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.setex(self._key(user_id, session_id), ttl, refresh_token)
+            pipe.hset(index_key, session_id, meta)
+            pipe.expire(index_key, ttl)
+            await pipe.execute()
+        return session_id
+
+    @timed(redis_command_seconds, "tokens", "rotate")
+    async def rotate(
+        self,
+        user_id: str,
+        session_id: str,
+        expected_token: str,
+        new_access_token: str,
+        new_refresh_token: str,
+        ttl: int = REFRESH_TOKEN_TTL,
+        grace_seconds: int = JWTConfig.REFRESH_GRACE_SECONDS,
+    ) -> tuple[str, str] | None:
+        """
+        Swap the session's refresh token in one round trip; returns the
+        session's new (access, refresh) pair.
 
+        If ``expected_token`` was rotated within the last ``grace_seconds``
+        (another tab or worker refreshed first), that rotation's pair is
+        returned instead. None if the session is gone or the token is stale.
+        """
+        digest = hashlib.sha256(expected_token.encode()).hexdigest()
+        result = await self._rotate(
+            keys=[
+                self._key(user_id, session_id),
+                self._index_key(user_id),
+                self._grace_key(user_id, session_id),
+            ],
+            args=[
+                expected_token,
+                new_refresh_token,
+                ttl,
+                session_id,
+                int(time.time()),
+                digest,
+                new_access_token,
+                grace_seconds * 1000,
+            ],
+        )
+        if result[0] == 1:
+            return new_access_token, new_refresh_token
+        if result[0] == 2:
+            return result[1], result[2]
+        return None
+
+    @timed(redis_command_seconds, "tokens", "get")
     async def get(self, user_id: str, session_id: str) -> str | None:
-        key = f"{user_id}:{session_id}"
-        return await self.redis.get(key)
+        return await self.redis.get(self._key(user_id, session_id))
 
+    @timed(redis_command_seconds, "tokens", "session_exists")
+    async def session_exists(self, user_id: str, session_id: str) -> bool:
+        return bool(await self.redis.exists(self._key(user_id, session_id)))
+
+    @timed(redis_command_seconds, "tokens", "revoke")
     async def revoke(self, user_id: str, session_id: str) -> None:
-        key = f"{user_id}:{session_id}"
-        await self.redis.delete(key)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(
+                self._key(user_id, session_id), self._grace_key(user_id, session_id)
+            )
+            pipe.hdel(self._index_key(user_id), session_id)
+            await pipe.execute()
+
+    @timed(redis_command_seconds, "tokens", "revoke_all")
+    async def revoke_all(self, user_id: str) -> list[str]:
+        """Revoke every session of the user; returns the revoked session ids."""
+        return await self._revoke_all(
+            keys=[self._index_key(user_id)], args=[f"{user_id}:"]
+        )
+
+    @timed(redis_command_seconds, "tokens", "list_sessions")
+    async def list_sessions(self, user_id: str) -> list[dict]:
+        """
+        The user's live sessions, oldest first.
+
+        One HGETALL plus one pipelined EXISTS per session; index entries
+        whose session key has expired are pruned on the way.
+        """
+        index_key = self._index_key(user_id)
+        entries = await self.redis.hgetall(index_key)
+        if not entries:
+            return []
+        session_ids = list(entries)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.exists(self._key(user_id, session_id))
+            alive = await pipe.execute()
+
+        expired = [sid for sid, ok in zip(session_ids, alive) if not ok]
+        if expired:
+            await self.redis.hdel(index_key, *expired)
+
+        sessions = [
+            {"session_id": sid, **json.loads(entries[sid])}
+            for sid, ok in zip(session_ids, alive)
+            if ok
+        ]
+        return sorted(sessions, key=lambda s: s["created_at"])
 
     async def get_refresh_token(self, user_id: str, session_id: str) -> str | None:
-        key = f"{user_id}:{session_id}"
-        return await self.redis.get(key)
+        return await self.get(user_id, session_id)
+
+
+token_service = RedisTokenService()
+
+
+def get_token_service() -> RedisTokenService:
+    return token_service
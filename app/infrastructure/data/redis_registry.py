@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import time
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ConnectionError, RedisError
+
+from app.config import RedisConfig
+from app.infrastructure.metrics import metrics, stats_collector
+from app.infrastructure.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+
+class MeteredConnectionPool(BlockingConnectionPool):
+    """Blocking pool that counts checkouts, time spent waiting and timeouts."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+
+    async def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except ConnectionError as e:
+            if isinstance(e.__cause__, asyncio.TimeoutError):
+                self.timeouts += 1
+            raise
+        finally:
+            self.wait_seconds += time.perf_counter() - start
+        self.checkouts += 1
+        return connection
+
+    def stats(self) -> dict:
+        return {
+            "max_connections": self.max_connections,
+            "in_use": len(self._in_use_connections),
+            "idle": len(self._available_connections),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds": round(self.wait_seconds, 6),
+        }
+
+
+class TracedPipeline(Pipeline):
+    """Pipeline recorded as one span, however many commands it sends."""
+
+    async def execute(self, raise_on_error: bool = True):
+        with tracer.span("redis PIPELINE", commands=len(self.command_stack)):
+            return await super().execute(raise_on_error)
+
+
+class TracedRedis(Redis):
+    """Client recording a span per command sent inside a traced request."""
+
+    async def execute_command(self, *args, **options):
+        with tracer.span(f"redis {args[0]}"):
+            return await super().execute_command(*args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None):
+        return TracedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
+
+class RedisRegistry:
+    """
+    One bounded connection pool per Redis database, shared by every caller.
+
+    Clients are cheap handles over their pool and open no sockets until
+    first used, so modules may grab them at import time. The app lifespan
+    calls ``open()`` to connect and verify each pool and ``close()`` to drop
+    the connections on shutdown.
+    """
+
+    def __init__(self):
+        self._pools: dict[str, MeteredConnectionPool] = {}
+        self._clients: dict[str, Redis] = {}
+
+    def register(self, name: str, url: str) -> Redis:
+        if name in self._clients:
+            raise ValueError(f"Redis client {name!r} is already registered")
+        pool = MeteredConnectionPool.from_url(
+            url,
+            max_connections=RedisConfig.MAX_CONNECTIONS,
+            timeout=RedisConfig.POOL_TIMEOUT,
+            health_check_interval=RedisConfig.HEALTH_CHECK_INTERVAL,
+            socket_timeout=RedisConfig.SOCKET_TIMEOUT,
+            socket_connect_timeout=RedisConfig.SOCKET_CONNECT_TIMEOUT,
+            decode_responses=True,
+        )
+        self._pools[name] = pool
+        self._clients[name] = TracedRedis(connection_pool=pool)
+        return self._clients[name]
+
+    def client(self, name: str) -> Redis:
+        return self._clients[name]
+
+    async def open(self) -> None:
+        """PING every pool; an unreachable Redis is logged, not fatal."""
+        for name, client in self._clients.items():
+            try:
+                await client.ping()
+            except RedisError as e:
+                logger.warning("Redis %r is unreachable at startup: %s", name, e)
+
+    async def close(self) -> None:
+        for pool in self._pools.values():
+            await pool.disconnect()
+
+    def stats(self) -> dict[str, dict]:
+        return {name: pool.stats() for name, pool in self._pools.items()}
+
+
+redis_registry = RedisRegistry()
+# REDIS_DB_LRU_CACHE (DB 1 by default): caches and the invalidation bus
+redis_cache = redis_registry.register("cache", RedisConfig.get_cache_url())
+# REDIS_DB_REFRESH_TOKENS (DB 0 by default): sessions and refresh tokens
+redis_tokens = redis_registry.register("tokens", RedisConfig.get_tokens_url())
+
+
+redis_command_seconds = metrics.histogram(
+    "redis_command_duration_seconds",
+    "Redis call latency by client and operation.",
+    ["client", "operation"],
+)
+for field, help, kind in (
+    ("max_connections", "Connection cap per pool.", "gauge"),
+    ("in_use", "Connections checked out.", "gauge"),
+    ("idle", "Open connections waiting in the pool.", "gauge"),
+    ("checkouts", "Connections handed out.", "counter"),
+    ("timeouts", "Checkouts that gave up waiting for a connection.", "counter"),
+    ("wait_seconds", "Time spent acquiring connections.", "counter"),
+):
+    metrics.callback(
+        f"redis_pool_{field}",
+        help,
+        ["pool"],
+        stats_collector(redis_registry.stats, field),
+        kind,
+    )
@@ -0,0 +1,98 @@
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from app.domain.errors import ExecutorOverloadedError
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    Thread pool for blocking calls with a cap on queued work.
+
+    At most ``max_workers`` calls run at once and at most ``max_queue`` wait
+    behind them; beyond that ``submit`` fails fast with
+    ExecutorOverloadedError instead of letting latency grow without bound.
+    Only for work that releases the GIL (bcrypt, hashlib, I/O), otherwise
+    the threads just contend with the event loop.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+        # Only touched from the event loop thread
+        self.in_flight = 0
+        self.peak_queue_depth = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.run_seconds_total = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self.in_flight - self.max_workers)
+
+    async def submit(self, fn: Callable[..., T], *args) -> T:
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise ExecutorOverloadedError(self.name)
+        self.in_flight += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        loop = asyncio.get_running_loop()
+        queued_at = time.perf_counter()
+        started_at = None
+
+        def run() -> T:
+            nonlocal started_at
+            started_at = time.perf_counter()
+            return fn(*args)
+
+        def done(future: Future) -> None:
+            # Runs when the job leaves the pool, not when the caller stops
+            # waiting: a cancelled caller's job still holds its slot until
+            # it has run or been dropped from the queue
+            finished_at = time.perf_counter()
+            try:
+                loop.call_soon_threadsafe(
+                    self._finished, queued_at, started_at, finished_at
+                )
+            except RuntimeError:
+                pass  # Loop already closed on shutdown
+
+        future = self._pool.submit(run)
+        future.add_done_callback(done)
+        # Cancelling the caller cancels the job only if it has not started
+        return await asyncio.wrap_future(future)
+
+    def _finished(
+        self, queued_at: float, started_at: float | None, finished_at: float
+    ) -> None:
+        self.in_flight -= 1
+        if started_at is None:
+            self.cancelled += 1
+            return
+        self.completed += 1
+        self.wait_seconds_total += started_at - queued_at
+        self.run_seconds_total += finished_at - started_at
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+            "wait_seconds_total": self.wait_seconds_total,
+            "run_seconds_total": self.run_seconds_total,
+        }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,160 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+
+from app.config import ProfilingConfig
+
+# Stack recorded while the profiled request waits on I/O or another task runs
+AWAITING = "[awaiting]"
+
+
+class Profile:
+    """Collapsed stacks sampled from one request."""
+
+    __slots__ = (
+        "request_id",
+        "name",
+        "task",
+        "loop",
+        "thread_id",
+        "start",
+        "duration",
+        "samples",
+        "stacks",
+    )
+
+    def __init__(self, request_id: str, name: str):
+        self.request_id = request_id
+        self.name = name
+        self.task = asyncio.current_task()
+        self.loop = asyncio.get_running_loop()
+        self.thread_id = threading.get_ident()
+        self.start = time.time()
+        self.duration = 0.0
+        self.samples = 0
+        self.stacks: Counter[str] = Counter()
+
+    def collapsed(self) -> str:
+        """``frame;frame;frame count`` lines, as flamegraph.pl and speedscope read."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def summary(self) -> dict:
+        return {
+            "request_id": self.request_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": round(self.duration * 1000, 3),
+            "samples": self.samples,
+            "awaiting_samples": self.stacks[AWAITING],
+        }
+
+
+class ProfileStore:
+    """The last ``max_profiles`` profiles, by request id."""
+
+    def __init__(self, max_profiles: int):
+        self.max_profiles = max_profiles
+        self._profiles: OrderedDict[str, Profile] = OrderedDict()
+
+    def add(self, profile: Profile) -> None:
+        self._profiles[profile.request_id] = profile
+        self._profiles.move_to_end(profile.request_id)
+        while len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+
+    def get(self, request_id: str) -> Profile | None:
+        return self._profiles.get(request_id)
+
+    def recent(self, limit: int) -> list[Profile]:
+        return list(reversed(self._profiles.values()))[:limit]
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler for individual requests on the event loop.
+
+    While at least one request is profiled, a daemon thread wakes every
+    ``interval`` seconds and snapshots the loop thread's stack. A sample
+    goes to a request only if its task is the one running; otherwise it
+    counts as ``[awaiting]``, so profiles show wall time, not just CPU.
+    With nothing to profile the thread exits, so an idle profiler costs
+    nothing.
+    """
+
+    def __init__(self, store: ProfileStore, interval: float, max_seconds: float):
+        self.store = store
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self._active: list[Profile] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._labels: dict = {}
+
+    @contextmanager
+    def profile(self, request_id: str, name: str):
+        """Sample the current task until the block exits; stores the Profile."""
+        profile = Profile(request_id, name)
+        with self._lock:
+            self._active.append(profile)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="request-profiler", daemon=True
+                )
+                self._thread.start()
+        start = time.perf_counter()
+        try:
+            yield profile
+        finally:
+            profile.duration = time.perf_counter() - start
+            with self._lock:
+                self._active.remove(profile)
+            self.store.add(profile)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+                active = list(self._active)
+            frames = sys._current_frames()
+            now = time.time()
+            for profile in active:
+                if now - profile.start > self.max_seconds:
+                    continue
+                frame = frames.get(profile.thread_id)
+                running = asyncio.current_task(profile.loop) is profile.task
+                stack = self._collapse(frame) if running and frame else AWAITING
+                profile.stacks[stack] += 1
+                profile.samples += 1
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = os.path.relpath(code.co_filename)
+            if filename.startswith(".."):
+                filename = os.path.basename(code.co_filename)
+            label = self._labels[code] = (
+                f"{code.co_name} ({filename}:{code.co_firstlineno})"
+            )
+        return label
+
+    def _collapse(self, frame) -> str:
+        labels = []
+        while frame is not None:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        return ";".join(reversed(labels))
+
+
+profile_store = ProfileStore(ProfilingConfig.STORE_SIZE)
+profiler = SamplingProfiler(
+    profile_store, ProfilingConfig.INTERVAL_MS / 1000, ProfilingConfig.MAX_SECONDS
+)
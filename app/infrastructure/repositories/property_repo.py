@@ -1,30 +1,139 @@
-from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import (
+    Row,
+    Select,
+    String,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    insert,
+    literal_column,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 
-from app.infrastructure.data.models.property_model import Amenity, Property
+from app.infrastructure.data.amenity_id_cache import amenity_id_cache
+from app.infrastructure.data.invalidation_bus import (
+    invalidation_bus,
+    property_tag,
+    user_properties_tag,
+)
+from app.infrastructure.data.property_cache import property_cache
+from app.infrastructure.data.models.property_model import (
+    Amenity,
+    Property,
+    PropertyArchive,
+    property_amenities,
+)
+from app.infrastructure.repositories.property_stats_repo import (
+    PropertyStatsRepository,
+)
+from app.infrastructure.tracing import traced_methods
 from app.presentation.schemas.property_schema import PropertyBase
 
+# Columns PropertyResponse is built from; amenities come from the join below
+PROPERTY_COLUMNS = (
+    Property.id,
+    Property.posted_by,
+    Property.title,
+    Property.description,
+    Property.address,
+    Property.city,
+    Property.state,
+    Property.zip_code,
+    Property.country,
+    Property.price,
+    Property.property_type,
+    Property.status,
+    Property.bedrooms,
+    Property.bathrooms,
+    Property.area_sqft,
+    Property.lot_size_sqft,
+    Property.parking_spaces,
+    Property.heating_type,
+    Property.cooling_type,
+    Property.year_built,
+    Property.created_at,
+    Property.updated_at,
+    Property.is_featured,
+    Property.image_urls,
+)
+
+
+def select_property_rows() -> Select:
+    """
+    One-query projection of properties with their amenity names.
+
+    Rows come back as plain tuples (no identity map, no unit of work) and
+    validate straight into PropertyResponse.
+    """
+    amenity_names = func.coalesce(
+        func.array_agg(aggregate_order_by(Amenity.name, Amenity.name)).filter(
+            Amenity.id.is_not(None)
+        ),
+        cast(literal_column("'{}'"), ARRAY(String)),
+    )
+    return (
+        select(*PROPERTY_COLUMNS, amenity_names.label("amenities"))
+        .select_from(Property)
+        .outerjoin(property_amenities, property_amenities.c.property_id == Property.id)
+        .outerjoin(Amenity, Amenity.id == property_amenities.c.amenity_id)
+        .group_by(Property.id)
+    )
+
+
+def select_archived_rows() -> Select:
+    """The same projection as select_property_rows(), from the archive."""
+    return select(
+        *(getattr(PropertyArchive, column.key) for column in PROPERTY_COLUMNS),
+        PropertyArchive.amenities,
+    )
+
 
+@traced_methods("PropertyRepository")
 class PropertyRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.stats = PropertyStatsRepository(db)
 
-    async def add_property(self, property: PropertyBase) -> Property:
-        amenity_objects = []
-        for amenity_name in property.amenities:
-            amenity = (
-                await self.db.execute(
-                    select(Amenity).where(Amenity.name == amenity_name)
-                )
-            ).scalar_one_or_none()
-
-            if not amenity:
-                amenity = Amenity(name=amenity_name)
-                self.db.add(amenity)
-                await self.db.flush()  # Ensures amenity.id is available
-            amenity_objects.append(amenity)
+    async def add_property(self, property: PropertyBase) -> Row:
+        amenity_names = list(dict.fromkeys(property.amenities or []))
+        version = amenity_id_cache.version
+        ids, fetched = await self._resolve_amenity_ids(amenity_names)
+        try:
+            row = await self._insert_property(
+                property, [ids[name] for name in amenity_names]
+            )
+        except IntegrityError:
+            if len(fetched) == len(ids):
+                raise
+            # A cached amenity id may point at a row that has since been
+            # deleted; drop the cache and resolve from the database once more.
+            amenity_id_cache.invalidate()
+            version = amenity_id_cache.version
+            ids, fetched = await self._resolve_amenity_ids(amenity_names)
+            row = await self._insert_property(
+                property, [ids[name] for name in amenity_names]
+            )
+        # Only cache ids once the transaction that may have created them
+        # is committed.
+        amenity_id_cache.update(fetched, version)
+        await invalidation_bus.publish(
+            [property_tag(row.id), user_properties_tag(row.posted_by)]
+        )
+        return row
 
+    async def _insert_property(
+        self, property: PropertyBase, amenity_ids: list[int]
+    ) -> Row:
         db_property = Property(
             posted_by=property.posted_by,
             title=property.title,
@@ -44,36 +153,189 @@ class PropertyRepository:
             parking_spaces=property.parking_spaces,
             heating_type=property.heating_type,
             cooling_type=property.cooling_type,
-            amenities=amenity_objects,
             year_built=property.year_built,
             image_urls=property.image_urls,
             updated_at=func.now(),
         )
         try:
             self.db.add(db_property)
-            await self.db.commit()
-            # Re-fetch with amenities eagerly loaded
-            result = await self.db.execute(
-                select(Property)
-                .options(selectinload(Property.amenities))
-                .where(Property.id == db_property.id)
+            await self.db.flush()  # Ensures db_property.id is available
+            if amenity_ids:
+                await self.db.execute(
+                    insert(property_amenities),
+                    [
+                        {"property_id": db_property.id, "amenity_id": amenity_id}
+                        for amenity_id in amenity_ids
+                    ],
+                )
+            await self.stats.apply_delta(
+                city=property.city,
+                property_type=property.property_type,
+                status=property.status,
+                price=property.price,
+                area_sqft=property.area_sqft,
             )
-            property_with_amenities = result.scalar_one()
-            return property_with_amenities
+            await self.db.commit()
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise e
 
-    async def get_properties_by_user(self, user_id: int) -> list[Property]:
-        stmt = (
-            select(Property)
-            .options(selectinload(Property.amenities))
-            .where(Property.posted_by == user_id)
+        return await self.get_property_row(db_property.id)
+
+    async def _resolve_amenity_ids(
+        self, names: list[str]
+    ) -> tuple[dict[str, int], dict[str, int]]:
+        """
+        Map amenity names to ids, creating missing amenities.
+
+        Cached names cost no queries; the rest take one SELECT and, for
+        names that do not exist yet, one upsert.
+        Returns (all name -> id, the subset read from the database).
+        """
+        ids, missing = amenity_id_cache.lookup(names)
+        fetched: dict[str, int] = {}
+        if missing:
+            res = await self.db.execute(
+                select(Amenity.name, Amenity.id).where(
+                    Amenity.name
+                    == any_(bindparam("names", missing, type_=ARRAY(String)))
+                )
+            )
+            fetched.update(res.all())
+
+            to_create = [name for name in missing if name not in fetched]
+            if to_create:
+                stmt = pg_insert(Amenity).values([{"name": n} for n in to_create])
+                # DO UPDATE instead of DO NOTHING so rows inserted concurrently
+                # by another request are still returned with their ids.
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Amenity.name],
+                    set_={"name": stmt.excluded.name},
+                ).returning(Amenity.name, Amenity.id)
+                res = await self.db.execute(stmt)
+                fetched.update(res.all())
+
+            ids.update(fetched)
+
+        return ids, fetched
+
+    async def get_property_row(self, property_id: int) -> Row | None:
+        """Look up a listing by id, falling back to the archive."""
+        stmt = select_property_rows().where(Property.id == property_id)
+        res = await self.db.execute(stmt)
+        row = res.first()
+        if row is None:
+            stmt = select_archived_rows().where(PropertyArchive.id == property_id)
+            res = await self.db.execute(stmt)
+            row = res.first()
+        return row
+
+    async def get_property_rows_by_user(
+        self, user_id: int, include_archived: bool = False
+    ) -> Sequence[Row]:
+        stmt = select_property_rows().where(Property.posted_by == user_id)
+        if include_archived:
+            stmt = union_all(
+                stmt,
+                select_archived_rows().where(PropertyArchive.posted_by == user_id),
+            )
+        res = await self.db.execute(stmt)
+        return res.all()
+
+    async def get_property_ids_by_user(self, user_id: int) -> Sequence[int]:
+        """Ids of a user's listings in both tiers."""
+        stmt = union_all(
+            select(Property.id).where(Property.posted_by == user_id),
+            select(PropertyArchive.id).where(PropertyArchive.posted_by == user_id),
         )
         res = await self.db.execute(stmt)
         return res.scalars().all()
 
-    async def get_all_properties(self) -> list[Property]:
-        stmt = select(Property).options(selectinload(Property.amenities))
+    async def get_owner_fingerprint(
+        self, user_id: int, include_archived: bool = False
+    ) -> Row:
+        """
+        (count, last modified, digest of ids and versions) of a user's listings.
+
+        Changes whenever a listing is added, changed, archived or removed,
+        at the cost of one index scan without the amenities join.
+        """
+
+        def versions(model):
+            return select(
+                model.id,
+                func.coalesce(model.updated_at, model.created_at).label("version"),
+            ).where(model.posted_by == user_id)
+
+        source = versions(Property)
+        if include_archived:
+            source = union_all(source, versions(PropertyArchive))
+        source = source.subquery()
+        stmt = select(
+            func.count(),
+            func.max(source.c.version),
+            func.md5(
+                func.string_agg(
+                    cast(source.c.id, String) + ":" + cast(source.c.version, String),
+                    aggregate_order_by(literal_column("','"), source.c.id),
+                )
+            ),
+        )
         res = await self.db.execute(stmt)
-        return res.scalars().all()
+        return res.one()
+
+    async def get_all_property_rows(self) -> Sequence[Row]:
+        res = await self.db.execute(select_property_rows())
+        return res.all()
+
+    async def archive_inactive(
+        self, older_than: datetime, batch_size: int
+    ) -> Sequence[Row]:
+        """
+        Move one batch of sold/rented listings into properties_archive.
+
+        Copy and delete run as one statement, so a listing is always in
+        exactly one tier. SKIP LOCKED lets concurrent movers (and writers
+        holding row locks) pass each other instead of queueing.
+        Returns (id, posted_by) of the moved listings.
+        """
+        batch = (
+            select(Property.id)
+            .where(
+                # A literal, not a parameter, so ix_properties_inactive_id
+                # still matches under prepared statements
+                Property.status != literal_column("'available'"),
+                func.coalesce(Property.updated_at, Property.created_at) < older_than,
+            )
+            .order_by(Property.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .cte("batch")
+        )
+        archived = (
+            insert(PropertyArchive)
+            .from_select(
+                [column.key for column in PROPERTY_COLUMNS] + ["amenities"],
+                select_property_rows().where(Property.id.in_(select(batch.c.id))),
+            )
+            .returning(PropertyArchive.id)
+            .cte("archived")
+        )
+        stmt = (
+            delete(Property)
+            .where(Property.id.in_(select(archived.c.id)))
+            .returning(Property.id, Property.posted_by)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            res = await self.db.execute(stmt)
+            moved = res.all()
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+        await property_cache.invalidate(
+            [row.id for row in moved],
+            {user_properties_tag(row.posted_by) for row in moved},
+        )
+        return moved
@@ -0,0 +1,161 @@
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import case, delete, func, insert, select, text, union_all, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.infrastructure.data.models.property_model import Property, PropertyArchive
+from app.infrastructure.data.models.property_stats_model import (
+    PropertyPriceQuantiles,
+    PropertyStats,
+)
+from app.infrastructure.tracing import traced_methods
+
+# pg_try_advisory_xact_lock key so only one worker recomputes at a time
+QUANTILE_LOCK_KEY = 7_310_031
+
+
+@traced_methods("PropertyStatsRepository")
+class PropertyStatsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def apply_delta(
+        self,
+        city: str,
+        property_type,
+        status,
+        price: float,
+        area_sqft: float | None,
+        sign: int = 1,
+    ) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) one listing from the counters.
+
+        Runs in the caller's transaction so counters commit with the write.
+        """
+        has_area = area_sqft is not None and area_sqft > 0
+        stmt = pg_insert(PropertyStats).values(
+            city=city,
+            property_type=property_type,
+            status=status,
+            listing_count=sign,
+            price_sum=sign * price,
+            price_per_sqft_sum=sign * price / area_sqft if has_area else 0,
+            area_count=sign if has_area else 0,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                PropertyStats.city,
+                PropertyStats.property_type,
+                PropertyStats.status,
+            ],
+            set_={
+                "listing_count": PropertyStats.listing_count
+                + stmt.excluded.listing_count,
+                "price_sum": PropertyStats.price_sum + stmt.excluded.price_sum,
+                "price_per_sqft_sum": PropertyStats.price_per_sqft_sum
+                + stmt.excluded.price_per_sqft_sum,
+                "area_count": PropertyStats.area_count + stmt.excluded.area_count,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def remove_owner(self, owner_id: int) -> None:
+        """
+        Take every listing of ``owner_id``, in both tiers, out of the counters
+        in one statement; the set-based ``apply_delta(..., sign=-1)``.
+
+        Run it in the transaction that deletes the listings, before the delete.
+        """
+        listings = union_all(
+            select(
+                Property.city,
+                Property.property_type,
+                Property.status,
+                Property.price,
+                Property.area_sqft,
+            ).where(Property.posted_by == owner_id),
+            select(
+                PropertyArchive.city,
+                PropertyArchive.property_type,
+                PropertyArchive.status,
+                PropertyArchive.price,
+                PropertyArchive.area_sqft,
+            ).where(PropertyArchive.posted_by == owner_id),
+        ).subquery()
+        has_area = listings.c.area_sqft > 0
+        removed = (
+            select(
+                listings.c.city,
+                listings.c.property_type,
+                listings.c.status,
+                func.count().label("listing_count"),
+                func.sum(listings.c.price).label("price_sum"),
+                func.coalesce(
+                    func.sum(case((has_area, listings.c.price / listings.c.area_sqft))),
+                    0,
+                ).label("price_per_sqft_sum"),
+                func.count(case((has_area, 1))).label("area_count"),
+            )
+            .group_by(listings.c.city, listings.c.property_type, listings.c.status)
+            .subquery()
+        )
+        stmt = (
+            update(PropertyStats)
+            .where(
+                PropertyStats.city == removed.c.city,
+                PropertyStats.property_type == removed.c.property_type,
+                PropertyStats.status == removed.c.status,
+            )
+            .values(
+                listing_count=PropertyStats.listing_count - removed.c.listing_count,
+                price_sum=PropertyStats.price_sum - removed.c.price_sum,
+                price_per_sqft_sum=PropertyStats.price_per_sqft_sum
+                - removed.c.price_per_sqft_sum,
+                area_count=PropertyStats.area_count - removed.c.area_count,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(stmt)
+
+    async def get_counters(self) -> Sequence[PropertyStats]:
+        stmt = select(PropertyStats).where(PropertyStats.listing_count > 0)
+        res = await self.db.execute(stmt)
+        return res.scalars().all()
+
+    async def get_quantiles(self) -> Sequence[PropertyPriceQuantiles]:
+        res = await self.db.execute(select(PropertyPriceQuantiles))
+        return res.scalars().all()
+
+    async def try_lock_quantiles(self) -> bool:
+        """Take the recompute lock for the current transaction, if free."""
+        res = await self.db.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": QUANTILE_LOCK_KEY}
+        )
+        return bool(res.scalar_one())
+
+    async def scan_price_columns(
+        self, batch_size: int
+    ) -> AsyncIterator[Sequence[tuple[str, float, float | None]]]:
+        """
+        Stream (city, price, area_sqft) in batches with a server-side cursor.
+
+        Covers both tiers, matching the counters, which archiving leaves alone.
+        """
+        stmt = union_all(
+            select(Property.city, Property.price, Property.area_sqft),
+            select(
+                PropertyArchive.city, PropertyArchive.price, PropertyArchive.area_sqft
+            ),
+        ).execution_options(yield_per=batch_size)
+        res = await self.db.stream(stmt)
+        async for partition in res.partitions():
+            yield partition
+
+    async def replace_quantiles(self, rows: list[dict]) -> None:
+        await self.db.execute(delete(PropertyPriceQuantiles))
+        if rows:
+            await self.db.execute(insert(PropertyPriceQuantiles), rows)
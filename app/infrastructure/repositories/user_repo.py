@@ -1,38 +1,150 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    cast,
+    column,
+    func,
+    insert,
+    select,
+    text,
+    update,
+    values,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.infrastructure.data.models.user_model import User
+from app.domain.errors import EmailAlreadyExistsError, UsernameAlreadyExistsError
+from app.infrastructure.data.activity_buffer import ActivityRow
+from app.infrastructure.data.models.user_model import User, UserRole
+from app.infrastructure.tracing import traced_methods
 from app.presentation.schemas.user_schema import UserCreate
 
+# Unique indexes on users and the domain error a violation of each means
+UNIQUE_VIOLATIONS = {
+    "ix_users_email": EmailAlreadyExistsError,
+    "ix_users_username": UsernameAlreadyExistsError,
+}
 
+
+def _unique_violation(error: IntegrityError) -> Optional[Exception]:
+    """The domain error for a unique violation on users, if it is one."""
+    # asyncpg's UniqueViolationError is chained behind the DBAPI adapter error
+    constraint = getattr(error.orig.__cause__, "constraint_name", None)
+    if constraint is None:
+        # Fall back to the server message for other drivers
+        message = str(error.orig)
+        constraint = next((name for name in UNIQUE_VIOLATIONS if name in message), None)
+    error_class = UNIQUE_VIOLATIONS.get(constraint)
+    return error_class() if error_class else None
+
+
+@traced_methods("UserRepository")
 class UserRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    # Create user
+    # Create user in one INSERT ... RETURNING; duplicates surface as domain errors
     async def create_user(self, user: UserCreate, hashed_password: str) -> User:
-        db_user = User(
-            email=user.email,
-            username=user.username,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            phone=user.phone,
-            bio=user.bio,
-            avatar_url=user.avatar_url,
-            user_type=user.user_type,
-            role=user.role,
-            hashed_password=hashed_password,
+        stmt = (
+            insert(User)
+            .values(
+                email=user.email,
+                username=user.username,
+                first_name=user.first_name,
+                last_name=user.last_name,
+                phone=user.phone,
+                bio=user.bio,
+                avatar_url=user.avatar_url,
+                user_type=user.user_type,
+                # Never taken from the signup; admins grant other roles
+                role=UserRole.USER,
+                hashed_password=hashed_password,
+            )
+            .returning(User)
         )
+        return await self._write_returning(stmt)
 
+    # Update user in one UPDATE ... RETURNING; None if the user does not exist
+    async def update_user(self, user_id: int, values: Dict[str, Any]) -> Optional[User]:
+        if not values:
+            return await self.get_user_by_id(user_id)
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+            .returning(User)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return await self._write_returning(stmt)
+
+    # Swap the password hash only if it is still the one we verified against,
+    # so a concurrent password change wins; leaves updated_at alone.
+    async def replace_password_hash(
+        self, user_id: int, old_hash: str, new_hash: str
+    ) -> bool:
+        stmt = (
+            update(User)
+            .where(User.id == user_id, User.hashed_password == old_hash)
+            .values(hashed_password=new_hash, updated_at=User.updated_at)
+            .execution_options(synchronize_session=False)
+        )
         try:
-            self.db.add(db_user)
+            res = await self.db.execute(stmt)
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+        return res.rowcount == 1
+
+    # Apply buffered activity in one UPDATE ... FROM (VALUES ...); timestamps
+    # only move forward and updated_at is left alone.
+    async def record_activity(self, rows: List[ActivityRow]) -> int:
+        timestamp = DateTime(timezone=True)
+        activity = values(
+            column("id", Integer),
+            column("last_login", timestamp),
+            column("last_seen_at", timestamp),
+            name="activity",
+        ).data(rows)
+        # An all-NULL VALUES column would otherwise resolve to text
+        stmt = (
+            update(User)
+            .where(User.id == activity.c.id)
+            .values(
+                last_login=func.greatest(
+                    User.last_login, cast(activity.c.last_login, timestamp)
+                ),
+                last_seen_at=func.greatest(
+                    User.last_seen_at, cast(activity.c.last_seen_at, timestamp)
+                ),
+                updated_at=User.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            res = await self.db.execute(stmt)
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+        return res.rowcount
+
+    async def _write_returning(self, stmt) -> Optional[User]:
+        try:
+            res = await self.db.execute(stmt)
+            db_user = res.scalars().first()
             await self.db.commit()
-            await self.db.refresh(db_user)
             return db_user
+        except IntegrityError as e:
+            await self.db.rollback()
+            domain_error = _unique_violation(e)
+            if domain_error is not None:
+                raise domain_error from e
+            raise e
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise e
 
     # Get by ID
@@ -43,10 +155,42 @@ class UserRepository:
 
     # List users with optional limit/offset
     async def list_users(self, skip: int = 0, limit: int = 100) -> List[User]:
-        stmt = select(User).offset(skip).limit(limit)
+        stmt = select(User).order_by(User.id).offset(skip).limit(limit)
+        res = await self.db.execute(stmt)
+        return res.scalars().all()
+
+    # List users by keyset: the page after after_id, walked via the primary key
+    async def list_users_after(
+        self, after_id: Optional[int] = None, limit: int = 100
+    ) -> List[User]:
+        stmt = select(User).order_by(User.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(User.id > after_id)
         res = await self.db.execute(stmt)
         return res.scalars().all()
 
+    async def count_users(self) -> int:
+        res = await self.db.execute(select(func.count()).select_from(User))
+        return res.scalar_one()
+
+    async def estimate_user_count(self) -> Optional[int]:
+        """
+        Planner row estimate for users, kept by VACUUM/ANALYZE.
+
+        Returns None when the table has never been analyzed.
+        """
+        res = await self.db.execute(
+            text(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = to_regclass(:table)"
+            ),
+            {"table": User.__tablename__},
+        )
+        estimate = res.scalar_one_or_none()
+        if estimate is None or estimate < 0:
+            return None
+        return estimate
+
     # Delete user
     async def delete_user(self, db_user: User) -> None:
         await self.db.delete(db_user)
@@ -0,0 +1,174 @@
+from typing import Any, List
+
+from sqlalchemy import String, and_, cast, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+from app.infrastructure.data.models.property_model import (
+    Amenity,
+    Property,
+    PropertyStatus,
+    PropertyType,
+    property_amenities,
+)
+from app.infrastructure.tracing import traced_methods
+from app.presentation.schemas.property_schema import (
+    PropertyResponse,
+    PropertySearchParams,
+    PropertySearchResult,
+)
+
+# Inlined so the planner sees the same config as the generated column
+TS_CONFIG = literal_column("'english'::regconfig")
+
+
+@traced_methods("PostgresPropertySearchService")
+class PostgresPropertySearchService:
+    """
+    Property search served from Postgres.
+
+    Same contract as PropertySearchService, backed by the generated
+    ``search_vector`` column (GIN) and a pg_trgm index on city. Used when
+    Elasticsearch is unreachable or behind the Logstash indexer.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def search(self, params: PropertySearchParams) -> PropertySearchResult:
+        conditions = self._build_conditions(params)
+        if conditions is None:
+            return self._empty(params)
+
+        amenities = (
+            select(
+                func.coalesce(
+                    func.array_agg(Amenity.name),
+                    cast(literal_column("'{}'"), ARRAY(String)),
+                )
+            )
+            .select_from(property_amenities.join(Amenity))
+            .where(property_amenities.c.property_id == Property.id)
+            .scalar_subquery()
+        )
+        sort_column = getattr(Property, self._resolve_sort_field(params.sort_by))
+        order = sort_column.asc() if params.sort_order == "asc" else sort_column.desc()
+
+        stmt = (
+            select(
+                *(getattr(Property, name) for name in self._response_columns()),
+                amenities.label("amenities"),
+                func.count().over().label("total"),
+            )
+            .where(*conditions)
+            .order_by(order.nulls_last(), Property.id)
+            .offset((params.page - 1) * params.per_page)
+            .limit(params.per_page)
+        )
+        rows = (await self.db.execute(stmt)).mappings().all()
+
+        if rows:
+            total = rows[0]["total"]
+        elif params.page > 1:
+            # Page past the end: the window count has no row to ride on
+            total = (
+                await self.db.execute(
+                    select(func.count()).select_from(Property).where(*conditions)
+                )
+            ).scalar_one()
+        else:
+            total = 0
+
+        items: List[PropertyResponse] = [
+            PropertyResponse.model_validate(
+                {key: value for key, value in row.items() if key != "total"}
+            )
+            for row in rows
+        ]
+        return PropertySearchResult(
+            items=items,
+            total=total,
+            page=params.page,
+            per_page=params.per_page,
+        )
+
+    def _build_conditions(self, params: PropertySearchParams) -> list[Any] | None:
+        """Translate params into WHERE clauses; None if nothing can match."""
+        conditions: list[Any] = []
+
+        if params.q:
+            tsquery = func.websearch_to_tsquery(TS_CONFIG, params.q)
+            conditions.append(Property.search_vector.op("@@")(tsquery))
+
+        if params.location:
+            pattern = f"%{self._escape_like(params.location)}%"
+            conditions.append(
+                or_(
+                    Property.city.ilike(pattern),
+                    # pg_trgm similarity (threshold pg_trgm.similarity_threshold),
+                    # served by ix_properties_city_trgm
+                    Property.city.op("%")(params.location),
+                    Property.state.ilike(pattern),
+                    Property.country.ilike(pattern),
+                    Property.zip_code == params.location,
+                )
+            )
+
+        if params.city:
+            conditions.append(Property.city == params.city)
+        if params.state:
+            conditions.append(Property.state == params.state)
+        if params.country:
+            conditions.append(Property.country == params.country)
+        if params.zip_code:
+            conditions.append(Property.zip_code == params.zip_code)
+        if params.property_type:
+            try:
+                conditions.append(
+                    Property.property_type == PropertyType(params.property_type)
+                )
+            except ValueError:
+                return None
+        if params.status:
+            try:
+                conditions.append(Property.status == PropertyStatus(params.status))
+            except ValueError:
+                return None
+        if params.posted_by is not None:
+            conditions.append(Property.posted_by == params.posted_by)
+        if params.is_featured is not None:
+            conditions.append(Property.is_featured == params.is_featured)
+
+        ranges = [
+            (Property.price, params.min_price, params.max_price),
+            (Property.bedrooms, params.min_bedrooms, params.max_bedrooms),
+            (Property.bathrooms, params.min_bathrooms, params.max_bathrooms),
+            (Property.area_sqft, params.min_area, params.max_area),
+            (Property.year_built, params.min_year_built, params.max_year_built),
+        ]
+        for column, low, high in ranges:
+            if low is not None:
+                conditions.append(column >= low)
+            if high is not None:
+                conditions.append(column <= high)
+
+        return [and_(*conditions)] if conditions else []
+
+    def _response_columns(self) -> list[str]:
+        return [
+            name for name in PropertyResponse.model_fields if name != "amenities"
+        ]
+
+    def _resolve_sort_field(self, sort_by: str | None) -> str:
+        allowed = {"created_at", "updated_at", "price", "area_sqft"}
+        if sort_by and sort_by in allowed:
+            return sort_by
+        return "created_at"
+
+    def _escape_like(self, value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    def _empty(self, params: PropertySearchParams) -> PropertySearchResult:
+        return PropertySearchResult(
+            items=[], total=0, page=params.page, per_page=params.per_page
+        )
@@ -4,13 +4,22 @@ from typing import Any, Dict, List
 from elasticsearch import AsyncElasticsearch
 
 from app.config import ElasticsearchConfig
+from app.infrastructure.metrics import metrics
+from app.infrastructure.tracing import traced_methods, tracer
 from app.presentation.schemas.property_schema import (
     PropertyResponse,
     PropertySearchParams,
     PropertySearchResult,
 )
 
+es_request_seconds = metrics.histogram(
+    "elasticsearch_request_duration_seconds",
+    "Elasticsearch call latency by operation.",
+    ["operation"],
+)
+
 
+@traced_methods("PropertySearchService")
 class PropertySearchService:
     """Encapsulates Elasticsearch queries for properties."""
 
@@ -20,7 +29,10 @@ class PropertySearchService:
 
     async def search(self, params: PropertySearchParams) -> PropertySearchResult:
         search_args = self._build_query(params)
-        response = await self.client.search(index=self.index, **search_args)
+        with es_request_seconds.time("search"), tracer.span(
+            "elasticsearch search", index=self.index
+        ):
+            response = await self.client.search(index=self.index, **search_args)
         hits = response.get("hits", {})
         total_obj = hits.get("total", {"value": 0})
         total = total_obj["value"] if isinstance(total_obj, dict) else total_obj
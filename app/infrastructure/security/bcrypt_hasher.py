@@ -1,11 +1,37 @@
 import bcrypt
 
+from app.config import PasswordHashConfig
+from app.infrastructure.executor import BoundedExecutor
+from app.infrastructure.metrics import metrics, stats_collector
+
 MAX_PASSWORD_BYTES = 72
 
-def hash_password(password: str) -> str:
+# Each hash/check takes ~200 ms of CPU; never run one on the event loop
+hash_executor = BoundedExecutor(
+    "bcrypt", PasswordHashConfig.WORKERS, PasswordHashConfig.MAX_QUEUE
+)
+for field, help, kind in (
+    ("in_flight", "Jobs running on the executor.", "gauge"),
+    ("queue_depth", "Jobs waiting for a worker thread.", "gauge"),
+    ("completed", "Jobs finished.", "counter"),
+    ("cancelled", "Jobs dropped from the queue before they ran.", "counter"),
+    ("rejected", "Jobs refused because the queue was full.", "counter"),
+    ("wait_seconds_total", "Time jobs spent queued.", "counter"),
+    ("run_seconds_total", "Time jobs spent running.", "counter"),
+):
+    metrics.callback(
+        f"executor_{field}",
+        help,
+        ["executor"],
+        stats_collector(lambda: {hash_executor.name: hash_executor.stats()}, field),
+        kind,
+    )
+
+def hash_password(password: str, rounds: int | None = None) -> str:
     """
     Hash a plain-text password using bcrypt.
     Ensures it's within bcrypt's 72-byte limit.
+    Uses the configured BCRYPT_ROUNDS unless ``rounds`` is given.
     """
     password_bytes = password.encode("utf-8")
 
@@ -15,7 +41,7 @@ def hash_password(password: str) -> str:
             f"(limit is {MAX_PASSWORD_BYTES})"
         )
 
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds or PasswordHashConfig.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
@@ -30,3 +56,27 @@ def verify_password(password: str, hashed_password: str) -> bool:
         return False  # bcrypt won't handle this safely
 
     return bcrypt.checkpw(password_bytes, hashed_password.encode("utf-8"))
+
+
+def hash_rounds(hashed_password: str) -> int | None:
+    """Cost factor of a stored bcrypt hash ("$2b$12$..." -> 12)."""
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Whether a stored hash was made with a cost other than the configured one."""
+    rounds = hash_rounds(hashed_password)
+    return rounds is not None and rounds != PasswordHashConfig.BCRYPT_ROUNDS
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password on the bcrypt executor."""
+    return await hash_executor.submit(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """verify_password on the bcrypt executor."""
+    return await hash_executor.submit(verify_password, password, hashed_password)
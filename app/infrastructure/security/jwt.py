@@ -1,4 +1,6 @@
 import datetime
+import uuid
+from functools import lru_cache
 from typing import Optional
 
 import jwt
@@ -37,6 +39,8 @@ class JWTHandler:
             "iat": now,
             "exp": expire,
             "type": "access",
+            # Lets a single access token be revoked before it expires
+            "jti": uuid.uuid4().hex,
         }
 
         if extra_claims:
@@ -87,3 +91,9 @@ class JWTHandler:
         except jwt.InvalidTokenError:
             # Signature failed or token malformed
             return None
+
+
+@lru_cache
+def get_jwt_handler() -> JWTHandler:
+    """Process-wide handler built from JWTConfig once."""
+    return JWTHandler()
@@ -0,0 +1,135 @@
+import logging
+import math
+import uuid
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import RateLimitConfig
+from app.domain.errors import RateLimitExceededError
+from app.infrastructure.data.redis_registry import redis_cache
+
+logger = logging.getLogger(__name__)
+
+# Sliding-window log in a sorted set, scored by Redis server time so every
+# worker shares one clock. When the window is full and lockout is enabled,
+# the key is locked for base * 2^(strikes - 1) ms and the window restarts.
+# KEYS: window, lock, strikes
+# ARGV: window ms, limit, member, lockout base ms, lockout max ms, strike ttl ms
+# Returns {allowed, remaining or retry-after ms}
+HIT = """
+local locked = redis.call('pttl', KEYS[2])
+if locked > 0 then
+    return {0, locked}
+end
+local time = redis.call('time')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+redis.call('zremrangebyscore', KEYS[1], '-inf', now - window)
+local count = redis.call('zcard', KEYS[1])
+if count < limit then
+    redis.call('zadd', KEYS[1], now, ARGV[3])
+    redis.call('pexpire', KEYS[1], window)
+    return {1, limit - count - 1}
+end
+local base = tonumber(ARGV[4])
+if base > 0 then
+    local strikes = redis.call('incr', KEYS[3])
+    redis.call('pexpire', KEYS[3], ARGV[6])
+    local lockout = math.floor(math.min(base * 2 ^ (strikes - 1), tonumber(ARGV[5])))
+    redis.call('set', KEYS[2], 1, 'PX', lockout)
+    redis.call('del', KEYS[1])
+    return {0, lockout}
+end
+local oldest = redis.call('zrange', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, tonumber(oldest[2]) + window - now}
+"""
+
+
+class RateLimiter:
+    """
+    At most ``limit`` hits per ``window_seconds`` for each identity (client
+    IP, email, ...), checked and recorded in one atomic script.
+
+    With ``lockout_base_seconds`` set, exhausting the window locks the
+    identity out, doubling on every repeat within ``strike_ttl_seconds``;
+    without it, callers just wait for the oldest hit to leave the window.
+    Redis errors let the request through: throttling is best effort.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        name: str,
+        limit: int,
+        window_seconds: int,
+        lockout_base_seconds: int = 0,
+        lockout_max_seconds: int = 0,
+        strike_ttl_seconds: int = 0,
+    ):
+        self.redis = redis
+        self.name = name
+        self.limit = limit
+        self.window_ms = window_seconds * 1000
+        self.lockout_base_ms = lockout_base_seconds * 1000
+        self.lockout_max_ms = lockout_max_seconds * 1000
+        self.strike_ttl_ms = strike_ttl_seconds * 1000
+        self._hit = redis.register_script(HIT)
+
+    def _keys(self, identity: str) -> list[str]:
+        prefix = f"ratelimit:{self.name}:{identity}"
+        return [prefix, f"{prefix}:lock", f"{prefix}:strikes"]
+
+    async def hit(self, identity: str) -> None:
+        """Record a hit; raises RateLimitExceededError if over the limit."""
+        try:
+            allowed, value = await self._hit(
+                keys=self._keys(identity),
+                args=[
+                    self.window_ms,
+                    self.limit,
+                    uuid.uuid4().hex,
+                    self.lockout_base_ms,
+                    self.lockout_max_ms,
+                    self.strike_ttl_ms,
+                ],
+            )
+        except RedisError:
+            logger.warning("Rate limiter %r unavailable", self.name, exc_info=True)
+            return
+        if not allowed:
+            raise RateLimitExceededError(max(1, math.ceil(value / 1000)))
+
+    async def reset(self, identity: str) -> None:
+        """Forget the identity's hits and strikes, e.g. after a good login."""
+        try:
+            await self.redis.delete(*self._keys(identity))
+        except RedisError:
+            logger.warning("Rate limiter %r reset failed", self.name, exc_info=True)
+
+
+login_ip_limiter = RateLimiter(
+    redis_cache,
+    "login:ip",
+    RateLimitConfig.LOGIN_IP_LIMIT,
+    RateLimitConfig.LOGIN_IP_WINDOW_SECONDS,
+    RateLimitConfig.LOCKOUT_BASE_SECONDS,
+    RateLimitConfig.LOCKOUT_MAX_SECONDS,
+    RateLimitConfig.STRIKE_TTL_SECONDS,
+)
+login_email_limiter = RateLimiter(
+    redis_cache,
+    "login:email",
+    RateLimitConfig.LOGIN_EMAIL_LIMIT,
+    RateLimitConfig.LOGIN_EMAIL_WINDOW_SECONDS,
+    RateLimitConfig.LOCKOUT_BASE_SECONDS,
+    RateLimitConfig.LOCKOUT_MAX_SECONDS,
+    RateLimitConfig.STRIKE_TTL_SECONDS,
+)
+search_limiter = RateLimiter(
+    redis_cache,
+    "search",
+    RateLimitConfig.SEARCH_LIMIT,
+    RateLimitConfig.SEARCH_WINDOW_SECONDS,
+)
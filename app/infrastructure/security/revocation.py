@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import time
+from typing import Iterable
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import JWTConfig, RevocationConfig
+from app.infrastructure.data.bloom_filter import BloomFilter
+from app.infrastructure.data.invalidation_bus import (
+    InvalidationBus,
+    access_token_tag,
+    invalidation_bus,
+    session_tag,
+)
+from app.infrastructure.data.redis_registry import redis_tokens
+from app.infrastructure.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """
+    Revoked access tokens (``jti:<id>``) and sessions (``sid:<id>``).
+
+    Redis holds the truth: a sorted set of entry -> expiry (epoch seconds)
+    and a capped stream of revocations that every worker tails. Each worker
+    mirrors the live entries in a Bloom filter, so checking a token that is
+    not revoked, the common case, costs no network call; only Bloom hits
+    are confirmed against the sorted set. While the mirror is not in sync
+    (startup, Redis outage) every check goes to Redis.
+
+    Applying a revocation also evicts the matching verified tokens from the
+    local caches, so one verified against a stale filter is not kept.
+    """
+
+    def __init__(self, redis: Redis, key: str, stream: str, bus: InvalidationBus):
+        self.redis = redis
+        self.key = key
+        self.stream = stream
+        self.bus = bus
+        self.bloom = self._new_bloom()
+        self.synced = False
+        self.bloom_hits = 0
+        self.false_positives = 0
+        self._last_id = "0-0"
+        self._rebuild_at = 0.0
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def _new_bloom() -> BloomFilter:
+        return BloomFilter(
+            RevocationConfig.BLOOM_CAPACITY, RevocationConfig.BLOOM_ERROR_RATE
+        )
+
+    @staticmethod
+    def _tags(entries: Iterable[str]) -> list[str]:
+        tags = []
+        for entry in entries:
+            kind, _, value = entry.partition(":")
+            tag = session_tag if kind == "sid" else access_token_tag
+            tags.append(tag(value))
+        return tags
+
+    async def revoke(self, entries: dict[str, float]) -> None:
+        """Revoke each entry until its expiry; applies locally at once."""
+        if not entries:
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(self.key, entries, gt=True)
+            pipe.zremrangebyscore(self.key, "-inf", time.time())
+            for entry, expires_at in entries.items():
+                pipe.xadd(
+                    self.stream,
+                    {"entry": entry, "expires_at": expires_at},
+                    maxlen=RevocationConfig.STREAM_MAXLEN,
+                    approximate=True,
+                )
+            await pipe.execute()
+        self._apply(entries)
+
+    async def revoke_token(self, jti: str, expires_at: float) -> None:
+        await self.revoke({f"jti:{jti}": expires_at})
+
+    async def revoke_sessions(self, session_ids: Iterable[str]) -> None:
+        # Every access token of the session has expired by then
+        expires_at = time.time() + JWTConfig.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        await self.revoke({f"sid:{sid}": expires_at for sid in session_ids})
+
+    async def is_revoked(self, jti: str | None, session_id: str | None) -> bool:
+        """Raises RedisError only if a Redis confirmation was needed and failed."""
+        candidates = []
+        if jti:
+            candidates.append(f"jti:{jti}")
+        if session_id:
+            candidates.append(f"sid:{session_id}")
+        if self.synced:
+            candidates = [entry for entry in candidates if entry in self.bloom]
+        if not candidates:
+            return False
+
+        if self.synced:
+            self.bloom_hits += 1
+        expiries = await self.redis.zmscore(self.key, candidates)
+        now = time.time()
+        revoked = any(e is not None and e > now for e in expiries)
+        if self.synced and not revoked:
+            self.false_positives += 1
+        return revoked
+
+    def stats(self) -> dict:
+        return {
+            "synced": self.synced,
+            "entries": self.bloom.count,
+            "bloom_hits": self.bloom_hits,
+            "false_positives": self.false_positives,
+        }
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="revocation-sync")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.synced = False
+
+    def _apply(self, entries: Iterable[str]) -> None:
+        entries = list(entries)
+        for entry in entries:
+            self.bloom.add(entry)
+        self.bus.evict(self._tags(entries))
+
+    async def _reload(self) -> None:
+        """Rebuild the filter from the sorted set and resume the stream after it."""
+        # Stream position first: revocations racing the load are replayed
+        tail = await self.redis.xrevrange(self.stream, count=1)
+        last_id = tail[0][0] if tail else "0-0"
+        live = await self.redis.zrangebyscore(self.key, time.time(), "+inf")
+        bloom = self._new_bloom()
+        for entry in live:
+            bloom.add(entry)
+        self.bloom = bloom
+        self._last_id = last_id
+        self._rebuild_at = time.monotonic() + RevocationConfig.REBUILD_SECONDS
+        if not self.synced:
+            # Tokens verified while out of sync may have been revoked since
+            self.bus.evict(self._tags(live))
+            self.synced = True
+
+    async def _run(self) -> None:
+        backoff = RevocationConfig.RECONNECT_MIN_SECONDS
+        while True:
+            try:
+                await self._reload()
+                backoff = RevocationConfig.RECONNECT_MIN_SECONDS
+                await self._tail()
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError):
+                logger.warning(
+                    "Revocation sync failed; retrying in %.1fs", backoff, exc_info=True
+                )
+            self.synced = False
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, RevocationConfig.RECONNECT_MAX_SECONDS)
+
+    async def _tail(self) -> None:
+        while True:
+            if time.monotonic() >= self._rebuild_at:
+                await self._reload()
+            response = await self.redis.xread(
+                {self.stream: self._last_id},
+                count=1000,
+                block=RevocationConfig.SYNC_BLOCK_MS,
+            )
+            for _, messages in response or ():
+                for message_id, fields in messages:
+                    self._last_id = message_id
+                self._apply(fields["entry"] for _, fields in messages)
+
+
+revocation_list = RevocationList(
+    redis_tokens, RevocationConfig.KEY, RevocationConfig.STREAM, invalidation_bus
+)
+metrics.callback(
+    "token_revocation_synced",
+    "1 while the local Bloom filter is in sync with Redis.",
+    [],
+    lambda: [((), revocation_list.synced)],
+)
+metrics.callback(
+    "token_revocation_bloom_hits",
+    "Revocation checks that needed a Redis confirmation.",
+    [],
+    lambda: [((), revocation_list.bloom_hits)],
+    "counter",
+)
+metrics.callback(
+    "token_revocation_false_positives",
+    "Bloom hits that Redis showed were not revoked.",
+    [],
+    lambda: [((), revocation_list.false_positives)],
+    "counter",
+)
@@ -0,0 +1,72 @@
+import hashlib
+import logging
+import time
+
+from redis.exceptions import RedisError
+
+from app.config import TokenCacheConfig
+from app.infrastructure.data.invalidation_bus import (
+    access_token_tag,
+    invalidation_bus,
+    session_tag,
+    user_tag,
+)
+from app.infrastructure.data.local_lru_cache import LocalLRUCache
+from app.infrastructure.security.jwt import get_jwt_handler
+from app.infrastructure.security.revocation import revocation_list
+
+logger = logging.getLogger(__name__)
+
+# Access-token digest -> verified claims. Tagged by user, session and jti so
+# logout, revocations and user changes evict them in every worker.
+verified_token_cache = invalidation_bus.register(
+    LocalLRUCache(max_size=TokenCacheConfig.MAX_SIZE)
+)
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def verify_access_token(token: str) -> dict | None:
+    """
+    Claims of a valid, unrevoked access token, or None.
+
+    A cache hit skips the signature check and the revocation check. On a
+    miss the token is verified, neither it (``jti``) nor its session
+    (``sid``) may be revoked, and the claims are cached until ``exp``, at
+    most MAX_TTL_SECONDS. The revocation check is local unless the Bloom
+    filter reports a possible hit.
+    """
+    key = token_digest(token)
+    claims = verified_token_cache.get(key)
+    if claims is not None:
+        return claims
+
+    version = verified_token_cache.version
+    claims = get_jwt_handler().decode_token(token)
+    if not claims or claims.get("type") != "access":
+        return None
+
+    jti = claims.get("jti")
+    session_id = claims.get("sid")
+    try:
+        if await revocation_list.is_revoked(jti, session_id):
+            return None
+    except RedisError:
+        # Availability over strictness; not cached, so the check is retried
+        # on the next request.
+        logger.warning("Revocation check failed; accepting token", exc_info=True)
+        return claims
+    # Tokens issued before sessions and jti were added have neither; they
+    # expire within ACCESS_TOKEN_EXPIRE_MINUTES.
+    tags = [user_tag(claims.get("sub"))]
+    if session_id is not None:
+        tags.append(session_tag(session_id))
+    if jti is not None:
+        tags.append(access_token_tag(jti))
+
+    ttl = min(claims["exp"] - time.time(), TokenCacheConfig.MAX_TTL_SECONDS)
+    if ttl > 0:
+        verified_token_cache.set(key, claims, tags=tags, version=version, ttl=ttl)
+    return claims
@@ -0,0 +1,238 @@
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Protocol
+
+from app.config import TracingConfig
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    __slots__ = ("span_id", "parent_id", "name", "start", "duration", "attributes")
+
+    def __init__(self, name: str, parent_id: str | None, attributes: dict):
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.name = name
+        self.start = time.time()
+        self.duration = 0.0
+        self.attributes = attributes
+
+    def to_dict(self) -> dict:
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+        }
+
+
+class Trace:
+    """The spans of one request; the root span is the request itself."""
+
+    __slots__ = ("trace_id", "root", "spans", "dropped_spans")
+
+    def __init__(self, trace_id: str, name: str, attributes: dict):
+        self.trace_id = trace_id
+        self.root = Span(name, None, attributes)
+        self.spans: list[Span] = [self.root]
+        self.dropped_spans = 0
+
+    def add(self, span: Span) -> bool:
+        if len(self.spans) >= TracingConfig.MAX_SPANS:
+            self.dropped_spans += 1
+            return False
+        self.spans.append(span)
+        return True
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.root.name,
+            "start": self.root.start,
+            "duration_ms": round(self.root.duration * 1000, 3),
+            "dropped_spans": self.dropped_spans,
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+
+class TraceExporter(Protocol):
+    def export(self, trace: Trace) -> None: ...
+
+
+class RingBufferExporter:
+    """Keeps the last ``max_traces`` traces in memory for the admin endpoint."""
+
+    def __init__(self, max_traces: int):
+        self._traces: deque[Trace] = deque(maxlen=max_traces)
+
+    def export(self, trace: Trace) -> None:
+        self._traces.append(trace)
+
+    def recent(self, limit: int, min_duration_ms: float = 0) -> list[Trace]:
+        """Newest first, optionally only those at least ``min_duration_ms`` long."""
+        min_duration = min_duration_ms / 1000
+        traces = (t for t in reversed(self._traces) if t.root.duration >= min_duration)
+        return [t for t, _ in zip(traces, range(limit))]
+
+    def get(self, trace_id: str) -> Trace | None:
+        return next((t for t in self._traces if t.trace_id == trace_id), None)
+
+
+class JsonLinesExporter:
+    """Appends one JSON object per trace to ``path`` for offline analysis."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def export(self, trace: Trace) -> None:
+        try:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                # Line buffered: one small write per trace, readable while open
+                self._file = open(self.path, "a", buffering=1)
+            self._file.write(json.dumps(trace.to_dict(), default=str) + "\n")
+        except OSError:
+            logger.warning("Trace export to %s failed", self.path, exc_info=True)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_trace: ContextVar[Trace | None] = ContextVar("trace", default=None)
+_span: ContextVar[Span | None] = ContextVar("span", default=None)
+
+
+class Tracer:
+    """
+    Per-request traces propagated through contextvars.
+
+    Outside a sampled request ``span()`` costs one ContextVar lookup, so
+    instrumented code needs no checks of its own. Finished traces go to
+    every exporter.
+    """
+
+    def __init__(self, exporters: list[TraceExporter], sample_rate: float):
+        self.exporters = exporters
+        self.sample_rate = sample_rate
+
+    @contextmanager
+    def trace(self, name: str, trace_id: str | None = None, **attributes: Any):
+        """Root span of a request; yields the Trace, or None if not sampled."""
+        if not self.exporters or random.random() >= self.sample_rate:
+            yield None
+            return
+        trace = Trace(trace_id or uuid.uuid4().hex, name, attributes)
+        trace_token = _trace.set(trace)
+        span_token = _span.set(trace.root)
+        start = time.perf_counter()
+        try:
+            yield trace
+        finally:
+            trace.root.duration = time.perf_counter() - start
+            _span.reset(span_token)
+            _trace.reset(trace_token)
+            for exporter in self.exporters:
+                exporter.export(trace)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | None]:
+        trace = _trace.get()
+        if trace is None:
+            yield None
+            return
+        parent = _span.get()
+        span = Span(name, parent.span_id if parent else None, attributes)
+        if not trace.add(span):
+            yield None
+            return
+        token = _span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.attributes["error"] = type(e).__name__
+            raise
+        finally:
+            span.duration = time.perf_counter() - start
+            _span.reset(token)
+
+    def record_span(
+        self, name: str, start: float, duration: float, **attributes: Any
+    ) -> None:
+        """
+        Add an already finished leaf span under the current span, for
+        callbacks that see the start and the end separately (SQL events).
+        """
+        trace = _trace.get()
+        if trace is None:
+            return
+        parent = _span.get()
+        span = Span(name, parent.span_id if parent else None, attributes)
+        span.start = start
+        span.duration = duration
+        trace.add(span)
+
+    def shutdown(self) -> None:
+        for exporter in self.exporters:
+            close = getattr(exporter, "close", None)
+            if close is not None:
+                close()
+
+    def traced(self, name: str):
+        """Decorator wrapping an async function in a span."""
+
+        def decorator(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                if _trace.get() is None:
+                    return await fn(*args, **kwargs)
+                with self.span(name):
+                    return await fn(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def traced_methods(self, prefix: str):
+        """
+        Class decorator spanning every public async method as
+        ``<prefix>.<method>``, e.g. ``PropertyUsecase.add_property``.
+        """
+
+        def decorator(cls):
+            for attr, fn in list(vars(cls).items()):
+                if not attr.startswith("_") and inspect.iscoroutinefunction(fn):
+                    setattr(cls, attr, self.traced(f"{prefix}.{attr}")(fn))
+            return cls
+
+        return decorator
+
+
+def current_trace_id() -> str | None:
+    trace = _trace.get()
+    return trace.trace_id if trace else None
+
+
+ring_buffer = RingBufferExporter(TracingConfig.RING_BUFFER_SIZE)
+exporters: list[TraceExporter] = [ring_buffer]
+if TracingConfig.JSONL_PATH:
+    exporters.append(JsonLinesExporter(TracingConfig.JSONL_PATH))
+
+tracer = Tracer(exporters if TracingConfig.ENABLED else [], TracingConfig.SAMPLE_RATE)
+traced = tracer.traced
+traced_methods = tracer.traced_methods
@@ -1,11 +1,80 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
+from app.application.usecases.property_stats_usecase import (
+    refresh_property_quantiles,
+)
+from app.application.usecases.property_usecase import archive_inactive_properties
+from app.application.usecases.user_usecase import flush_user_activity
+from app.config import ActivityConfig, ArchiveConfig, ProfilingConfig, StatsConfig
+from app.infrastructure.background import PeriodicTask
+from app.infrastructure.data.invalidation_bus import invalidation_bus
+from app.infrastructure.data.redis_registry import redis_registry
+from app.infrastructure.security.bcrypt_hasher import hash_executor
+from app.infrastructure.security.revocation import revocation_list
+from app.infrastructure.tracing import tracer
+from app.presentation.middleware import (
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    QueryCountMiddleware,
+    TracingMiddleware,
+)
+from app.presentation.responses import FastJSONResponse
+from app.presentation.routes.admin_routes import adminRouter
 from app.presentation.routes.auth_routes import authRouter
+from app.presentation.routes.metrics_routes import metricsRouter
 from app.presentation.routes.property_routes import propertyRouter
 from app.presentation.routes.user_routes import userRouter
 
-app = FastAPI(debug=True)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    tasks = [
+        PeriodicTask(
+            "property-quantiles",
+            refresh_property_quantiles,
+            StatsConfig.QUANTILE_REFRESH_SECONDS,
+            run_on_start=True,
+        ),
+        PeriodicTask(
+            "property-archiver",
+            archive_inactive_properties,
+            ArchiveConfig.INTERVAL_SECONDS,
+        ),
+        PeriodicTask(
+            "user-activity-flush",
+            flush_user_activity,
+            ActivityConfig.FLUSH_INTERVAL_SECONDS,
+        ),
+    ]
+    await redis_registry.open()
+    invalidation_bus.start()
+    revocation_list.start()
+    for task in tasks:
+        task.start()
+    yield
+    for task in tasks:
+        await task.stop()
+    try:
+        # Whatever the last tick did not write
+        await flush_user_activity()
+    except Exception:
+        logger.exception("Final user activity flush failed")
+    await revocation_list.stop()
+    await invalidation_bus.stop()
+    await redis_registry.close()
+    hash_executor.shutdown()
+    tracer.shutdown()
+
+
+app = FastAPI(
+    debug=True, default_response_class=FastJSONResponse, lifespan=lifespan
+)
 
 origins = [
     "http://localhost:3000",
@@ -18,7 +87,16 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(QueryCountMiddleware)
+if ProfilingConfig.ENABLED:
+    # Inside tracing, so profiles are stored under the trace id
+    app.add_middleware(ProfilingMiddleware)
+app.add_middleware(TracingMiddleware)
+# Outermost, so the timing covers the whole stack
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(userRouter, prefix="/api", tags=["users"])
 app.include_router(propertyRouter, prefix="/api", tags=["properties"])
 app.include_router(authRouter, prefix="/api", tags=["Auth"])
+app.include_router(adminRouter, prefix="/api", tags=["admin"])
+app.include_router(metricsRouter)
@@ -0,0 +1,53 @@
+import hashlib
+
+from fastapi import Request, Response
+
+from app.config import HttpCacheConfig
+
+
+class CachePolicy:
+    """Cache-Control values per kind of route."""
+
+    # Per-user data: browsers may keep it but must revalidate with the ETag
+    # on every use; shared caches must not store it at all.
+    PRIVATE = "private, no-cache"
+    SEARCH = f"public, max-age={HttpCacheConfig.SEARCH_MAX_AGE_SECONDS}"
+    DETAIL = f"public, max-age={HttpCacheConfig.DETAIL_MAX_AGE_SECONDS}"
+    STATS = f"public, max-age={HttpCacheConfig.STATS_MAX_AGE_SECONDS}"
+
+
+def make_etag(*parts) -> str:
+    """
+    Weak ETag from the values a response is derived from.
+
+    Weak because it identifies the data, not the exact bytes.
+    """
+    digest = hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether If-None-Match names this ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def _headers(etag: str, cache_control: str) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if cache_control.startswith("private"):
+        headers["Vary"] = "Authorization"
+    return headers
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(status_code=304, headers=_headers(etag, cache_control))
+
+
+def with_cache_headers(response: Response, etag: str, cache_control: str) -> Response:
+    response.headers.update(_headers(etag, cache_control))
+    return response
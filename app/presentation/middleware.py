@@ -0,0 +1,207 @@
+import logging
+import random
+import time
+import uuid
+
+from app.config import ProfilingConfig, QueryCountConfig
+from app.infrastructure.data.query_counter import count_queries
+from app.infrastructure.metrics import metrics
+from app.infrastructure.profiling import profiler
+from app.infrastructure.security.token_verifier import verify_access_token
+from app.infrastructure.tracing import current_trace_id, tracer
+from app.presentation.routes.dependencies import ADMIN_ROLES
+
+logger = logging.getLogger(__name__)
+
+http_request_seconds = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method, route template and status class.",
+    ["method", "route", "status"],
+)
+http_request_queries = metrics.histogram(
+    "http_request_sql_queries",
+    "SQL statements per HTTP request by method and route template.",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware timing every HTTP request.
+
+    Labelled by the matched route template (``/api/users/{user_id}``), not
+    the raw path, and by status class, so series stay bounded; requests
+    that match no route share ``unmatched``.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            http_request_seconds.observe(
+                time.perf_counter() - start,
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                f"{status // 100}xx",
+            )
+
+
+class TracingMiddleware:
+    """
+    Pure ASGI middleware opening a trace per sampled HTTP request.
+
+    Spans opened further down (usecases, repositories, SQL, Elasticsearch,
+    Redis) attach to it through contextvars. The root span is renamed to
+    the matched route template once routing is done, and the trace id is
+    returned in ``X-Trace-Id`` to look the trace up at /api/admin/traces.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with tracer.trace(scope["method"], path=scope["path"]) as trace:
+            if trace is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    trace.root.attributes["status"] = message["status"]
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"x-trace-id", trace.trace_id.encode()),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                trace.root.name = (
+                    f"{scope['method']} {getattr(route, 'path', 'unmatched')}"
+                )
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware running the sampling profiler over a request.
+
+    A request is profiled if it falls in ``ProfilingConfig.SAMPLE_RATE`` or
+    sends ``X-Profile: 1`` with an admin's bearer token. Its collapsed
+    stacks are stored under the trace id (a fresh id when untraced), which
+    is returned in ``X-Profile-Id`` for GET /api/admin/profiles/{id}.
+    Unprofiled requests pay for one random draw and a header scan.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not await self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = current_trace_id() or uuid.uuid4().hex
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-profile-id", request_id.encode()),
+                ]
+            await send(message)
+
+        with profiler.profile(request_id, scope["method"]) as profile:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                profile.name = (
+                    f"{scope['method']} {getattr(route, 'path', 'unmatched')}"
+                )
+
+    @staticmethod
+    async def _wanted(scope) -> bool:
+        if random.random() < ProfilingConfig.SAMPLE_RATE:
+            return True
+        headers = dict(scope["headers"])
+        if headers.get(b"x-profile") != b"1":
+            return False
+        scheme, _, token = headers.get(b"authorization", b"").decode().partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        payload = await verify_access_token(token)
+        return bool(payload) and payload.get("role") in ADMIN_ROLES
+
+
+class QueryCountMiddleware:
+    """
+    Pure ASGI middleware counting the SQL statements of each HTTP request.
+
+    Counts feed a per-route histogram, and a statement repeated
+    ``N_PLUS_ONE_THRESHOLD`` times in one request is logged as a likely N+1.
+    With ``DEBUG_HEADERS`` the count and total SQL time are also returned
+    in ``X-SQL-Queries`` and ``X-SQL-Time-Ms``; those cover only what ran
+    before the response started.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as stats:
+
+            async def send_wrapper(message):
+                if (
+                    message["type"] == "http.response.start"
+                    and QueryCountConfig.DEBUG_HEADERS
+                ):
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"x-sql-queries", str(stats.count).encode()),
+                        (b"x-sql-time-ms", f"{stats.seconds * 1000:.2f}".encode()),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", "unmatched")
+                http_request_queries.observe(stats.count, scope["method"], route)
+                for statement, count in stats.repeated(
+                    QueryCountConfig.N_PLUS_ONE_THRESHOLD
+                ):
+                    logger.warning(
+                        "Possible N+1 in %s %s: statement ran %d times: %.200s",
+                        scope["method"],
+                        route,
+                        count,
+                        statement,
+                    )
@@ -0,0 +1,38 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+try:
+    import orjson
+except ImportError:  # optional speed-up for plain dict/list payloads
+    orjson = None
+
+
+def _has_models(content: Any) -> bool:
+    if isinstance(content, BaseModel):
+        return True
+    return isinstance(content, list) and bool(content) and isinstance(
+        content[0], BaseModel
+    )
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core, or orjson for plain data.
+
+    Routes that already hold validated response models should return them
+    wrapped in this class: FastAPI then skips the response_model
+    re-validation and jsonable_encoder pass, and the models are serialized
+    to bytes in a single pass in Rust.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None and not _has_models(content):
+            return orjson.dumps(
+                content,
+                default=to_jsonable_python,
+                option=orjson.OPT_NON_STR_KEYS,
+            )
+        return to_json(content)
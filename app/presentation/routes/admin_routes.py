@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.infrastructure.profiling import profile_store
+from app.infrastructure.tracing import ring_buffer
+from app.presentation.routes.dependencies import require_admin
+
+adminRouter = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
+
+
+@adminRouter.get("/traces")
+async def list_traces(
+    limit: int = Query(50, ge=1, le=500),
+    min_duration_ms: float = Query(0, ge=0),
+):
+    """Recent traces of this worker, newest first, without their spans."""
+    return [
+        {
+            "trace_id": trace.trace_id,
+            "name": trace.root.name,
+            "start": trace.root.start,
+            "duration_ms": round(trace.root.duration * 1000, 3),
+            "status": trace.root.attributes.get("status"),
+            "spans": len(trace.spans),
+        }
+        for trace in ring_buffer.recent(limit, min_duration_ms)
+    ]
+
+
+@adminRouter.get("/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    trace = ring_buffer.get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return trace.to_dict()
+
+
+@adminRouter.get("/profiles")
+async def list_profiles(limit: int = Query(50, ge=1, le=500)):
+    """Profiled requests of this worker, newest first."""
+    return [profile.summary() for profile in profile_store.recent(limit)]
+
+
+@adminRouter.get("/profiles/{request_id}", response_class=PlainTextResponse)
+async def get_profile(request_id: str):
+    """Collapsed stacks, ready for flamegraph.pl or speedscope."""
+    profile = profile_store.get(request_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(profile.collapsed())
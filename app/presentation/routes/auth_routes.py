@@ -1,16 +1,27 @@
 import logging
 
-from fastapi import APIRouter, Cookie, Depends, HTTPException, Response
+from fastapi import APIRouter, Cookie, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.usecases.auth_usecase import AuthUsecase
 from app.domain.errors import (
+    ExecutorOverloadedError,
+    RateLimitExceededError,
     UserNotFoundError,
     WrongCredentials,
 )
 from app.infrastructure.data.database import get_db
-from app.presentation.routes.dependencies import get_current_user
+from app.infrastructure.data.redis_refresh_token_client import (
+    RedisTokenService,
+    get_token_service,
+)
+from app.presentation.routes.dependencies import (
+    client_ip,
+    get_current_user,
+    too_many_requests,
+)
 from app.presentation.schemas.user_schema import (
+    SessionInfo,
     UserCredentials,
     loginresponse,
 )
@@ -22,11 +33,17 @@ logger = logging.getLogger(__name__)
 
 @authRouter.post("/login", response_model=loginresponse)
 async def login_user(
-    credential: UserCredentials, response: Response, db: AsyncSession = Depends(get_db)
+    credential: UserCredentials,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    tokens: RedisTokenService = Depends(get_token_service),
 ):
-    usecase = AuthUsecase(db=db)
+    usecase = AuthUsecase(db=db, tokens=tokens)
     try:
-        login_data = await usecase.login(user_cred=credential)
+        login_data = await usecase.login(
+            user_cred=credential, client_ip=client_ip(request)
+        )
 
         # Set refresh token in HttpOnly cookie
         response.set_cookie(
@@ -52,10 +69,16 @@ async def login_user(
             "access_token": login_data.access_token,
             "user": login_data.user,
         }
+    except RateLimitExceededError as e:
+        raise too_many_requests(e)
     except WrongCredentials:
         raise HTTPException(status_code=401, detail="Credentials mismatch")
     except UserNotFoundError:
         raise HTTPException(status_code=404, detail="User not found")
+    except ExecutorOverloadedError:
+        raise HTTPException(
+            status_code=503, detail="Server busy", headers={"Retry-After": "1"}
+        )
     except Exception:
         logger.exception("Error during login")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -65,14 +88,20 @@ async def login_user(
 async def logout_user(
     session_id: str = Cookie(None),
     sender=Depends(get_current_user),
+    tokens: RedisTokenService = Depends(get_token_service),
 ):
     if not session_id:
         raise HTTPException(status_code=401, detail="No session_id cookie found")
 
-    usecase = AuthUsecase(None)
+    usecase = AuthUsecase(None, tokens)
     print("sender__", sender)
     try:
-        await usecase.logout(sender["user_id"], session_id)
+        await usecase.logout(
+            sender["user_id"],
+            session_id,
+            access_jti=sender["jti"],
+            access_exp=sender["exp"],
+        )
     except Exception:
         logger.exception("Error during logout")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -85,17 +114,21 @@ async def refresh(
     response: Response,
     refresh_token: str = Cookie(default=None),
     session_id: str = Cookie(default=None),
+    tokens: RedisTokenService = Depends(get_token_service),
 ):
     if not session_id:
         raise HTTPException(status_code=401, detail="No session_id provided")
     if not refresh_token:
         raise HTTPException(status_code=401, detail="No refresh token provided")
 
-    usecase = AuthUsecase(None)
+    usecase = AuthUsecase(None, tokens)
     # verify and decode token
-    new_access, new_refresh = await usecase.get_fresh_tokens(
-        session_id=session_id, refresh_token=refresh_token
-    )
+    try:
+        new_access, new_refresh = await usecase.get_fresh_tokens(
+            session_id=session_id, refresh_token=refresh_token
+        )
+    except WrongCredentials:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
 
     # Set refresh token in HttpOnly cookie
     response.set_cookie(
@@ -117,3 +150,32 @@ async def refresh(
     )
 
     return {"access_token": new_access}
+
+
+@authRouter.get("/sessions", response_model=list[SessionInfo])
+async def list_sessions(
+    session_id: str = Cookie(None),
+    sender=Depends(get_current_user),
+    tokens: RedisTokenService = Depends(get_token_service),
+):
+    usecase = AuthUsecase(None, tokens)
+    sessions = await usecase.list_sessions(sender["user_id"])
+    return [
+        SessionInfo(**session, current=session["session_id"] == session_id)
+        for session in sessions
+    ]
+
+
+@authRouter.post("/logout-all")
+async def logout_all(
+    sender=Depends(get_current_user),
+    tokens: RedisTokenService = Depends(get_token_service),
+):
+    usecase = AuthUsecase(None, tokens)
+    try:
+        revoked = await usecase.logout_all(sender["user_id"])
+    except Exception:
+        logger.exception("Error during logout-all")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return {"detail": "Logged out everywhere", "sessions_revoked": revoked}
@@ -1,7 +1,11 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from app.infrastructure.security.jwt import JWTHandler
+from app.config import RateLimitConfig
+from app.domain.errors import RateLimitExceededError
+from app.infrastructure.data.activity_buffer import activity_buffer
+from app.infrastructure.security.rate_limiter import RateLimiter
+from app.infrastructure.security.token_verifier import verify_access_token
 
 # Create a reusable HTTPBearer security object
 security = HTTPBearer()
@@ -13,19 +17,66 @@ async def get_current_user(
     """
     Dependency to extract current user from Bearer token.
     Uses HTTPBearer to read the Authorization header.
+    Verified tokens are cached until they expire or their session is revoked.
     """
     token = credentials.credentials  # The actual JWT string
 
-    jwt_handler = JWTHandler()
-    payload = jwt_handler.decode_token(token)
-    if not payload or payload.get("type") != "access":
+    payload = await verify_access_token(token)
+    if not payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authorization Needed",
         )
 
+    activity_buffer.record_seen(int(payload["sub"]))
     return {
         "user_id": payload.get("sub"),
-        "role": payload.get("roles", "user"),
+        "role": payload.get("role", "user"),
         "user_type": payload.get("user_type", "tenant"),
+        "jti": payload.get("jti"),
+        "exp": payload.get("exp"),
     }
+
+
+ADMIN_ROLES = ("admin", "super_admin")
+
+
+async def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
+    if current_user["role"] not in ADMIN_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
+    return current_user
+
+
+def client_ip(request: Request) -> str:
+    """The caller's address, from X-Forwarded-For only behind a trusted proxy."""
+    if RateLimitConfig.TRUST_FORWARDED_FOR:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def too_many_requests(e: RateLimitExceededError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests",
+        headers={"Retry-After": str(e.retry_after)},
+    )
+
+
+def rate_limit(limiter: RateLimiter):
+    """
+    Dependency throttling a route per client IP, e.g.
+    ``dependencies=[Depends(rate_limit(search_limiter))]``.
+    """
+
+    async def check_rate_limit(request: Request) -> None:
+        try:
+            await limiter.hit(client_ip(request))
+        except RateLimitExceededError as e:
+            raise too_many_requests(e)
+
+    return check_rate_limit
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Response
+
+from app.infrastructure.metrics import metrics
+
+metricsRouter = APIRouter()
+
+
+@metricsRouter.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return Response(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -1,19 +1,30 @@
 from elasticsearch import AsyncElasticsearch
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 # from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.usecases.property_search_usecase import PropertySearchUsecase
+from app.application.usecases.property_stats_usecase import PropertyStatsUsecase
 from app.application.usecases.property_usecase import PropertyUsecase
 from app.infrastructure.data.database import get_db
 from app.infrastructure.search.elastic_client import get_es_client
-from app.presentation.routes.dependencies import get_current_user
+from app.infrastructure.security.rate_limiter import search_limiter
+from app.presentation.caching import (
+    CachePolicy,
+    etag_matches,
+    make_etag,
+    not_modified,
+    with_cache_headers,
+)
+from app.presentation.responses import FastJSONResponse
+from app.presentation.routes.dependencies import get_current_user, rate_limit
 from app.presentation.schemas.property_schema import (
     PropertyBase,
     PropertyResponse,
     PropertySearchParams,
     PropertySearchResult,
+    PropertyStatsResponse,
 )
 
 propertyRouter = APIRouter()
@@ -28,29 +39,34 @@ async def add_property(
     property.posted_by = int(sender["user_id"])
     usecase = PropertyUsecase(db)
     res = await usecase.add_property(property)
-    amenities = [a.name for a in res.amenities] if res.amenities else []
-    res.amenities = []
-    response = PropertyResponse.model_validate(res)
-    response.amenities = amenities
-    return response
+    return FastJSONResponse(PropertyResponse.model_validate(res))
 
 
 @propertyRouter.get("/properties/me", response_model=list[PropertyResponse])
 async def get_my_properties(
+    request: Request,
+    include_archived: bool = Query(
+        False, description="Also return sold/rented listings moved to the archive"
+    ),
     db: AsyncSession = Depends(get_db),
     sender=Depends(get_current_user),
 ):
     usecase = PropertyUsecase(db)
-    properties = await usecase.get_properties_by_user(int(sender["user_id"]))
-    result = []
-    for property in properties:
-        amenities = [a.name for a in property.amenities] if property.amenities else []
-        property.amenities = []
-        temp = PropertyResponse.model_validate(property)
-        temp.amenities = amenities
-        result.append(temp)
+    user_id = int(sender["user_id"])
+    # Answer revalidations from an aggregate before loading any rows
+    fingerprint = await usecase.get_properties_fingerprint(user_id, include_archived)
+    etag = make_etag("properties/me", user_id, include_archived, *fingerprint)
+    if etag_matches(request, etag):
+        return not_modified(etag, CachePolicy.PRIVATE)
 
-    return result
+    properties = await usecase.get_properties_by_user(user_id, include_archived)
+    return with_cache_headers(
+        FastJSONResponse(
+            [PropertyResponse.model_validate(property) for property in properties]
+        ),
+        etag,
+        CachePolicy.PRIVATE,
+    )
 
 
 @propertyRouter.get("/properties", response_model=list[PropertyResponse])
@@ -59,26 +75,70 @@ async def get_all_properties(
 ):
     usecase = PropertyUsecase(db)
     properties = await usecase.get_all_properties()
-    result = []
-    for property in properties:
-        amenities = [a.name for a in property.amenities] if property.amenities else []
-        property.amenities = []
-        temp = PropertyResponse.model_validate(property)
-        temp.amenities = amenities
-        result.append(temp)
+    return FastJSONResponse(
+        [PropertyResponse.model_validate(property) for property in properties]
+    )
+
 
-    return result
+@propertyRouter.get(
+    "/properties/stats",
+    response_model=PropertyStatsResponse,
+    summary="Listing counts and price statistics",
+)
+async def get_property_stats(request: Request, db: AsyncSession = Depends(get_db)):
+    usecase = PropertyStatsUsecase(db)
+    stats = await usecase.get_stats()
+    etag = make_etag("properties/stats", stats.model_dump_json())
+    if etag_matches(request, etag):
+        return not_modified(etag, CachePolicy.STATS)
+    return with_cache_headers(FastJSONResponse(stats), etag, CachePolicy.STATS)
 
 
 @propertyRouter.get(
     "/properties/search",
     response_model=PropertySearchResult,
     summary="Full-text and filtered search for properties",
+    dependencies=[Depends(rate_limit(search_limiter))],
 )
 async def search_properties(
+    request: Request,
     params: PropertySearchParams = Depends(),
     es_client: AsyncElasticsearch = Depends(get_es_client),
+    db: AsyncSession = Depends(get_db),
 ):
-    search_usecase = PropertySearchUsecase(es_client)
+    search_usecase = PropertySearchUsecase(es_client, db)
     result = await search_usecase.search(params)
-    return result
+    # A page is identified by the query, the total and each hit's version
+    etag = make_etag(
+        "properties/search",
+        params.model_dump_json(),
+        result.total,
+        *((item.id, item.updated_at or item.created_at) for item in result.items),
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag, CachePolicy.SEARCH)
+    return with_cache_headers(FastJSONResponse(result), etag, CachePolicy.SEARCH)
+
+
+# Declared last so the literal /properties/... paths above match first
+@propertyRouter.get(
+    "/properties/{property_id}",
+    response_model=PropertyResponse,
+    summary="Property detail",
+)
+async def get_property(
+    property_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    usecase = PropertyUsecase(db)
+    payload = await usecase.get_property_json(property_id)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Property not found")
+    etag = make_etag("properties", property_id, payload)
+    if etag_matches(request, etag):
+        return not_modified(etag, CachePolicy.DETAIL)
+    # Cached payload is already PropertyResponse JSON; send it as is
+    return with_cache_headers(
+        Response(payload, media_type="application/json"), etag, CachePolicy.DETAIL
+    )
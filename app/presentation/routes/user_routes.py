@@ -1,17 +1,29 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
 from app.application.usecases.user_usecase import UserUsecase
 from app.domain.errors import (
     EmailAlreadyExistsError,
+    ExecutorOverloadedError,
     UsernameAlreadyExistsError,
     UserNotFoundError,
 )
 from app.infrastructure.data.database import get_db
-from app.presentation.routes.dependencies import get_current_user
+from app.presentation.caching import (
+    CachePolicy,
+    etag_matches,
+    make_etag,
+    not_modified,
+    with_cache_headers,
+)
+from app.presentation.responses import FastJSONResponse
+from app.presentation.routes.dependencies import ADMIN_ROLES, get_current_user
 from app.presentation.schemas.user_schema import (
+    TotalMode,
     UserCreate,
     UserList,
     UserRead,
@@ -32,37 +44,73 @@ async def create_user(user_create: UserCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Email already exists")
     except UsernameAlreadyExistsError:
         raise HTTPException(status_code=400, detail="Username already exists")
+    except ExecutorOverloadedError:
+        raise HTTPException(
+            status_code=503, detail="Server busy", headers={"Retry-After": "1"}
+        )
     except Exception:
         logger.exception("Error creating user")
         raise HTTPException(status_code=500, detail="Internal server error")
-    return UserRead.model_validate(user)
+    return FastJSONResponse(UserRead.model_validate(user))
 
 
 # Get user by ID
 @userRouter.get("/users/{user_id}", response_model=UserRead)
 async def get_user(
-    user_id: int, db: Session = Depends(get_db), sender=Depends(get_current_user)
+    user_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    sender=Depends(get_current_user),
 ):
     usecase = UserUsecase(db)
     user = await usecase.get_user(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return UserRead.model_validate(user)
+    # Activity timestamps are written without touching updated_at
+    etag = make_etag(
+        "users",
+        user.id,
+        user.updated_at,
+        user.created_at,
+        user.last_login,
+        user.last_seen_at,
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag, CachePolicy.PRIVATE)
+    return with_cache_headers(
+        FastJSONResponse(UserRead.model_validate(user)), etag, CachePolicy.PRIVATE
+    )
 
 
 # List users
 @userRouter.get("/users/", response_model=UserList)
 async def list_users(
-    skip: int = 0,
+    after: Optional[int] = Query(
+        None, description="next_cursor of the previous page; omit for the first"
+    ),
     limit: int = 100,
+    total: TotalMode = "auto",
+    skip: int = Query(0, deprecated=True, description="Use after instead"),
     db: Session = Depends(get_db),
     sender=Depends(get_current_user),
 ):
     if skip < 0 or limit <= 0:
         raise HTTPException(status_code=400, detail="Invalid pagination parameters")
     usecase = UserUsecase(db)
-    users = await usecase.list_users(skip, limit)
-    return UserList(users=[UserRead.model_validate(u) for u in users], total=len(users))
+    if skip and after is None:
+        users = await usecase.list_users(skip, limit)
+        next_cursor = users[-1].id if len(users) == limit else None
+    else:
+        users, next_cursor = await usecase.list_users_page(after, limit)
+    count, is_estimate = await usecase.count_users(total)
+    return FastJSONResponse(
+        UserList(
+            users=[UserRead.model_validate(u) for u in users],
+            total=count,
+            total_is_estimate=is_estimate,
+            next_cursor=next_cursor,
+        )
+    )
 
 
 # Update user
@@ -73,6 +121,12 @@ async def update_user(
     db: Session = Depends(get_db),
     sender=Depends(get_current_user),
 ):
+    is_admin = sender["role"] in ADMIN_ROLES
+    if int(sender["user_id"]) != user_id and not is_admin:
+        raise HTTPException(status_code=403, detail="Not allowed to update this user")
+    # Roles gate the admin endpoints, so they are never self-assigned
+    if "role" in user_update.model_fields_set and not is_admin:
+        raise HTTPException(status_code=403, detail="Only admins can change roles")
     usecase = UserUsecase(db)
     try:
         user = await usecase.update_user_by_id(user_id, user_update)
@@ -82,10 +136,14 @@ async def update_user(
         raise HTTPException(status_code=400, detail="Email already exists")
     except UsernameAlreadyExistsError:
         raise HTTPException(status_code=400, detail="Username already exists")
+    except ExecutorOverloadedError:
+        raise HTTPException(
+            status_code=503, detail="Server busy", headers={"Retry-After": "1"}
+        )
     except Exception:
         logger.exception("Error updating user")
         raise HTTPException(status_code=500, detail="Internal server error")
-    return UserRead.model_validate(user)
+    return FastJSONResponse(UserRead.model_validate(user))
 
 
 # Delete user
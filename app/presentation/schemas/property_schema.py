@@ -173,3 +173,51 @@ class PropertySearchResult(BaseModel):
     total: int
     page: int
     per_page: int
+
+
+class CityPriceStats(BaseModel):
+    city: str
+    listing_count: int
+    avg_price: float | None = None
+    avg_price_per_sqft: float | None = None
+    p25_price: float | None = None
+    median_price: float | None = None
+    p75_price: float | None = None
+    median_price_per_sqft: float | None = None
+
+
+class PropertyStatsResponse(BaseModel):
+    total: int
+    by_city: dict[str, int]
+    by_type: dict[str, int]
+    by_status: dict[str, int]
+    avg_price_per_sqft: float | None = None
+    median_price_per_sqft: float | None = None
+    cities: list[CityPriceStats]
+    quantiles_computed_at: datetime | None = None
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "total": 3,
+                "by_city": {"Springfield": 3},
+                "by_type": {"house": 2, "condo": 1},
+                "by_status": {"available": 2, "sold": 1},
+                "avg_price_per_sqft": 125.0,
+                "median_price_per_sqft": 120.0,
+                "cities": [
+                    {
+                        "city": "Springfield",
+                        "listing_count": 3,
+                        "avg_price": 250000.0,
+                        "avg_price_per_sqft": 125.0,
+                        "p25_price": 200000.0,
+                        "median_price": 250000.0,
+                        "p75_price": 300000.0,
+                        "median_price_per_sqft": 120.0,
+                    }
+                ],
+                "quantiles_computed_at": "2025-01-01T12:00:00Z",
+            }
+        }
+    )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
@@ -29,7 +29,6 @@ class UserBase(BaseModel):
     bio: Optional[str] = Field(None, max_length=500)
     avatar_url: Optional[str] = None
     user_type: UserType
-    role: UserRole = UserRole.USER
 
     model_config = ConfigDict(
         extra="forbid",
@@ -44,7 +43,6 @@ class UserBase(BaseModel):
                 "bio": "This is an example bio.",
                 "avatar_url": "https://example.com/avatar.png",
                 "user_type": "tenant",
-                "role": "user",
             }
         },
     )
@@ -96,6 +94,7 @@ class UserUpdate(PasswordMixin):
     bio: Optional[str] = Field(None, max_length=500)
     avatar_url: Optional[str] = None
     user_type: Optional[UserType] = None
+    # Only admins may set it; signups always get UserRole.USER
     role: Optional[UserRole] = None
     password: Optional[str] = None
 
@@ -112,11 +111,13 @@ class UserUpdate(PasswordMixin):
 # --------------------------
 class UserRead(UserBase):
     id: int
+    role: Optional[UserRole]
     is_active: bool
     is_verified: bool
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
     last_login: Optional[datetime]
+    last_seen_at: Optional[datetime]
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -138,20 +139,31 @@ class UserRead(UserBase):
                 "created_at": "2025-01-01T12:00:00Z",
                 "updated_at": "2025-01-02T12:00:00Z",
                 "last_login": "2025-01-03T12:00:00Z",
+                "last_seen_at": "2025-01-03T12:30:00Z",
             }
         },
     )
 
 
+# How UserList.total is computed: an exact count(*), the planner's estimate
+# from pg_class.reltuples, or exact only while the table is small
+TotalMode = Literal["exact", "estimate", "auto"]
+
+
 class UserList(BaseModel):
     users: List[UserRead]
     total: int
+    total_is_estimate: bool = False
+    # Pass as ?after= to fetch the next page; null on the last page
+    next_cursor: Optional[int] = None
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "users": [get_nested_example(UserRead)],
                 "total": 1,
+                "total_is_estimate": False,
+                "next_cursor": None,
             }
         }
     )
@@ -179,6 +191,24 @@ class loginresponse(BaseModel):
     )
 
 
+class SessionInfo(BaseModel):
+    session_id: str
+    created_at: datetime
+    refreshed_at: datetime
+    current: bool = False
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "session_id": "3f0c9a56-8d1e-4b8e-9a43-1c2f5d7e8b90",
+                "created_at": "2025-01-03T12:00:00Z",
+                "refreshed_at": "2025-01-03T12:15:00Z",
+                "current": True,
+            }
+        }
+    )
+
+
 class UserCredentials(BaseModel):
     email: EmailStr
     password: str = Field(..., min_length=8, max_length=72)
@@ -0,0 +1,67 @@
+"""
+bcrypt hash time per cost factor on this machine.
+
+Times bcrypt.hashpw for each cost in the range and suggests the highest cost
+whose median stays within --budget-ms, the time one login may spend hashing.
+Set the result as BCRYPT_ROUNDS; existing hashes are upgraded on next login.
+Run it on the production hardware, on an otherwise idle machine.
+
+    python -m benchmarks.bcrypt_cost --min 10 --max 14 --budget-ms 250
+"""
+
+import argparse
+import statistics
+import time
+
+import bcrypt
+
+from app.config import PasswordHashConfig
+
+PASSWORD = b"BcryptCost1!"
+
+
+def time_cost(rounds: int, samples: int) -> list[float]:
+    salt = bcrypt.gensalt(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        bcrypt.hashpw(PASSWORD, salt)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--min", type=int, default=10)
+    parser.add_argument("--max", type=int, default=14)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=250)
+    args = parser.parse_args()
+
+    print(f"{'cost':>4} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+    suggested = None
+    for rounds in range(args.min, args.max + 1):
+        timings = time_cost(rounds, args.samples)
+        median = statistics.median(timings)
+        marker = "  <- configured" if rounds == PasswordHashConfig.BCRYPT_ROUNDS else ""
+        print(
+            f"{rounds:>4} {median:>10.1f} {min(timings):>8.1f} "
+            f"{max(timings):>8.1f}{marker}"
+        )
+        if median <= args.budget_ms:
+            suggested = rounds
+        else:
+            # Each step doubles the work; higher costs only get slower
+            break
+
+    if suggested is None:
+        print(f"\nEven cost {args.min} exceeds {args.budget_ms:.0f} ms")
+    else:
+        print(
+            f"\nSuggested BCRYPT_ROUNDS={suggested} "
+            f"(budget {args.budget_ms:.0f} ms per hash)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Synthetic dataset shared by the benchmark and plan-check scripts.
+
+Everything is generated server-side with generate_series, so seeding a few
+hundred thousand rows takes seconds. Callers seed inside a transaction they
+roll back afterwards; nothing is left behind in the target database.
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+CITIES = [
+    "Dhaka", "Chittagong", "Khulna", "Rajshahi", "Sylhet", "Barisal", "Rangpur",
+    "Comilla", "Gazipur", "Narayanganj", "Mymensingh", "Bogra", "Jessore",
+    "Dinajpur", "Cox's Bazar", "Tangail", "Pabna", "Noakhali", "Feni", "Kushtia",
+    "Springfield", "Riverside", "Franklin", "Greenville", "Bristol", "Clinton",
+    "Fairview", "Salem", "Madison", "Georgetown", "Arlington", "Ashland",
+    "Burlington", "Manchester", "Milton", "Newport", "Oxford", "Dover", "Hudson",
+    "Kingston", "Lexington", "Marion", "Oakland", "Jackson", "Auburn", "Dayton",
+    "Lebanon", "Shelby", "Troy", "Winchester",
+]
+
+AMENITIES = [
+    "pool", "garage", "garden", "gym", "elevator", "balcony", "fireplace",
+    "security", "generator", "rooftop", "playground", "laundry", "storage",
+    "wifi", "parking", "terrace", "intercom", "cctv", "lift", "servant room",
+]
+
+
+@dataclass
+class Dataset:
+    users: int
+    properties: int
+    first_user_id: int
+    first_property_id: int
+    sample_city: str = CITIES[0]
+
+    @property
+    def sample_email(self) -> str:
+        return f"bench_user_{self.users // 2}@example.com"
+
+    @property
+    def sample_username(self) -> str:
+        return f"bench_user_{self.users // 2}"
+
+    @property
+    def busy_owner_id(self) -> int:
+        # Owners are assigned round-robin, so every user owns a few listings
+        return self.first_user_id + 1
+
+
+async def seed(
+    conn: AsyncConnection,
+    users: int = 5_000,
+    properties: int = 50_000,
+    available_ratio: float = 0.3,
+) -> Dataset:
+    """Insert synthetic users, amenities, properties and links, then ANALYZE."""
+    first_user_id = (
+        await conn.execute(
+            text(
+                """
+                WITH inserted AS (
+                INSERT INTO users (
+                    email, username, hashed_password, user_type, role,
+                    is_active, is_verified, first_name, last_name, created_at
+                )
+                SELECT
+                    'bench_user_' || g || '@example.com',
+                    'bench_user_' || g,
+                    'x',
+                    (ARRAY['tenant', 'landlord', 'agent'])[1 + g % 3]::usertype,
+                    'user'::userrole,
+                    true,
+                    false,
+                    'Bench',
+                    'User ' || g,
+                    now() - make_interval(mins => g)
+                FROM generate_series(1, CAST(:users AS int)) AS g
+                RETURNING id
+                )
+                SELECT min(id) FROM inserted
+                """
+            ),
+            {"users": users},
+        )
+    ).scalar_one()
+
+    await conn.execute(
+        text(
+            """
+            INSERT INTO amenities (name)
+            SELECT unnest(CAST(:names AS text[]))
+            ON CONFLICT (name) DO NOTHING
+            """
+        ),
+        {"names": AMENITIES},
+    )
+
+    first_property_id = (
+        await conn.execute(
+            text(
+                """
+                WITH inserted AS (
+                INSERT INTO properties (
+                    posted_by, title, description, address, city, state,
+                    zip_code, country, price, property_type, status, bedrooms,
+                    bathrooms, area_sqft, lot_size_sqft, parking_spaces,
+                    year_built, created_at, updated_at, is_featured, image_urls
+                )
+                SELECT
+                    CAST(:first_user_id AS int) + (g % CAST(:users AS int)),
+                    'Listing ' || g || ' in ' || city,
+                    'Spacious ' || (1 + g % 5) || ' bedroom home near the '
+                        || (ARRAY['park', 'river', 'market', 'school', 'station'])[1 + g % 5]
+                        || ' with plenty of natural light.',
+                    (g % 900 + 1) || ' Main Street',
+                    city,
+                    'State ' || (g % 20),
+                    lpad((g % 99999)::text, 5, '0'),
+                    'Bangladesh',
+                    round((20000 + random() * 980000)::numeric, 2),
+                    (ARRAY['house', 'apartment', 'condo', 'townhouse', 'land', 'other'])
+                        [1 + g % 6]::propertytype,
+                    CASE
+                        WHEN random() < :available_ratio THEN 'available'
+                        WHEN random() < 0.5 THEN 'sold'
+                        ELSE 'rented'
+                    END::propertystatus,
+                    1 + g % 5,
+                    1 + (g % 3) * 0.5,
+                    400 + random() * 3600,
+                    CASE WHEN g % 4 = 0 THEN 1000 + random() * 9000 END,
+                    g % 3,
+                    1950 + g % 75,
+                    now() - make_interval(secs => random() * 31536000),
+                    now() - make_interval(secs => random() * 31536000),
+                    g % 50 = 0,
+                    '[]'::json
+                FROM (
+                    SELECT
+                        g,
+                        (CAST(:cities AS text[]))[1 + floor(power(random(), 2) * :n_cities)::int]
+                            AS city
+                    FROM generate_series(1, CAST(:properties AS int)) AS g
+                ) AS src
+                RETURNING id
+                )
+                SELECT min(id) FROM inserted
+                """
+            ),
+            {
+                "first_user_id": first_user_id,
+                "users": users,
+                "properties": properties,
+                "available_ratio": available_ratio,
+                "cities": CITIES,
+                "n_cities": len(CITIES),
+            },
+        )
+    ).scalar_one()
+
+    await conn.execute(
+        text(
+            """
+            INSERT INTO property_amenities (property_id, amenity_id)
+            SELECT p.id, a.id
+            FROM properties AS p
+            JOIN amenities AS a ON a.name = ANY(CAST(:names AS text[]))
+            WHERE p.id >= :first_property_id
+              AND (p.id + a.id) % 4 = 0
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"names": AMENITIES, "first_property_id": first_property_id},
+    )
+
+    await conn.execute(text("ANALYZE users, amenities, properties, property_amenities"))
+
+    return Dataset(
+        users=users,
+        properties=properties,
+        first_user_id=first_user_id,
+        first_property_id=first_property_id,
+    )
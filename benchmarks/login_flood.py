@@ -0,0 +1,132 @@
+"""
+Search latency during a login flood.
+
+Against a running server, a probe requests /api/properties/search back to
+back in two phases. The first phase runs the probe alone. The second runs it
+while --concurrency clients hammer /api/auth/login. Latency percentiles are
+reported per phase.
+
+bcrypt now runs on its own bounded executor, so the probe's p95 should
+stay close to the baseline. When bcrypt ran on the event loop, each login
+stalled every in-flight request for a full hash. Logins rejected with 503
+(hash queue full) are counted separately.
+
+Login and search are rate limited. Raise LOGIN_IP_LIMIT, LOGIN_EMAIL_LIMIT
+and SEARCH_RATE_LIMIT on the server for this run, or most requests will be
+429s that never reach bcrypt.
+
+The login account is created through /api/users/signup if it does not
+exist yet.
+
+    python -m benchmarks.login_flood --base-url http://localhost:8000 \
+        --seconds 10 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import aiohttp
+
+EMAIL = "login_flood@example.com"
+PASSWORD = "LoginFlood1!"
+
+
+def _pct(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def _ensure_user(session: aiohttp.ClientSession, base_url: str) -> None:
+    payload = {
+        "email": EMAIL,
+        "username": "login_flood",
+        "first_name": "Login",
+        "last_name": "Flood",
+        "user_type": "tenant",
+        "password": PASSWORD,
+    }
+    async with session.post(f"{base_url}/api/users/signup", json=payload) as res:
+        # 400 means the account is already there from an earlier run
+        if res.status not in (200, 400):
+            raise RuntimeError(f"signup failed: {res.status} {await res.text()}")
+
+
+async def _probe(
+    session: aiohttp.ClientSession, base_url: str, stop: asyncio.Event
+) -> list[float]:
+    timings = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        async with session.get(
+            f"{base_url}/api/properties/search", params={"per_page": "10"}
+        ) as res:
+            await res.read()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def _login_loop(
+    session: aiohttp.ClientSession,
+    base_url: str,
+    stop: asyncio.Event,
+    outcomes: Counter,
+) -> None:
+    while not stop.is_set():
+        async with session.post(
+            f"{base_url}/api/auth/login", json={"email": EMAIL, "password": PASSWORD}
+        ) as res:
+            await res.read()
+            outcomes[res.status] += 1
+
+
+async def _phase(
+    session: aiohttp.ClientSession, base_url: str, seconds: float, concurrency: int
+) -> tuple[list[float], Counter]:
+    stop = asyncio.Event()
+    outcomes: Counter = Counter()
+    probe = asyncio.create_task(_probe(session, base_url, stop))
+    flood = [
+        asyncio.create_task(_login_loop(session, base_url, stop, outcomes))
+        for _ in range(concurrency)
+    ]
+    await asyncio.sleep(seconds)
+    stop.set()
+    timings = await probe
+    await asyncio.gather(*flood)
+    return timings, outcomes
+
+
+async def run(base_url: str, seconds: float, concurrency: int) -> None:
+    connector = aiohttp.TCPConnector(limit=concurrency + 4)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await _ensure_user(session, base_url)
+        # Warm up connections and caches
+        await _phase(session, base_url, 1, 0)
+
+        print(
+            f"{'phase':<10} {'probes':>7} {'p50 ms':>8} {'p95 ms':>8} "
+            f"{'max ms':>8}  logins"
+        )
+        for name, clients in (("baseline", 0), ("flood", concurrency)):
+            timings, outcomes = await _phase(session, base_url, seconds, clients)
+            print(
+                f"{name:<10} {len(timings):>7} {statistics.median(timings):>8.1f} "
+                f"{_pct(timings, 0.95):>8.1f} {max(timings):>8.1f}  "
+                f"{dict(outcomes) or '-'}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url.rstrip("/"), args.seconds, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
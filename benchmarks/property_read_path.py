@@ -0,0 +1,103 @@
+"""
+Rows/sec of the property read path: ORM entities vs column projection.
+
+"before" is the old route code: select(Property) + selectinload(amenities),
+clearing ``property.amenities`` on the ORM instance, model_validate and
+patching the names back in. "after" is PropertyRepository's projection rows
+validated straight into PropertyResponse. Runs on a seeded dataset inside a
+transaction that is rolled back.
+
+    python -m benchmarks.property_read_path --properties 20000 --runs 5
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from app.config import DatabaseConfig
+from app.infrastructure.data.models.property_model import Property
+from app.infrastructure.repositories.property_repo import PropertyRepository
+from app.presentation.schemas.property_schema import PropertyResponse
+from benchmarks.dataset import seed
+
+
+async def orm_path(db: AsyncSession, owner_id: int | None) -> list[PropertyResponse]:
+    stmt = select(Property).options(selectinload(Property.amenities))
+    if owner_id is not None:
+        stmt = stmt.where(Property.posted_by == owner_id)
+    properties = (await db.execute(stmt)).scalars().all()
+    result = []
+    for property in properties:
+        amenities = [a.name for a in property.amenities] if property.amenities else []
+        property.amenities = []
+        temp = PropertyResponse.model_validate(property)
+        temp.amenities = amenities
+        result.append(temp)
+    return result
+
+
+async def row_path(db: AsyncSession, owner_id: int | None) -> list[PropertyResponse]:
+    repo = PropertyRepository(db)
+    if owner_id is None:
+        rows = await repo.get_all_property_rows()
+    else:
+        rows = await repo.get_property_rows_by_user(owner_id)
+    return [PropertyResponse.model_validate(row) for row in rows]
+
+
+async def _measure(conn: AsyncConnection, path, owner_id: int | None, runs: int):
+    rows = 0
+    elapsed = 0.0
+    for _ in range(runs):
+        # Fresh session per run, like one per request; never committed
+        session = AsyncSession(
+            bind=conn, join_transaction_mode="create_savepoint", autoflush=False
+        )
+        start = time.perf_counter()
+        rows += len(await path(session, owner_id))
+        elapsed += time.perf_counter() - start
+        await session.close()
+    return rows / elapsed, elapsed / runs * 1000
+
+
+async def run(users: int, properties: int, runs: int) -> None:
+    engine = create_async_engine(DatabaseConfig.get_url())
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        try:
+            dataset = await seed(conn, users=users, properties=properties)
+            scenarios = {
+                "all properties": None,
+                "one owner": dataset.busy_owner_id,
+            }
+            print(f"{'scenario':<16} {'path':<6} {'rows/s':>12} {'ms/call':>10}")
+            for name, owner_id in scenarios.items():
+                results = {}
+                for label, path in (("orm", orm_path), ("rows", row_path)):
+                    # One warm-up call so both paths start with a hot cache
+                    await _measure(conn, path, owner_id, 1)
+                    results[label] = await _measure(conn, path, owner_id, runs)
+                    rate, latency = results[label]
+                    print(f"{name:<16} {label:<6} {rate:>12,.0f} {latency:>10.2f}")
+                speedup = results["rows"][0] / results["orm"][0]
+                print(f"{name:<16} speedup x{speedup:.2f}")
+        finally:
+            await outer.rollback()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--properties", type=int, default=20_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.users, args.properties, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+SQL statement budgets per route, to catch N+1 regressions in CI.
+
+Each route is called in-process against a seeded dataset and must run at
+most its budgeted number of statements (see BUDGETS). Statements are
+counted by the app engine's cursor events, so every session here is bound
+to a connection of that engine, inside a transaction that is rolled back.
+The caller is a seeded user, so no login or token is needed. Exits 1 if
+any route is over budget, listing the statements it ran.
+
+Caches in front of the database (property details, amenity ids) only lower
+the counts, so budgets hold with or without Redis.
+
+    python -m benchmarks.query_budget --properties 2000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.application.usecases import property_usecase
+from app.infrastructure.data.database import async_session, engine, get_db
+from app.infrastructure.data.query_counter import QueryBudgetExceeded, query_budget
+from app.main import app
+from app.presentation.routes.dependencies import get_current_user
+from app.presentation.schemas.property_schema import PropertyBase
+from benchmarks.dataset import Dataset, seed
+
+# (method, path, body, max statements); {user_id} and {property_id} are
+# filled in from the dataset
+BUDGETS = [
+    # Owner fingerprint, then the rows with their amenities aggregated
+    ("GET", "/api/properties/me", None, 2),
+    ("GET", "/api/properties", None, 1),
+    ("GET", "/api/properties/{property_id}", None, 1),
+    ("GET", "/api/users/{user_id}", None, 1),
+    # Amenity lookup and upsert, property, amenity links, stats counter and
+    # the response row; a link or amenity query per amenity is an N+1
+    (
+        "POST",
+        "/api/properties/add",
+        {
+            **PropertyBase.model_config["json_schema_extra"]["example"],
+            "amenities": ["pool", "garden", "query budget amenity"],
+        },
+        6,
+    ),
+]
+
+
+async def call(method: str, path: str, body: dict | None) -> int:
+    """Run one request through the app in this task; returns the status."""
+    payload = json.dumps(body).encode() if body is not None else b""
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 0),
+        "server": ("testserver", 80),
+    }
+    messages = [{"type": "http.request", "body": payload, "more_body": False}]
+    status = 0
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def override_dependencies(conn: AsyncConnection, dataset: Dataset) -> None:
+    def session() -> AsyncSession:
+        # Commits inside the routes release a savepoint (not counted); the
+        # outer transaction is still rolled back
+        return AsyncSession(
+            bind=conn, join_transaction_mode="create_savepoint", autoflush=False
+        )
+
+    async def request_session():
+        async with session() as db:
+            yield db
+
+    async def caller():
+        return {
+            "user_id": str(dataset.busy_owner_id),
+            "role": "user",
+            "user_type": "landlord",
+            "jti": None,
+            "exp": None,
+        }
+
+    app.dependency_overrides[get_db] = request_session
+    app.dependency_overrides[get_current_user] = caller
+    # Shared cache fills open their own session rather than the request's
+    property_usecase.async_session = session
+
+
+async def run(users: int, properties: int) -> bool:
+    # The app engine echoes every statement, which would bury the report
+    engine.sync_engine.echo = False
+    passed = True
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        try:
+            dataset = await seed(conn, users=users, properties=properties)
+            override_dependencies(conn, dataset)
+            print(f"{'route':<36} {'status':>6} {'queries':>8} {'budget':>7}")
+            for method, template, body, budget in BUDGETS:
+                path = template.format(
+                    user_id=dataset.busy_owner_id,
+                    property_id=dataset.first_property_id,
+                )
+                route = f"{method} {template}"
+                try:
+                    with query_budget(budget) as stats:
+                        status = await call(method, path, body)
+                except QueryBudgetExceeded as e:
+                    passed = False
+                    print(f"{route:<36} {'':>6} {e.stats.count:>8} {budget:>7}  FAIL")
+                    print(e)
+                    continue
+                print(f"{route:<36} {status:>6} {stats.count:>8} {budget:>7}")
+                if status >= 400:
+                    passed = False
+                    print(f"{route}: unexpected status {status}")
+        finally:
+            app.dependency_overrides.clear()
+            property_usecase.async_session = async_session
+            await outer.rollback()
+    await engine.dispose()
+    return passed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--properties", type=int, default=2_000)
+    args = parser.parse_args()
+    if not asyncio.run(run(args.users, args.properties)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
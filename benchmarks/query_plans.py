@@ -0,0 +1,304 @@
+"""
+Query-plan regression check for the repository layer.
+
+Seeds a synthetic dataset inside a transaction, runs every query issued by
+PropertyRepository and UserRepository (plus the Logstash sync query), records
+EXPLAIN (ANALYZE, BUFFERS) for each statement and fails when a statement
+falls back to a sequential scan on a table it is expected to reach through an
+index. The transaction is rolled back at the end.
+
+    python -m benchmarks.query_plans --out plans.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from app.config import BASE_DIR, DatabaseConfig
+from app.infrastructure.repositories.property_repo import PropertyRepository
+from app.infrastructure.repositories.user_repo import UserRepository
+from app.infrastructure.search.postgres_property_search_service import (
+    PostgresPropertySearchService,
+)
+from app.presentation.schemas.property_schema import (
+    PropertyBase,
+    PropertySearchParams,
+)
+from app.presentation.schemas.user_schema import UserCreate
+from benchmarks.dataset import Dataset, seed
+
+# Tables large enough that a sequential scan is a regression
+WATCHED_RELATIONS = {"properties", "users", "property_amenities"}
+
+LOGSTASH_SQL = os.path.join(
+    BASE_DIR, "logstash", "logstash_ingest_data", "properties_index.sql"
+)
+
+DML_PREFIXES = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+@dataclass
+class PlanCase:
+    name: str
+    run: Callable[[AsyncSession, Dataset], Awaitable[Any]]
+    # Relations a sequential scan is acceptable on (e.g. unbounded listings)
+    allow_seq_scan: frozenset[str] = frozenset()
+
+
+@dataclass
+class StatementPlan:
+    statement: str
+    plan: Any
+    seq_scans: list[str] = field(default_factory=list)
+
+
+def _sample_property(owner_id: int) -> PropertyBase:
+    return PropertyBase(
+        title="Plan check listing",
+        address="1 Plan Street",
+        city="Dhaka",
+        state="Dhaka",
+        zip_code="1207",
+        country="Bangladesh",
+        price=125000,
+        property_type="apartment",
+        amenities=["pool", "garage", "plan-check-amenity"],
+        posted_by=owner_id,
+    )
+
+
+def _sample_user() -> UserCreate:
+    return UserCreate(
+        email="plan_check@example.com",
+        username="plan_check",
+        first_name="Plan",
+        last_name="Check",
+        user_type="tenant",
+        password="PlanCheck1!",
+    )
+
+
+async def _logstash_sync(db: AsyncSession, dataset: Dataset):
+    with open(LOGSTASH_SQL) as f:
+        sql = f.read().replace(":sql_last_value", ":last_value").rstrip().rstrip(";")
+    # Logstash polls every 30 s and passes a naive timestamp
+    last_value = datetime.now() - timedelta(seconds=30)
+    return (await db.execute(text(sql), {"last_value": last_value})).all()
+
+
+CASES: list[PlanCase] = [
+    PlanCase(
+        "PropertyRepository.add_property",
+        lambda db, ds: PropertyRepository(db).add_property(
+            _sample_property(ds.busy_owner_id)
+        ),
+    ),
+    PlanCase(
+        "PropertyRepository.get_property_row",
+        lambda db, ds: PropertyRepository(db).get_property_row(ds.first_property_id),
+    ),
+    PlanCase(
+        "PropertyRepository.get_property_rows_by_user",
+        lambda db, ds: PropertyRepository(db).get_property_rows_by_user(
+            ds.busy_owner_id
+        ),
+    ),
+    PlanCase(
+        "PropertyRepository.get_owner_fingerprint",
+        lambda db, ds: PropertyRepository(db).get_owner_fingerprint(ds.busy_owner_id),
+    ),
+    PlanCase(
+        "PropertyRepository.archive_inactive",
+        lambda db, ds: PropertyRepository(db).archive_inactive(
+            datetime.now(timezone.utc), 1000
+        ),
+    ),
+    PlanCase(
+        "PropertyRepository.get_property_rows_by_user[include_archived]",
+        lambda db, ds: PropertyRepository(db).get_property_rows_by_user(
+            ds.busy_owner_id, include_archived=True
+        ),
+    ),
+    PlanCase(
+        "PropertyRepository.get_all_property_rows",
+        lambda db, ds: PropertyRepository(db).get_all_property_rows(),
+        allow_seq_scan=frozenset({"properties", "property_amenities"}),
+    ),
+    PlanCase(
+        "UserRepository.create_user",
+        lambda db, ds: UserRepository(db).create_user(_sample_user(), "x"),
+    ),
+    PlanCase(
+        "UserRepository.get_user_by_id",
+        lambda db, ds: UserRepository(db).get_user_by_id(ds.first_user_id),
+    ),
+    PlanCase(
+        "UserRepository.get_user_by_email",
+        lambda db, ds: UserRepository(db).get_user_by_email(ds.sample_email),
+    ),
+    PlanCase(
+        "UserRepository.get_user_by_username",
+        lambda db, ds: UserRepository(db).get_user_by_username(ds.sample_username),
+    ),
+    PlanCase(
+        "UserRepository.list_users_after",
+        lambda db, ds: UserRepository(db).list_users_after(ds.first_user_id + 100, 101),
+    ),
+    PlanCase(
+        "UserRepository.estimate_user_count",
+        lambda db, ds: UserRepository(db).estimate_user_count(),
+    ),
+    PlanCase(
+        "UserRepository.count_users",
+        lambda db, ds: UserRepository(db).count_users(),
+        # count(*) visits every row; the endpoint only runs it on small tables
+        allow_seq_scan=frozenset({"users"}),
+    ),
+    PlanCase("logstash.properties_index", _logstash_sync),
+    PlanCase(
+        "PostgresPropertySearchService.search[text]",
+        lambda db, ds: PostgresPropertySearchService(db).search(
+            PropertySearchParams(q="river")
+        ),
+    ),
+    PlanCase(
+        "PostgresPropertySearchService.search[city+price]",
+        lambda db, ds: PostgresPropertySearchService(db).search(
+            PropertySearchParams(
+                city=ds.sample_city,
+                status="available",
+                min_price=100000,
+                max_price=300000,
+                sort_by="price",
+            )
+        ),
+    ),
+]
+
+
+def _find_seq_scans(node: dict, found: list[str]) -> list[str]:
+    if node.get("Node Type") == "Seq Scan":
+        found.append(node.get("Relation Name", "?"))
+    for child in node.get("Plans", []):
+        _find_seq_scans(child, found)
+    return found
+
+
+async def _explain(
+    conn: AsyncConnection, statement: str, parameters: Any
+) -> StatementPlan:
+    # Writes were already executed by the repository call; re-running them
+    # under ANALYZE could trip unique constraints, so they get a plain plan.
+    is_read = statement.lstrip().upper().startswith(("SELECT", "WITH"))
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if is_read else "FORMAT JSON"
+    if isinstance(parameters, list):
+        parameters = parameters[0] if parameters else ()
+
+    savepoint = await conn.begin_nested()
+    try:
+        res = await conn.exec_driver_sql(
+            f"EXPLAIN ({options}) {statement}", parameters
+        )
+        plan = res.scalar_one()
+    finally:
+        await savepoint.rollback()
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return StatementPlan(
+        statement=statement,
+        plan=plan,
+        seq_scans=_find_seq_scans(plan[0]["Plan"], []),
+    )
+
+
+async def run(users: int, properties: int, out: str | None) -> int:
+    engine = create_async_engine(DatabaseConfig.get_url())
+    captured: list[tuple[str, Any]] = []
+    capturing = False
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if capturing and statement.lstrip().upper().startswith(DML_PREFIXES):
+            captured.append((statement, parameters))
+
+    report: dict[str, list[dict]] = {}
+    regressions: list[str] = []
+
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        try:
+            print(f"Seeding {users} users / {properties} properties ...")
+            dataset = await seed(conn, users=users, properties=properties)
+
+            for case in CASES:
+                session = AsyncSession(
+                    bind=conn,
+                    join_transaction_mode="create_savepoint",
+                    expire_on_commit=False,
+                )
+                captured.clear()
+                capturing = True
+                try:
+                    await case.run(session, dataset)
+                finally:
+                    capturing = False
+                    await session.close()
+
+                plans = [await _explain(conn, s, p) for s, p in captured]
+                report[case.name] = [
+                    {
+                        "statement": p.statement,
+                        "seq_scans": p.seq_scans,
+                        "plan": p.plan,
+                    }
+                    for p in plans
+                ]
+                bad = sorted(
+                    {
+                        rel
+                        for p in plans
+                        for rel in p.seq_scans
+                        if rel in WATCHED_RELATIONS
+                        and rel not in case.allow_seq_scan
+                    }
+                )
+                status = "SEQ SCAN on " + ", ".join(bad) if bad else "ok"
+                print(f"{case.name:<45} {len(plans):>2} stmt  {status}")
+                if bad:
+                    regressions.append(case.name)
+        finally:
+            await outer.rollback()
+
+    await engine.dispose()
+
+    if out:
+        with open(out, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"Plans written to {out}")
+
+    if regressions:
+        print(f"{len(regressions)} query plan regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--properties", type=int, default=50_000)
+    parser.add_argument("--out", help="write the full EXPLAIN output as JSON")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.users, args.properties, args.out)))
+
+
+if __name__ == "__main__":
+    main()
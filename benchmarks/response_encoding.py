@@ -0,0 +1,107 @@
+"""
+Response encoding cost: FastAPI's default JSONResponse path vs FastJSONResponse.
+
+The default path for a route with ``response_model`` is reproduced step by
+step: dump the returned models to dicts, validate them against the response
+model again, serialize to JSON-compatible Python, then stdlib ``json.dumps``.
+FastJSONResponse takes the already-validated models and renders bytes
+directly. No database or network needed.
+
+    python -m benchmarks.response_encoding --items 100 --runs 2000
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.presentation.responses import FastJSONResponse, orjson
+from app.presentation.schemas.property_schema import (
+    PropertyResponse,
+    PropertySearchResult,
+)
+
+
+def _items(n: int) -> list[PropertyResponse]:
+    now = datetime.now(timezone.utc)
+    return [
+        PropertyResponse(
+            id=i,
+            posted_by=1 + i % 50,
+            title=f"Beautiful Family Home #{i}",
+            description="A lovely 3-bedroom family home located in the suburbs. " * 3,
+            address=f"{i} Main St",
+            city="Springfield",
+            state="IL",
+            zip_code="62704",
+            country="USA",
+            price=250000.0 + i,
+            property_type="house",
+            status="available",
+            bedrooms=3,
+            bathrooms=2.5,
+            area_sqft=2000.0,
+            lot_size_sqft=5000.0,
+            parking_spaces=2,
+            heating_type="central",
+            cooling_type="central",
+            amenities=["pool", "garage", "garden"],
+            year_built=1995,
+            image_urls=[
+                f"http://example.com/{i}/image1.jpg",
+                f"http://example.com/{i}/image2.jpg",
+            ],
+            created_at=now,
+            updated_at=now,
+            is_featured=i % 10 == 0,
+        )
+        for i in range(n)
+    ]
+
+
+def default_path(adapter: TypeAdapter, content) -> bytes:
+    """What FastAPI does for a returned model with response_model set."""
+    if isinstance(content, list):
+        prepared = [item.model_dump(by_alias=True) for item in content]
+    else:
+        prepared = content.model_dump(by_alias=True)
+    value = adapter.validate_python(prepared)
+    jsonable = adapter.dump_python(value, mode="json")
+    return JSONResponse(jsonable).body
+
+
+def fast_path(content) -> bytes:
+    return FastJSONResponse(content).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=1000)
+    args = parser.parse_args()
+
+    items = _items(args.items)
+    payloads = {
+        "list[PropertyResponse]": (TypeAdapter(list[PropertyResponse]), items),
+        "PropertySearchResult": (
+            TypeAdapter(PropertySearchResult),
+            PropertySearchResult(items=items, total=5000, page=1, per_page=len(items)),
+        ),
+    }
+
+    print(f"orjson available: {orjson is not None}; {args.items} items per payload")
+    print(f"{'payload':<24} {'default µs':>12} {'fast µs':>10} {'speedup':>8}")
+    for name, (adapter, content) in payloads.items():
+        assert len(fast_path(content)) > 0
+        default = timeit.timeit(lambda: default_path(adapter, content), number=args.runs)
+        fast = timeit.timeit(lambda: fast_path(content), number=args.runs)
+        print(
+            f"{name:<24} {default / args.runs * 1e6:>12.1f} "
+            f"{fast / args.runs * 1e6:>10.1f} {default / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
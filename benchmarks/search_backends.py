@@ -0,0 +1,122 @@
+"""
+Elasticsearch vs Postgres full-text search on the same data.
+
+Runs a fixed set of representative searches against both backends and
+reports latency percentiles, hit totals and the overlap of the returned ids,
+so we know when the Postgres fallback is good enough to serve. Point it at a
+database that Logstash has already synced into the ES index.
+
+    python -m benchmarks.search_backends --runs 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.config import DatabaseConfig
+from app.infrastructure.data.models.property_model import Property
+from app.infrastructure.search.elastic_client import _get_client
+from app.infrastructure.search.postgres_property_search_service import (
+    PostgresPropertySearchService,
+)
+from app.infrastructure.search.property_search_service import PropertySearchService
+from app.presentation.schemas.property_schema import PropertySearchParams
+
+
+async def _sample_values(db: AsyncSession) -> dict:
+    city = (
+        await db.execute(
+            select(Property.city)
+            .group_by(Property.city)
+            .order_by(func.count().desc())
+            .limit(1)
+        )
+    ).scalar_one_or_none()
+    word = (
+        await db.execute(select(Property.title).order_by(Property.id.desc()).limit(1))
+    ).scalar_one_or_none()
+    return {
+        "city": city or "Dhaka",
+        "word": (word or "home").split()[0],
+    }
+
+
+def _queries(sample: dict) -> dict[str, PropertySearchParams]:
+    return {
+        "match_all": PropertySearchParams(),
+        "text": PropertySearchParams(q=sample["word"]),
+        "text_phrase": PropertySearchParams(q="spacious home near the park"),
+        "city_filter": PropertySearchParams(city=sample["city"], status="available"),
+        "city_price_range": PropertySearchParams(
+            city=sample["city"], min_price=100000, max_price=400000, sort_by="price"
+        ),
+        "location_fuzzy": PropertySearchParams(location=sample["city"][:-1]),
+        "text_and_filters": PropertySearchParams(
+            q="bedroom", min_bedrooms=2, max_price=500000, per_page=50
+        ),
+        "deep_page": PropertySearchParams(page=20, per_page=50),
+    }
+
+
+async def _time(service, params: PropertySearchParams, runs: int):
+    timings = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = await service.search(params)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, result
+
+
+def _pct(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def run(runs: int) -> None:
+    engine = create_async_engine(DatabaseConfig.get_url())
+    es = _get_client()
+    async with AsyncSession(engine) as db:
+        sample = await _sample_values(db)
+        es_service = PropertySearchService(es)
+        pg_service = PostgresPropertySearchService(db)
+
+        print(
+            f"{'query':<18} {'backend':<8} {'p50 ms':>8} {'p95 ms':>8} "
+            f"{'total':>8} {'overlap':>8}"
+        )
+        for name, params in _queries(sample).items():
+            es_times, es_result = await _time(es_service, params, runs)
+            pg_times, pg_result = await _time(pg_service, params, runs)
+
+            es_ids = {item.id for item in es_result.items}
+            pg_ids = {item.id for item in pg_result.items}
+            overlap = len(es_ids & pg_ids) / len(es_ids) if es_ids else 1.0
+
+            for backend, times, result in (
+                ("es", es_times, es_result),
+                ("pg", pg_times, pg_result),
+            ):
+                print(
+                    f"{name:<18} {backend:<8} {statistics.median(times):>8.2f} "
+                    f"{_pct(times, 0.95):>8.2f} {result.total:>8} "
+                    f"{overlap if backend == 'pg' else 1.0:>8.0%}"
+                )
+
+    await es.close()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(run(args.runs))
+
+
+if __name__ == "__main__":
+    main()
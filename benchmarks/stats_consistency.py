@@ -0,0 +1,128 @@
+"""
+Consistency check of the maintained property_stats counters.
+
+Seeds a dataset, rebuilds the counters from both listing tiers, archives
+the sold/rented listings, then deletes the busiest owner through
+UserUsecase.delete_user. The counters must still equal a fresh aggregate of
+the remaining listings; exits 1 listing every group that drifted. Runs
+inside a transaction that is rolled back.
+
+Redis is optional: the session revocation that follows the committed
+delete is skipped with a warning if it is unreachable.
+
+    python -m benchmarks.stats_consistency --properties 5000
+"""
+
+import argparse
+import asyncio
+import math
+import sys
+from datetime import datetime, timedelta, timezone
+
+from redis.exceptions import RedisError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from app.application.usecases.user_usecase import UserUsecase
+from app.config import DatabaseConfig
+from app.infrastructure.repositories.property_repo import PropertyRepository
+from benchmarks.dataset import seed
+
+# Per (city, type, status) aggregate of both tiers, in property_stats' terms
+AGGREGATE = """
+    SELECT
+        city, property_type, status,
+        count(*) AS listing_count,
+        sum(price) AS price_sum,
+        coalesce(sum(price / area_sqft) FILTER (WHERE area_sqft > 0), 0)
+            AS price_per_sqft_sum,
+        count(*) FILTER (WHERE area_sqft > 0) AS area_count
+    FROM (
+        SELECT city, property_type, status, price, area_sqft FROM properties
+        UNION ALL
+        SELECT city, property_type, status, price, area_sqft
+        FROM properties_archive
+    ) AS listings
+    GROUP BY city, property_type, status
+"""
+
+COUNTERS = """
+    SELECT
+        city, property_type, status,
+        listing_count, price_sum, price_per_sqft_sum, area_count
+    FROM property_stats
+    WHERE listing_count <> 0
+"""
+
+
+async def rows_by_group(conn: AsyncConnection, query: str) -> dict[tuple, tuple]:
+    res = await conn.execute(text(query))
+    return {tuple(row[:3]): tuple(row[3:]) for row in res.all()}
+
+
+def drift(expected: dict, actual: dict) -> list[str]:
+    problems = []
+    for group in sorted(expected.keys() | actual.keys(), key=str):
+        want = expected.get(group, (0, 0.0, 0.0, 0))
+        got = actual.get(group, (0, 0.0, 0.0, 0))
+        if not all(
+            math.isclose(w, g, rel_tol=1e-9, abs_tol=1e-6) for w, g in zip(want, got)
+        ):
+            problems.append(f"  {group}: expected {want}, counters {got}")
+    return problems
+
+
+async def run(users: int, properties: int) -> bool:
+    engine = create_async_engine(DatabaseConfig.get_url())
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        try:
+            dataset = await seed(conn, users=users, properties=properties)
+            await conn.execute(text("DELETE FROM property_stats"))
+            await conn.execute(
+                text(
+                    "INSERT INTO property_stats (city, property_type, status, "
+                    "listing_count, price_sum, price_per_sqft_sum, area_count) "
+                    + AGGREGATE
+                )
+            )
+            async with AsyncSession(
+                bind=conn, join_transaction_mode="create_savepoint"
+            ) as db:
+                # Everything not available moves, so the owner has both tiers
+                moved = await PropertyRepository(db).archive_inactive(
+                    datetime.now(timezone.utc) + timedelta(days=1), properties
+                )
+                print(f"archived {len(moved)} listings")
+                try:
+                    await UserUsecase(db).delete_user(dataset.busy_owner_id)
+                except RedisError as e:
+                    print(f"session revocation skipped: {e}")
+            print(f"deleted user {dataset.busy_owner_id}")
+
+            problems = drift(
+                await rows_by_group(conn, AGGREGATE),
+                await rows_by_group(conn, COUNTERS),
+            )
+            if problems:
+                print("property_stats drifted from the listings:")
+                print("\n".join(problems))
+            else:
+                print("property_stats matches the listings")
+            return not problems
+        finally:
+            await outer.rollback()
+            await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--properties", type=int, default=5_000)
+    args = parser.parse_args()
+    if not asyncio.run(run(args.users, args.properties)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
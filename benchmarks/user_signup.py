@@ -0,0 +1,176 @@
+"""
+User signup: check-then-insert vs a single INSERT ... RETURNING.
+
+"legacy" is the old UserUsecase/UserRepository path reproduced inline:
+look up the email, look up the username, INSERT, then refresh. "returning"
+is UserRepository.create_user, which relies on the unique indexes. Both
+paths use a precomputed password hash, so bcrypt cost does not count.
+
+Two checks:
+  * latency and round trips per signup, run sequentially;
+  * concurrent signups of one email/username. Exactly one must succeed, and
+    every other attempt must fail with a domain error. A bare IntegrityError
+    would surface as a 500.
+
+Signups commit from separate connections, so this writes real rows. They use
+the @signup-bench.invalid domain and are deleted at the end.
+
+    python -m benchmarks.user_signup --signups 200 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.config import DatabaseConfig
+from app.domain.errors import EmailAlreadyExistsError, UsernameAlreadyExistsError
+from app.infrastructure.data.models.user_model import User, UserRole
+from app.infrastructure.repositories.user_repo import UserRepository
+from app.infrastructure.security.bcrypt_hasher import hash_password
+from app.presentation.schemas.user_schema import UserCreate
+
+EMAIL_DOMAIN = "signup-bench.invalid"
+
+
+async def legacy_signup(db: AsyncSession, user: UserCreate, hashed: str) -> User:
+    repo = UserRepository(db)
+    if await repo.get_user_by_email(user.email):
+        raise EmailAlreadyExistsError
+    if await repo.get_user_by_username(user.username):
+        raise UsernameAlreadyExistsError
+    db_user = User(
+        email=user.email,
+        username=user.username,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        phone=user.phone,
+        bio=user.bio,
+        avatar_url=user.avatar_url,
+        user_type=user.user_type,
+        role=UserRole.USER,
+        hashed_password=hashed,
+    )
+    try:
+        db.add(db_user)
+        await db.commit()
+        await db.refresh(db_user)
+        return db_user
+    except Exception:
+        await db.rollback()
+        raise
+
+
+async def returning_signup(db: AsyncSession, user: UserCreate, hashed: str) -> User:
+    return await UserRepository(db).create_user(user, hashed)
+
+
+PATHS = {"legacy": legacy_signup, "returning": returning_signup}
+
+
+def _user(tag: str) -> UserCreate:
+    return UserCreate(
+        email=f"{tag}@{EMAIL_DOMAIN}",
+        username=tag,
+        first_name="Signup",
+        last_name="Bench",
+        user_type="tenant",
+        password="SignupBench1!",
+    )
+
+
+def _pct(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def _latency(engine, path, signups: int, hashed: str, statements: list):
+    timings = []
+    statements.clear()
+    for _ in range(signups):
+        user = _user(f"lat_{uuid.uuid4().hex[:16]}")
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            start = time.perf_counter()
+            await path(db, user, hashed)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings, len(statements) / signups
+
+
+async def _race(engine, path, concurrency: int, hashed: str) -> Counter:
+    user = _user(f"race_{uuid.uuid4().hex[:16]}")
+    start = asyncio.Event()
+
+    async def attempt() -> str:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await start.wait()
+            try:
+                await path(db, user, hashed)
+                return "created"
+            except (EmailAlreadyExistsError, UsernameAlreadyExistsError) as e:
+                return type(e).__name__
+            except Exception as e:
+                return f"unhandled {type(e).__name__}"
+
+    tasks = [asyncio.create_task(attempt()) for _ in range(concurrency)]
+    await asyncio.sleep(0)
+    start.set()
+    return Counter(await asyncio.gather(*tasks))
+
+
+async def run(signups: int, concurrency: int) -> int:
+    engine = create_async_engine(
+        DatabaseConfig.get_url(), pool_size=concurrency, max_overflow=0
+    )
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    hashed = hash_password("SignupBench1!")
+    failures = 0
+    try:
+        print(f"{'path':<10} {'p50 ms':>8} {'p95 ms':>8} {'stmts':>6}")
+        for name, path in PATHS.items():
+            # Warm the pool and statement caches
+            await _latency(engine, path, 5, hashed, statements)
+            timings, per_signup = await _latency(
+                engine, path, signups, hashed, statements
+            )
+            print(
+                f"{name:<10} {statistics.median(timings):>8.2f} "
+                f"{_pct(timings, 0.95):>8.2f} {per_signup:>6.1f}"
+            )
+
+        print(f"\n{concurrency} concurrent signups of one email/username:")
+        for name, path in PATHS.items():
+            outcomes = await _race(engine, path, concurrency, hashed)
+            unhandled = sum(n for k, n in outcomes.items() if k.startswith("unhandled"))
+            ok = outcomes["created"] == 1 and not unhandled
+            print(f"  {name:<10} {dict(outcomes)}  {'ok' if ok else 'WRONG'}")
+            if name == "returning" and not ok:
+                failures += 1
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(delete(User).where(User.email.like(f"%@{EMAIL_DOMAIN}")))
+        await engine.dispose()
+
+    return 1 if failures else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--signups", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.signups, args.concurrency)))
+
+
+if __name__ == "__main__":
+    main()